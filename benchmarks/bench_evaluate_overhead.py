@@ -0,0 +1,103 @@
+# Java/Spring 관점에서의 설명:
+# 이 파일은 JMH(Java Microbenchmark Harness)로 작성한 간단한 마이크로 벤치마크와 비슷합니다.
+# 'evaluate' 한 번을 호출할 때 네트워크를 제외한 준비 비용(클라이언트 생성, 스키마 클래스 정의, 프롬프트 파일 읽기)이
+# 얼마나 드는지를 변경 전 방식과 변경 후 방식으로 나누어 측정합니다.
+#
+# 실행 방법 (프로젝트 루트에서):
+#     python -m benchmarks.bench_evaluate_overhead --calls 200
+#
+# 실제 Gemini API는 호출하지 않습니다. 'generate_content'를 고정 응답을 돌려주는 가짜 함수로 바꿔 치기 때문에,
+# 측정값에는 커넥션 재사용으로 절약되는 TCP/TLS 핸드셰이크 시간은 포함되지 않습니다. (실제 절약분은 이보다 큽니다.)
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("GEMINI_API_KEY", "benchmark-key")
+
+from google import genai  # noqa: E402
+from google.genai import models as genai_models  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+import gemini_client  # noqa: E402
+import utils  # noqa: E402
+
+FAKE_RESPONSE_TEXT = (
+    '{"score": 90, "positive_feedback": "Good", "points_for_improvement": []}'
+)
+
+
+class _FakeResponse:
+    text = FAKE_RESPONSE_TEXT
+
+
+def _fake_generate_content(self, *, model, contents, config=None):
+    return _FakeResponse()
+
+
+def legacy_evaluate(original_text, user_text):
+    """
+    변경 전 'evaluate'의 준비 과정을 그대로 재현한 함수입니다. (비교 기준용)
+    """
+    client = genai.Client()
+
+    class Recipe(BaseModel):
+        recipe_name: str
+        ingredients: list[str]
+
+    with open(gemini_client.EVALUATION_PROMPT.path, "r", encoding="utf-8") as f:
+        prompt_template = f.read()
+
+    prompt = prompt_template.format(original_text=original_text, user_text=user_text)
+    response = client.models.generate_content(
+        model="gemini-2.5-flash",
+        contents=prompt,
+        config={
+            "response_mime_type": "application/json",
+            "response_schema": list[Recipe],
+        },
+    )
+    return response.text
+
+
+def _measure(func, calls):
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        func("The quick brown fox.", "The quick brown fox.")
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _report(name, samples):
+    mean_us = statistics.mean(samples) * 1e6
+    p95_us = sorted(samples)[int(len(samples) * 0.95) - 1] * 1e6
+    print(f"{name:<8} mean={mean_us:10.1f} us   p95={p95_us:10.1f} us")
+    return mean_us
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="evaluate 호출당 준비 비용 벤치마크")
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    with patch.object(genai_models.Models, "generate_content", _fake_generate_content), \
+            patch("builtins.print"):
+        # 첫 호출(지연 초기화) 비용은 제외하고 정상 상태(steady state)만 측정합니다.
+        legacy_evaluate("warm", "up")
+        utils.evaluate("warm", "up")
+        before = _measure(legacy_evaluate, args.calls)
+        after = _measure(utils.evaluate, args.calls)
+
+    before_mean = _report("before", before)
+    after_mean = _report("after", after)
+    print(f"speedup  x{before_mean / after_mean:.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+# Java/Spring 관점에서의 설명:
+# 이 파일은 채점 단계(grading_cascade.py)의 기준값을 정할 때 참고할 시뮬레이션 벤치마크입니다.
+# 실제 Gemini 대신 FakeTier 두 개(저렴한 모델, 강한 모델)를 쓰며, 같은 받아쓰기 묶음을 여러 구성으로 채점해
+# 단계별 처리 비율, 넘긴 이유, 평균 응답 시간, 비용, 정확도(강한 모델 점수와의 차이)를 비교합니다.
+#
+# 가정:
+# - 강한 모델은 로컬 채점 점수를 '정답 점수'로 돌려줍니다.
+# - 저렴한 모델은 틀린 단어가 많을수록 점수 오차가 커지고 확신도가 낮아집니다.
+# - 비용은 요청 하나에 입력 400토큰, 출력 150토큰을 쓴다고 보고 MODEL_PRICES로 계산합니다.
+#
+# 실행 방법 (프로젝트 루트에서):
+#     python -m benchmarks.bench_grading_cascade
+#     python -m benchmarks.bench_grading_cascade --requests 500 --cheap-ms 20 --strong-ms 60
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_prompt_compaction import make_pairs  # noqa: E402
+from grading_cascade import FakeTier, GradingCascade, usage_cost  # noqa: E402
+from local_scorer import is_trivial, score_locally  # noqa: E402
+
+CHEAP_MODEL = "gemini-2.5-flash-lite"
+STRONG_MODEL = "gemini-2.5-flash"
+_USAGE = SimpleNamespace(prompt_token_count=400, candidates_token_count=150)
+
+# (이름, 단계 구성, min_confidence, borderline)
+CONFIGS = [
+    ("strong only", "strong", 0.0, (0, 0)),
+    ("cheap only", "cheap", 0.0, (0, 0)),
+    ("cascade conf>=0.5", "both", 0.5, (0, 0)),
+    ("cascade conf>=0.7", "both", 0.7, (0, 0)),
+    ("cascade conf>=0.7 + 50-80", "both", 0.7, (50, 80)),
+    ("cascade conf>=0.9 + 50-80", "both", 0.9, (50, 80)),
+]
+
+
+def make_workload(count, seed=0):
+    """
+    문장 길이와 실수 수가 섞인 (원본, 받아쓰기) 목록을 만듭니다. 일부는 대소문자/구두점만 다른 사소한 차이입니다.
+    """
+    rng = random.Random(seed)
+    pairs = []
+    for number in range(count):
+        original, user = make_pairs(rng.choice([8, 12, 20, 30]), 1, seed=number)[0]
+        if rng.random() < 0.2:
+            user = original.lower().rstrip(".")
+        elif rng.random() < 0.3:
+            # 실수가 많은 받아쓰기 (절반의 단어를 빠뜨림)
+            words = user.split()
+            user = " ".join(words[::2])
+        pairs.append((original, user))
+    return pairs
+
+
+def make_tiers(cheap_seconds, strong_seconds, seed=0):
+    rng = random.Random(seed)
+
+    def cheap(original_text, user_text):
+        local = score_locally(original_text, user_text)
+        errors = local["word_errors"]
+        noise = rng.gauss(0, 3 + 4 * errors)
+        return {
+            "score": max(0, min(100, round(local["score"] + noise))),
+            "positive_feedback": "Nice try.",
+            "points_for_improvement": local["points_for_improvement"],
+            "confidence": max(0.0, min(1.0, 0.98 - 0.08 * errors + rng.gauss(0, 0.05))),
+        }
+
+    def strong(original_text, user_text):
+        local = score_locally(original_text, user_text)
+        return {
+            "score": local["score"],
+            "positive_feedback": "Good listening.",
+            "points_for_improvement": local["points_for_improvement"],
+        }
+
+    return (
+        FakeTier(CHEAP_MODEL, cheap, cheap_seconds, usage_cost(CHEAP_MODEL, _USAGE)),
+        FakeTier(STRONG_MODEL, strong, strong_seconds, usage_cost(STRONG_MODEL, _USAGE)),
+    )
+
+
+def run(pairs, tiers, min_confidence, borderline):
+    cascade = GradingCascade(tiers, min_confidence=min_confidence, borderline=borderline)
+    latencies = []
+    errors = []
+    for original_text, user_text in pairs:
+        started = time.perf_counter()
+        local = score_locally(original_text, user_text)
+        if is_trivial(local):
+            cascade.record_local()
+            result = local
+        else:
+            result = cascade.grade(original_text, user_text)
+        latencies.append(time.perf_counter() - started)
+        errors.append(abs(result["score"] - local["score"]))
+    return cascade.stats(), latencies, errors
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="채점 단계 기준값 시뮬레이션")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--cheap-ms", type=float, default=15.0, help="저렴한 모델의 응답 시간 (축소한 값)")
+    parser.add_argument("--strong-ms", type=float, default=45.0, help="강한 모델의 응답 시간 (축소한 값)")
+    args = parser.parse_args(argv)
+
+    pairs = make_workload(args.requests)
+    print(
+        f"받아쓰기 {len(pairs)}개 · 응답 시간 {CHEAP_MODEL} {args.cheap_ms:.0f}ms / {STRONG_MODEL} {args.strong_ms:.0f}ms"
+    )
+    print(
+        f"{'config':<27} | {'local':>5} | {'cheap ok':>8} | {'escalated (reason)':<34} | "
+        f"{'mean':>7} | {'p95':>7} | {'cost/1k':>8} | {'|err|':>5}"
+    )
+    for name, layout, min_confidence, borderline in CONFIGS:
+        cheap, strong = make_tiers(args.cheap_ms / 1000, args.strong_ms / 1000)
+        tiers = {"strong": [strong], "cheap": [cheap], "both": [cheap, strong]}[layout]
+        stats, latencies, errors = run(pairs, tiers, min_confidence, borderline)
+        local = stats.get("local", {}).get("accepted", 0)
+        cheap_stats = stats.get(CHEAP_MODEL, {})
+        escalated = cheap_stats.get("escalated", {}) if layout == "both" else {}
+        cost = sum(tier["cost_usd"] for tier in stats.values())
+        latencies.sort()
+        print(
+            f"{name:<27} | {local:>5} | "
+            f"{cheap_stats.get('accepted', 0) if layout != 'strong' else '-':>8} | "
+            f"{', '.join(f'{reason} {count}' for reason, count in escalated.items()) or '-':<34} | "
+            f"{statistics.mean(latencies) * 1000:>5.1f}ms | {latencies[int(len(latencies) * 0.95) - 1] * 1000:>5.1f}ms | "
+            f"${cost / len(pairs) * 1000:>7.4f} | {statistics.mean(errors):>5.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
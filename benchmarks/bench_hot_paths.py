@@ -0,0 +1,271 @@
+# Java/Spring 관점에서의 설명:
+# 이 파일은 JMH 벤치마크 모음과 비슷합니다. 스크립트 처리와 채점의 '뜨거운 경로(hot path)'를 측정하고,
+# 저장해 둔 기준값(baseline)과 비교하여 성능이 나빠지면 실패(exit code 1)로 알려줍니다. CI에서 회귀 검사로 사용할 수 있습니다.
+#
+# 측정 대상:
+#   - clean_script / split_into_sentences / stream_sentences: 1KB ~ 50MB 합성 스크립트 (대괄호 잡음, 약어 포함)
+#   - extract_video_id_from_url: 여러 형식의 URL
+#   - evaluate의 요청 생성과 응답 파싱: Gemini 클라이언트를 가짜 객체로 바꿔 네트워크 없이 측정
+# 측정 항목: 처리량(MB/s 또는 ops/s), 할당된 메모리 블록 수, 최대 메모리 사용량(tracemalloc 기준)
+#
+# 실행 방법 (프로젝트 루트에서):
+#     python -m benchmarks.bench_hot_paths                 # 1KB ~ 1MB, 결과 출력
+#     python -m benchmarks.bench_hot_paths --full          # 10MB, 50MB까지 포함
+#     python -m benchmarks.bench_hot_paths --save-baseline # 현재 결과를 기준값으로 저장
+#     python -m benchmarks.bench_hot_paths --compare       # 기준값과 비교, 회귀가 있으면 exit code 1
+#
+# 기준값은 측정한 컴퓨터의 성능에 따라 달라지므로, 같은 환경(예: 같은 CI 러너)에서 저장하고 비교해야 합니다.
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("GEMINI_API_KEY", "benchmark-key")
+
+import utils  # noqa: E402
+from youtube_script_processor import (  # noqa: E402
+    clean_script,
+    split_into_sentences,
+    stream_sentences,
+)
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+QUICK_SIZES = {"1KB": 1024, "64KB": 64 * 1024, "1MB": 1024 * 1024}
+FULL_SIZES = dict(QUICK_SIZES, **{"10MB": 10 * 1024 * 1024, "50MB": 50 * 1024 * 1024})
+
+_WORDS = (
+    "the a we you they learn practice listen write English every day video "
+    "sentence teacher student really actually important because while after "
+    "language people think about going time good new first last long great"
+).split()
+_ABBREVIATIONS = ["Mr.", "Mrs.", "Dr.", "U.S.", "e.g.", "i.e.", "etc.", "vs."]
+_NOISE = ["[Music]", "[Applause]", "[Laughter]", "[inaudible]"]
+_ENDINGS = [".", ".", ".", "?", "!"]
+
+
+def make_snippets(target_bytes, seed=42):
+    """
+    재현 가능한 합성 자막 조각 목록을 만듭니다. (같은 seed면 항상 같은 결과)
+    약 4% 확률로 대괄호 잡음, 3% 확률로 약어, 가끔 줄바꿈이 섞입니다.
+    """
+    rng = random.Random(seed)
+    snippets = []
+    size = 0
+    start = 0.0
+    words_in_sentence = 0
+    while size < target_bytes:
+        parts = []
+        for _ in range(rng.randint(4, 9)):
+            roll = rng.random()
+            if roll < 0.04:
+                parts.append(rng.choice(_NOISE))
+                continue
+            if roll < 0.07:
+                parts.append(rng.choice(_ABBREVIATIONS))
+            else:
+                parts.append(rng.choice(_WORDS))
+            words_in_sentence += 1
+            if words_in_sentence >= rng.randint(6, 18):
+                parts[-1] += rng.choice(_ENDINGS)
+                words_in_sentence = 0
+        text = " ".join(parts)
+        if rng.random() < 0.1:
+            text = text.replace(" ", "\n", 1)
+        duration = round(rng.uniform(1.0, 4.0), 2)
+        snippets.append([text, start, duration])
+        start = round(start + duration, 2)
+        size += len(text) + 1
+    return snippets
+
+
+def make_urls(count=10_000, seed=7):
+    rng = random.Random(seed)
+    alphabet = "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_"
+    urls = []
+    for i in range(count):
+        video_id = "".join(rng.choice(alphabet) for _ in range(11))
+        form = i % 4
+        if form == 0:
+            urls.append(f"https://www.youtube.com/watch?v={video_id}")
+        elif form == 1:
+            urls.append(f"https://youtu.be/{video_id}")
+        elif form == 2:
+            urls.append(f"https://youtube.com/watch?v={video_id}&t=120s&list=PL123")
+        else:
+            urls.append(f"https://www.google.com/search?q={video_id}")
+    return urls
+
+
+class _StubResponse:
+    text = json.dumps(
+        {
+            "score": 85,
+            "positive_feedback": "Good job!",
+            "points_for_improvement": [
+                {"original": "went", "user_input": "want", "suggestion": "Use 'went'."}
+            ],
+        }
+    )
+
+
+class _StubModels:
+    def generate_content(self, **kwargs):
+        return _StubResponse()
+
+
+class _StubClient:
+    models = _StubModels()
+
+
+def measure(func, repeat):
+    """
+    함수를 'repeat'번 실행해 가장 빠른 시간(초)을 재고, 별도로 한 번 더 실행해 메모리 사용량을 잽니다.
+    allocations는 실행 후에도 남아 있는(결과 객체 포함) 새 메모리 블록 수입니다.
+    시간 측정과 메모리 측정을 분리하는 이유는 tracemalloc이 실행 속도를 크게 떨어뜨리기 때문입니다.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    allocations = sum(
+        stat.count_diff for stat in after.compare_to(before, "filename") if stat.count_diff > 0
+    )
+    return best, peak, allocations
+
+
+def run_benchmarks(sizes):
+    """
+    모든 벤치마크를 실행하고 {이름: {throughput, unit, peak_bytes, allocations}} 딕셔너리를 반환합니다.
+    """
+    results = {}
+
+    def record(name, seconds, work, unit, peak, allocations):
+        results[name] = {
+            "throughput": work / seconds if seconds else float("inf"),
+            "unit": unit,
+            "peak_bytes": peak,
+            "allocations": allocations,
+        }
+        print(
+            f"{name:<34} {results[name]['throughput']:>12.2f} {unit:<6}"
+            f" peak={peak / 1024 / 1024:>8.2f} MB  allocs={allocations}"
+        )
+
+    for label, target in sizes.items():
+        snippets = make_snippets(target)
+        script = " ".join(text for text, _, _ in snippets)
+        cleaned = clean_script(script)
+        megabytes = len(script.encode("utf-8")) / 1024 / 1024
+        repeat = 5 if target <= 1024 * 1024 else 1
+
+        seconds, peak, allocs = measure(lambda script=script: clean_script(script), repeat)
+        record(f"clean_script[{label}]", seconds, megabytes, "MB/s", peak, allocs)
+
+        seconds, peak, allocs = measure(lambda cleaned=cleaned: split_into_sentences(cleaned), repeat)
+        record(f"split_into_sentences[{label}]", seconds, megabytes, "MB/s", peak, allocs)
+
+        # stream_sentences는 문자열 합치기, 정리, 분리를 한 번에 하므로 앞의 두 단계를 합친 것과 비교합니다.
+        seconds, peak, allocs = measure(lambda snippets=snippets: list(stream_sentences(snippets)), repeat)
+        record(f"stream_sentences[{label}]", seconds, megabytes, "MB/s", peak, allocs)
+
+        # 큰 입력(최대 50MB)을 다음 크기를 측정하기 전에 해제합니다. 위의 람다는 기본 인자로 값을 묶었으므로 영향이 없습니다.
+        del snippets, script, cleaned
+
+    urls = make_urls()
+    seconds, peak, allocs = measure(
+        lambda: [utils.extract_video_id_from_url(url) for url in urls], 5
+    )
+    record("extract_video_id_from_url", seconds, len(urls), "ops/s", peak, allocs)
+
+    # 요청 생성(프롬프트 포맷팅, 설정 구성)과 응답 파싱만 측정합니다. 네트워크는 가짜 클라이언트로 대체합니다.
+    pairs = [
+        (f"I went to the store number {i} yesterday.", f"I want to the store number {i}.")
+        for i in range(2_000)
+    ]
+    with patch("utils.get_client", return_value=_StubClient()), patch("builtins.print"):
+        seconds, peak, allocs = measure(
+            lambda: [utils.request_grading(o, u) for o, u in pairs], 5
+        )
+    record("evaluate.request_and_parse", seconds, len(pairs), "ops/s", peak, allocs)
+
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """
+    기준값과 비교하여 회귀 목록을 반환합니다.
+    처리량이 'tolerance' 비율 이상 줄었거나, 최대 메모리 사용량이 'tolerance' 비율 이상 늘었으면 회귀로 봅니다.
+    """
+    regressions = []
+    for name, current in results.items():
+        reference = baseline.get(name)
+        if reference is None:
+            continue
+        if current["throughput"] < reference["throughput"] * (1 - tolerance):
+            regressions.append(
+                f"{name}: throughput {current['throughput']:.2f} < baseline {reference['throughput']:.2f} {current['unit']}"
+            )
+        if current["peak_bytes"] > reference["peak_bytes"] * (1 + tolerance):
+            regressions.append(
+                f"{name}: peak {current['peak_bytes']} B > baseline {reference['peak_bytes']} B"
+            )
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="스크립트 처리/채점 hot path 벤치마크")
+    parser.add_argument("--full", action="store_true", help="10MB, 50MB 스크립트까지 측정합니다.")
+    parser.add_argument("--save-baseline", action="store_true", help="결과를 기준값 파일에 저장합니다.")
+    parser.add_argument("--compare", action="store_true", help="기준값과 비교하고 회귀가 있으면 실패합니다.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용하는 성능 저하 비율 (기본 0.25)")
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(FULL_SIZES if args.full else QUICK_SIZES)
+
+    if args.save_baseline:
+        baseline = {}
+        if os.path.exists(args.baseline):
+            with open(args.baseline, "r", encoding="utf-8") as f:
+                baseline = json.load(f)
+        baseline.update(results)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline saved to {args.baseline}")
+
+    if args.compare:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print("\nREGRESSIONS:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("\nno regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
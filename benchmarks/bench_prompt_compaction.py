@@ -0,0 +1,116 @@
+# Java/Spring 관점에서의 설명:
+# 이 파일은 채점 프롬프트 줄이기(prompt_compaction.py)의 효과를 재는 벤치마크입니다.
+# 문장 길이별로 한두 단어만 틀린 받아쓰기를 만들어,
+# - 전체 문장을 보낼 때와 틀린 구간만 보낼 때의 프롬프트 크기(문자 수, 어림 토큰 수)와
+# - 가짜 Gemini 서버(프롬프트 토큰 수에 비례해 느려지도록 설정)에 실제로 요청했을 때의 응답 시간을 비교합니다.
+#
+# 실행 방법 (프로젝트 루트에서):
+#     python -m benchmarks.bench_prompt_compaction
+#     python -m benchmarks.bench_prompt_compaction --requests 50 --prompt-token-latency-ms 0.5
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_gemini_server import FakeGeminiConfig, start_fake_server  # noqa: E402
+
+_WORDS = (
+    "the people who work on these projects usually spend most of their time talking "
+    "about data models training results and what they learned from each small experiment "
+    "before they decide where to go next with the whole team"
+).split()
+_MISTAKES = {"their": "there", "learned": "learn", "whole": "hole", "talking": "taking", "results": "result"}
+
+
+def make_pairs(words, count, seed=0):
+    """
+    'words' 단어 길이의 (원본, 받아쓰기) 조합을 'count'개 만듭니다. 받아쓰기에는 한두 군데의 실수가 있습니다.
+    """
+    rng = random.Random(seed * 1000 + words)
+    pairs = []
+    for _ in range(count):
+        original = [rng.choice(_WORDS) for _ in range(words)]
+        user = list(original)
+        for position in rng.sample(range(words), rng.choice([1, 2])):
+            user[position] = _MISTAKES.get(user[position], user[position] + "s")
+        pairs.append((" ".join(original).capitalize() + ".", " ".join(user)))
+    return pairs
+
+
+def prompt_sizes(pairs, compaction_enabled):
+    import utils
+
+    sizes = []
+    compacted = 0
+    with patch("utils.compact", utils.compact if compaction_enabled else (lambda *args: None)):
+        for original_text, user_text in pairs:
+            request, compaction = utils._build_grading_request(original_text, user_text)
+            sizes.append(len(request["contents"]))
+            compacted += compaction is not None
+    return sizes, compacted
+
+
+def request_latencies(pairs, compaction_enabled):
+    import utils
+
+    latencies = []
+    with patch("utils.compact", utils.compact if compaction_enabled else (lambda *args: None)):
+        for original_text, user_text in pairs:
+            started = time.perf_counter()
+            utils.request_grading(original_text, user_text)
+            latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="채점 프롬프트 줄이기 벤치마크")
+    parser.add_argument("--lengths", default="10,20,30,45,60", help="쉼표로 구분한 문장 길이(단어 수)")
+    parser.add_argument("--requests", type=int, default=20, help="길이별 요청 수")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--prompt-token-latency-ms", type=float, default=0.5)
+    args = parser.parse_args(argv)
+
+    server, base_url = start_fake_server(
+        FakeGeminiConfig(
+            latency_ms=args.latency_ms,
+            jitter_ms=0,
+            prompt_token_latency_ms=args.prompt_token_latency_ms,
+        )
+    )
+    os.environ["GOOGLE_GEMINI_BASE_URL"] = base_url
+    os.environ.setdefault("GEMINI_API_KEY", "benchmark-key")
+
+    print(
+        f"가짜 서버: 기본 {args.latency_ms:.0f}ms + 프롬프트 토큰당 {args.prompt_token_latency_ms}ms, "
+        f"길이별 {args.requests}개 요청"
+    )
+    print(
+        f"{'words':>5} | {'compacted':>9} | {'full chars':>10} | {'compact chars':>13} | "
+        f"{'saved':>6} | {'~tokens full/compact':>20} | {'full p50':>8} | {'compact p50':>11}"
+    )
+    try:
+        for words in [int(value) for value in args.lengths.split(",")]:
+            pairs = make_pairs(words, args.requests)
+            full_sizes, _ = prompt_sizes(pairs, False)
+            compact_sizes, compacted = prompt_sizes(pairs, True)
+            full_latency = statistics.median(request_latencies(pairs, False))
+            compact_latency = statistics.median(request_latencies(pairs, True))
+            full_chars = statistics.mean(full_sizes)
+            compact_chars = statistics.mean(compact_sizes)
+            print(
+                f"{words:>5} | {compacted:>4}/{len(pairs):<4} | {full_chars:>10.0f} | {compact_chars:>13.0f} | "
+                f"{1 - compact_chars / full_chars:>6.0%} | {full_chars / 4:>9.0f} / {compact_chars / 4:<8.0f} | "
+                f"{full_latency * 1000:>6.0f}ms | {compact_latency * 1000:>9.0f}ms"
+            )
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+# Java/Spring 관점에서의 설명:
+# 이 파일은 문장 분리 엔진(segmenter.py)을 이전 방식과 비교하는 JMH 스타일 벤치마크입니다.
+# - split: 이전의 정규 표현식 한 줄('re.split(r"(?<=[.?!])\s+")') vs segmenter.split_text
+# - stream: 이전의 단어 단위 스트리밍 루프 vs segmenter.segment_transcript (약어/쉼/최대 단어 수 처리 포함)
+# 합성 자막(bench_hot_paths.make_snippets)은 약어('Mr.', 'U.S.' 등)와 대괄호 잡음을 포함합니다.
+#
+# 실행 방법 (프로젝트 루트에서):
+#     python -m benchmarks.bench_segmenter
+#     python -m benchmarks.bench_segmenter --full    # 10MB, 50MB까지 포함
+
+import argparse
+import gc
+import os
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_hot_paths import FULL_SIZES, QUICK_SIZES, make_snippets  # noqa: E402
+from segmenter import segment_transcript, split_text  # noqa: E402
+from youtube_script_processor import clean_script  # noqa: E402
+
+_LEGACY_BRACKET = re.compile(r"\[.*?\]")
+
+
+def legacy_split(script):
+    """이전 'split_into_sentences' 구현입니다."""
+    return [s.strip() for s in re.split(r"(?<=[.?!])\s+", script) if s.strip()]
+
+
+def legacy_stream(snippets):
+    """이전 'stream_sentences' 구현입니다. (약어와 문장 부호 없는 자막을 처리하지 않습니다.)"""
+    words = []
+    sentence_start = sentence_end = None
+    for text, start, duration in snippets:
+        end = start + duration
+        for word in _LEGACY_BRACKET.sub("", text).split():
+            if not words:
+                sentence_start = start
+            words.append(word)
+            sentence_end = end
+            if word.endswith((".", "?", "!")):
+                yield " ".join(words), sentence_start, sentence_end
+                words = []
+    if words:
+        yield " ".join(words), sentence_start, sentence_end
+
+
+def _elapsed(func):
+    gc.collect()
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="문장 분리: 이전 정규 표현식 vs segmenter")
+    parser.add_argument("--full", action="store_true", help="10MB, 50MB 크기도 측정합니다.")
+    args = parser.parse_args(argv)
+
+    sizes = FULL_SIZES if args.full else QUICK_SIZES
+    print(f"{'case':<28} {'legacy MB/s':>12} {'segmenter MB/s':>15} {'ratio':>7} {'sentences':>20}")
+    for label, target in sizes.items():
+        snippets = make_snippets(target)
+        cleaned = clean_script(" ".join(text for text, _, _ in snippets))
+        megabytes = len(cleaned.encode("utf-8")) / (1024 * 1024)
+        repeat = 9 if target <= 1024 * 1024 else 2
+
+        for case, legacy, current in (
+            ("split", lambda: legacy_split(cleaned), lambda: split_text(cleaned)),
+            ("stream", lambda: list(legacy_stream(snippets)), lambda: list(segment_transcript(snippets))),
+        ):
+            # 두 구현을 번갈아 측정하여, 측정 중에 컴퓨터 속도가 바뀌어도 양쪽에 똑같이 반영되게 합니다.
+            legacy_seconds = current_seconds = float("inf")
+            for _ in range(repeat):
+                legacy_seconds = min(legacy_seconds, _elapsed(legacy))
+                current_seconds = min(current_seconds, _elapsed(current))
+            counts = f"{len(legacy())} -> {len(current())}"
+            print(
+                f"{case + '[' + label + ']':<28} {megabytes / legacy_seconds:>12.1f} "
+                f"{megabytes / current_seconds:>15.1f} {legacy_seconds / current_seconds:>7.2f} {counts:>20}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+# Java/Spring 관점에서의 설명:
+# 이 파일은 문장 검색 색인(sentence_index.py)의 성능을 재는 벤치마크입니다.
+# 합성 자막(bench_hot_paths.make_snippets)으로 영상 N개짜리 코퍼스를 만들고,
+# - 영상 하나를 색인하는 시간(새 영상이 들어올 때마다 드는 비용)과
+# - "이 단어/구절들이 들어간 문장" 조회 시간을, 색인 없이 코퍼스 전체를 다시 읽어 찾는 방식과 비교합니다.
+# 합성 자막의 어휘는 40단어 정도라 모든 단어가 흔한 단어입니다. (색인에는 가장 불리한 경우입니다.)
+#
+# 실행 방법 (프로젝트 루트에서):
+#     python -m benchmarks.bench_sentence_index
+#     python -m benchmarks.bench_sentence_index --videos 500 --video-kb 40
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_hot_paths import make_snippets  # noqa: E402
+from corpus import SentenceCorpus  # noqa: E402
+from local_scorer import tokenize  # noqa: E402
+from sentence_index import SentenceIndex, _query_terms, _terms  # noqa: E402
+from youtube_script_processor import stream_sentences  # noqa: E402
+
+QUERIES = [
+    ["teacher"],
+    ["really", "important"],
+    ["learn english"],
+    ["first", "time", "going"],
+    ["the", "a", "we", "you", "they"],
+]
+
+
+def rescan_search(corpus, phrases, limit=20, match_all=True):
+    """
+    색인 없이 코퍼스의 모든 영상을 불러와 문장마다 검사하는 방식입니다. (비교 기준용)
+    """
+    queries = [set(_query_terms(phrase)) for phrase in phrases]
+    results = []
+    for video_id in corpus.video_ids():
+        for index, sentence in enumerate(corpus.get(video_id)):
+            terms = _terms(sentence.text)
+            count = sum(1 for query in queries if query <= terms)
+            if count >= (len(queries) if match_all else 1):
+                results.append((video_id, index, count))
+    results.sort(key=lambda item: (-item[2], item[0], item[1]))
+    return results[:limit]
+
+
+def timed(func, repeat):
+    durations = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        durations.append(time.perf_counter() - started)
+    return result, durations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="문장 검색 색인 벤치마크")
+    parser.add_argument("--videos", type=int, default=200, help="코퍼스의 영상 수")
+    parser.add_argument("--video-kb", type=int, default=20, help="영상 하나의 자막 크기(KB)")
+    parser.add_argument("--repeat", type=int, default=20, help="조회마다 반복 횟수")
+    args = parser.parse_args(argv)
+
+    directory = tempfile.mkdtemp(prefix="bench_index_")
+    corpus = SentenceCorpus(os.path.join(directory, "corpus.sqlite3"))
+    index = SentenceIndex(os.path.join(directory, "index.sqlite3"))
+
+    add_durations = []
+    sentences_total = 0
+    for number in range(args.videos):
+        video_id = f"video{number:06d}"
+        sentences = list(stream_sentences(make_snippets(args.video_kb * 1024, seed=number)))
+        sentences_total += len(sentences)
+        corpus.put(video_id, sentences)
+        started = time.perf_counter()
+        index.add_video(video_id, sentences)
+        add_durations.append(time.perf_counter() - started)
+    words_total = sum(
+        len(tokenize(sentence.text)) for video_id in corpus.video_ids()[:1] for sentence in corpus.get(video_id)
+    )
+    print(
+        f"코퍼스: 영상 {args.videos}개, 문장 {sentences_total}개 "
+        f"(영상당 약 {sentences_total // args.videos}문장, 첫 영상 {words_total}단어)"
+    )
+    print(
+        f"영상 하나 색인: 평균 {statistics.mean(add_durations) * 1000:.1f}ms, "
+        f"최대 {max(add_durations) * 1000:.1f}ms · 색인 파일 {os.path.getsize(index.path) / 1024 / 1024:.1f} MB"
+    )
+    print()
+    print(f"{'query':<32} | {'mode':<4} | {'matches':>7} | {'index p50':>9} | {'index p95':>9} | {'rescan p50':>10}")
+    for phrases in QUERIES:
+        for match_all in (True, False):
+            indexed, durations = timed(
+                lambda: index.search(phrases, limit=20, match_all=match_all), args.repeat
+            )
+            scanned, scan_durations = timed(
+                lambda: rescan_search(corpus, phrases, limit=20, match_all=match_all), max(1, args.repeat // 10)
+            )
+            assert indexed == scanned, (phrases, indexed[:3], scanned[:3])
+            durations.sort()
+            print(
+                f"{' + '.join(phrases):<32} | {'all' if match_all else 'any':<4} | {len(indexed):>7} | "
+                f"{statistics.median(durations) * 1000:>7.1f}ms | "
+                f"{durations[int(len(durations) * 0.95) - 1] * 1000:>7.1f}ms | "
+                f"{statistics.median(scan_durations) * 1000:>8.0f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
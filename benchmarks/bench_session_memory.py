@@ -0,0 +1,97 @@
+# Java/Spring 관점에서의 설명:
+# 이 파일은 세션 수에 따른 힙 사용량을 재는 메모리 벤치마크입니다. (JFR이나 힙 덤프로 HttpSession 크기를 비교하는 것과 비슷합니다.)
+# 같은 긴 영상을 N명이 동시에 연습할 때, 세션마다 문장 목록을 복사하던 이전 방식과
+# 공유 문장 저장소(sentence_store.py)를 사용하는 현재 방식의 메모리 사용량을 tracemalloc으로 비교합니다.
+#
+# 실행 방법 (프로젝트 루트에서):
+#     python -m benchmarks.bench_session_memory
+#     python -m benchmarks.bench_session_memory --sessions 500 --sentences 5000 --answered 20
+
+import argparse
+import gc
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.bench_hot_paths import make_snippets  # noqa: E402
+from sentence_store import SentenceStore  # noqa: E402
+from youtube_script_processor import Sentence, stream_sentences  # noqa: E402
+
+
+def _copy_sentences(rows):
+    # 이전 방식에서는 세션마다 st.cache_data(pickle로 복사본 반환) 또는 CORPUS.get으로 새 Sentence 리스트를 받았습니다.
+    # 'encode().decode()'로 문자열까지 새로 만들어, 역직렬화된 복사본과 같은 상태를 재현합니다.
+    return [Sentence(text.encode().decode(), start, end) for text, start, end in rows]
+
+
+def legacy_sessions(rows, sessions, answered):
+    """이전 방식: 세션마다 전체 문장 리스트 + 같은 길이의 user_inputs/scores 리스트를 보관합니다."""
+    states = []
+    for _ in range(sessions):
+        sentences = _copy_sentences(rows)
+        user_inputs = ["" for _ in sentences]
+        scores = [None for _ in sentences]
+        for i in range(answered):
+            user_inputs[i] = f"answer {i}"
+            scores[i] = {"score": 80}
+        states.append({"sentences": sentences, "user_inputs": user_inputs, "scores": scores})
+    return states
+
+
+def shared_sessions(rows, sessions, answered):
+    """현재 방식: 문장은 공유 저장소에 한 벌만 두고, 세션에는 영상 ID와 실제로 입력한 내용만 보관합니다."""
+    store = SentenceStore()
+    states = []
+    for _ in range(sessions):
+        video = store.get_or_load("video", lambda video_id: _copy_sentences(rows))
+        state = {
+            "video_id": "video",
+            "total_sentences": len(video),
+            "current_sentence_index": 0,
+            "user_inputs": {},
+            "scores": {},
+        }
+        for i in range(answered):
+            state["user_inputs"][i] = f"answer {i}"
+            state["scores"][i] = {"score": 80}
+        states.append(state)
+    return store, states
+
+
+def measure(build, *args):
+    """'build(*args)'가 만든 객체가 차지하는 메모리(바이트)를 반환합니다."""
+    gc.collect()
+    tracemalloc.start()
+    result = build(*args)
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="세션 수에 따른 문장 데이터 메모리 사용량 비교")
+    parser.add_argument("--sessions", type=int, default=200, help="동시에 같은 영상을 연습하는 세션 수")
+    parser.add_argument("--sentences", type=int, default=2000, help="영상의 대략적인 문장 수")
+    parser.add_argument("--answered", type=int, default=10, help="세션마다 입력/채점한 문장 수")
+    args = parser.parse_args(argv)
+
+    # 문장당 약 60바이트로 잡아 원하는 문장 수에 맞는 합성 자막을 만듭니다.
+    snippets = make_snippets(args.sentences * 60)
+    rows = [[s.text, s.start, s.end] for s in stream_sentences(snippets)]
+    print(f"video: {len(rows)} sentences, sessions: {args.sessions}, answered per session: {args.answered}\n")
+
+    legacy = measure(legacy_sessions, rows, args.sessions, args.answered)
+    shared = measure(shared_sessions, rows, args.sessions, args.answered)
+    print(f"{'model':<24} {'total MB':>10} {'KB/session':>12}")
+    for name, total in (("per-session copies", legacy), ("shared store", shared)):
+        print(f"{name:<24} {total / 1e6:>10.2f} {total / args.sessions / 1024:>12.1f}")
+    print(f"\nreduction: {legacy / shared:.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
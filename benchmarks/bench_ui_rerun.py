@@ -0,0 +1,104 @@
+# Java/Spring 관점에서의 설명:
+# 이 파일은 화면 상호작용 한 번에 서버가 쓰는 시간을 재는 벤치마크입니다. (MockMvc로 요청별 처리 시간을 재는 것과 비슷합니다.)
+# Streamlit의 AppTest로 앱을 띄우고, 받아쓰기 입력/'다음'/'이전'/'채점하기'를 여러 번 반복하면서 측정합니다.
+# YouTube 자막은 가짜 데이터로 바꾸고, 채점은 원문과 같은 입력을 넣어 로컬 채점으로 끝나므로 네트워크를 쓰지 않습니다.
+#
+# 측정 항목:
+#   - full rerun: 스크립트 전체를 다시 실행하는 시간입니다. (fragment를 쓰지 않던 이전 방식의 상호작용 비용)
+#   - fragment:   받아쓰기 영역 fragment만 다시 실행하는 시간입니다. (실제 Streamlit 서버에서의 상호작용 비용)
+#     AppTest는 fragment 안의 위젯을 눌러도 항상 스크립트 전체를 실행하므로,
+#     fragment 비용은 main.py가 기록하는 'ui_dictation_fragment' 지표(metrics.py)에서 따로 읽습니다.
+#
+# 실행 방법 (프로젝트 루트에서):
+#     python -m benchmarks.bench_ui_rerun
+#     python -m benchmarks.bench_ui_rerun --repeat 30 --sentences 500
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+# 벤치마크가 실제 캐시 파일을 건드리지 않도록 임시 디렉터리를 사용합니다.
+_TMP = tempfile.mkdtemp(prefix="bench_ui_")
+os.environ["CORPUS_PATH"] = os.path.join(_TMP, "corpus.sqlite3")
+os.environ["GRADING_CACHE_PATH"] = os.path.join(_TMP, "grading.sqlite3")
+os.environ["TRANSCRIPT_CACHE_PATH"] = os.path.join(_TMP, "transcripts.sqlite3")
+os.environ["PROGRESS_DB_PATH"] = os.path.join(_TMP, "progress.sqlite3")
+os.environ["SENTENCE_INDEX_PATH"] = os.path.join(_TMP, "sentence_index.sqlite3")
+os.environ.setdefault("GEMINI_API_KEY", "benchmark-key")
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+import youtube_script_processor  # noqa: E402
+from metrics import METRICS  # noqa: E402
+
+FRAGMENT_METRIC = "ui_dictation_fragment_seconds"
+
+
+def _fragment_total():
+    for row in METRICS.summary()[0]:
+        if row["metric"] == FRAGMENT_METRIC:
+            return row["mean"] * row["count"], row["count"]
+    return 0.0, 0
+
+
+def _button(at, label):
+    return next(button for button in at.button if button.label == label)
+
+
+def run(repeat, sentence_count):
+    snippets = [[f"Sentence number {i} is here.", i * 2.0, 2.0] for i in range(sentence_count)]
+    record = {"language_code": "en", "is_generated": False, "snippets": snippets}
+    timings = {}
+
+    def interact(name, action):
+        fragment_before, runs_before = _fragment_total()
+        started = time.perf_counter()
+        action().run()
+        elapsed = time.perf_counter() - started
+        if at.exception:
+            raise RuntimeError(f"{name}: {at.exception[0].value}")
+        fragment_after, runs_after = _fragment_total()
+        fragment = fragment_after - fragment_before if runs_after > runs_before else None
+        timings.setdefault(name, []).append((elapsed, fragment))
+
+    with patch.object(youtube_script_processor.TRANSCRIPT_CACHE, "get", return_value=record):
+        at = AppTest.from_file(os.path.join(PROJECT_ROOT, "main.py"), default_timeout=60)
+        at.run()
+        at.text_input[0].input("https://youtu.be/BENCHMARK01").run()
+        _button(at, "스크립트 가져오기").click().run()
+
+        for i in range(repeat):
+            # 첫 문장과 단어가 같은 입력만 번갈아 넣으므로, 채점은 항상 로컬에서 끝납니다.
+            typed = "Sentence number 0 is here." if i % 2 else "sentence number 0 is here"
+            interact("type", lambda: at.text_area[0].input(typed))
+            interact("grade", lambda: _button(at, "채점하기").click())
+            interact("next", lambda: _button(at, "다음").click())
+            interact("previous", lambda: _button(at, "이전").click())
+    return timings
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="상호작용별 서버 처리 시간 측정 (AppTest)")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--sentences", type=int, default=200)
+    args = parser.parse_args(argv)
+
+    timings = run(args.repeat, args.sentences)
+    print(f"{'interaction':<12} {'full rerun p50 ms':>18} {'fragment p50 ms':>16}")
+    for name, samples in timings.items():
+        full = statistics.median(elapsed for elapsed, _ in samples) * 1000
+        fragments = [fragment for _, fragment in samples if fragment is not None]
+        fragment = f"{statistics.median(fragments) * 1000:.1f}" if fragments else "-"
+        print(f"{name:<12} {full:>18.1f} {fragment:>16}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
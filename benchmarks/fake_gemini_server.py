@@ -0,0 +1,201 @@
+# Java/Spring 관점에서의 설명:
+# 이 파일은 WireMock이나 MockWebServer처럼 외부 API(Gemini)를 흉내 내는 로컬 HTTP 서버입니다.
+# 실제 API 키나 네트워크 없이, 지연 시간과 오류율을 마음대로 조절하면서 채점 파이프라인을 부하 테스트할 수 있습니다.
+#
+# 단독 실행 (프로젝트 루트에서):
+#     python -m benchmarks.fake_gemini_server --port 8765 --latency-ms 300 --error-rate 0.05
+# 'models/...:generateContent'(일반 응답)와 'models/...:streamGenerateContent?alt=sse'(스트리밍 응답)를 모두 흉내 냅니다.
+# 앱이 이 서버를 사용하게 하려면:
+#     GOOGLE_GEMINI_BASE_URL=http://127.0.0.1:8765/ GEMINI_API_KEY=fake streamlit run main.py
+
+import argparse
+import json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+DEFAULT_RESULT = {
+    "score": 85,
+    "positive_feedback": "Good listening! Most words are correct.",
+    "points_for_improvement": [
+        {"original": "went", "user_input": "want", "suggestion": "Use the past tense 'went'."}
+    ],
+}
+
+
+class FakeGeminiConfig:
+    """
+    가짜 서버의 동작을 정하는 설정값입니다. 서버가 떠 있는 동안에도 값을 바꿀 수 있습니다.
+
+    - latency_ms: 응답 하나의 평균 지연 시간
+    - jitter_ms: 지연 시간의 무작위 편차 (0 ~ jitter_ms 사이의 값이 더해집니다)
+    - error_rate: 요청이 503(일시적 장애) 또는 429(할당량 초과)로 실패할 확률
+    - response_text: 모델이 생성한 것처럼 돌려줄 텍스트 (기본값은 채점 결과 JSON)
+    - stream_chunks: 스트리밍 응답에서 텍스트를 나누어 보낼 조각 수
+    - stream_interval_ms: 스트리밍 응답의 조각 사이 간격 (첫 조각은 latency_ms 뒤에 보냅니다)
+    - prompt_token_latency_ms: 프롬프트 토큰 하나당 더해지는 지연 시간 (실제 모델이 입력을 읽는 시간을 흉내 냅니다)
+    """
+
+    def __init__(
+        self,
+        latency_ms=200.0,
+        jitter_ms=100.0,
+        error_rate=0.0,
+        response_text=None,
+        stream_chunks=8,
+        stream_interval_ms=50.0,
+        prompt_token_latency_ms=0.0,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.response_text = response_text or json.dumps(DEFAULT_RESULT)
+        self.stream_chunks = stream_chunks
+        self.stream_interval_ms = stream_interval_ms
+        self.prompt_token_latency_ms = prompt_token_latency_ms
+        self.request_count = 0
+        self.error_count = 0
+        self._lock = threading.Lock()
+
+    def count(self, failed):
+        with self._lock:
+            self.request_count += 1
+            if failed:
+                self.error_count += 1
+
+
+def _make_handler(config):
+    class FakeGeminiHandler(BaseHTTPRequestHandler):
+        # HTTP/1.1을 사용해야 클라이언트가 커넥션을 재사용(keep-alive)할 수 있습니다.
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format, *args):
+            # 요청마다 콘솔에 로그가 찍히면 측정에 방해가 되므로 끕니다.
+            pass
+
+        def _send_json(self, status, body):
+            payload = json.dumps(body).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _send_stream(self, prompt_tokens):
+            # Server-Sent Events 형식('data: <JSON>' + 빈 줄)으로 조각을 하나씩 보냅니다.
+            # 전체 길이를 미리 알 수 없으므로 chunked 전송 인코딩을 사용합니다.
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+
+            text = config.response_text
+            size = max(1, -(-len(text) // max(1, config.stream_chunks)))
+            pieces = [text[i:i + size] for i in range(0, len(text), size)]
+            for number, piece in enumerate(pieces):
+                if number:
+                    time.sleep(config.stream_interval_ms / 1000)
+                last = number == len(pieces) - 1
+                candidate = {"content": {"role": "model", "parts": [{"text": piece}]}, "index": 0}
+                if last:
+                    candidate["finishReason"] = "STOP"
+                event = {"candidates": [candidate], "modelVersion": "fake-gemini"}
+                if last:
+                    event["usageMetadata"] = {
+                        "promptTokenCount": prompt_tokens,
+                        "candidatesTokenCount": len(text) // 4,
+                        "totalTokenCount": prompt_tokens + len(text) // 4,
+                    }
+                payload = f"data: {json.dumps(event)}\r\n\r\n".encode("utf-8")
+                self.wfile.write(f"{len(payload):X}\r\n".encode("ascii") + payload + b"\r\n")
+                self.wfile.flush()
+            self.wfile.write(b"0\r\n\r\n")
+
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            request_body = self.rfile.read(length)
+            # 토큰 수는 실제 토크나이저 대신 '4글자 ≈ 1토큰'으로 어림합니다.
+            prompt_tokens = max(1, len(request_body) // 4)
+            latency_ms = config.latency_ms + random.uniform(0, config.jitter_ms)
+            time.sleep((latency_ms + prompt_tokens * config.prompt_token_latency_ms) / 1000)
+
+            if random.random() < config.error_rate:
+                config.count(failed=True)
+                status = random.choice([429, 503])
+                self._send_json(
+                    status,
+                    {"error": {"code": status, "message": "fake upstream error", "status": "UNAVAILABLE"}},
+                )
+                return
+
+            config.count(failed=False)
+            if ":streamGenerateContent" in self.path:
+                self._send_stream(prompt_tokens)
+                return
+            self._send_json(
+                200,
+                {
+                    "candidates": [
+                        {
+                            "content": {"role": "model", "parts": [{"text": config.response_text}]},
+                            "finishReason": "STOP",
+                            "index": 0,
+                        }
+                    ],
+                    "usageMetadata": {
+                        "promptTokenCount": prompt_tokens,
+                        "candidatesTokenCount": len(config.response_text) // 4,
+                        "totalTokenCount": prompt_tokens + len(config.response_text) // 4,
+                    },
+                    "modelVersion": "fake-gemini",
+                },
+            )
+
+    return FakeGeminiHandler
+
+
+def start_fake_server(config=None, host="127.0.0.1", port=0):
+    """
+    가짜 Gemini 서버를 백그라운드 스레드에서 시작하고 (server, base_url)을 반환합니다.
+    port=0이면 비어 있는 포트를 자동으로 고릅니다. 사용이 끝나면 'server.shutdown()'을 호출하세요.
+    """
+    config = config or FakeGeminiConfig()
+    server = ThreadingHTTPServer((host, port), _make_handler(config))
+    server.daemon_threads = True
+    server.config = config
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://{host}:{server.server_address[1]}/"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="로컬 가짜 Gemini 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--jitter-ms", type=float, default=100.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--stream-chunks", type=int, default=8)
+    parser.add_argument("--stream-interval-ms", type=float, default=50.0)
+    parser.add_argument("--prompt-token-latency-ms", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    config = FakeGeminiConfig(
+        args.latency_ms,
+        args.jitter_ms,
+        args.error_rate,
+        stream_chunks=args.stream_chunks,
+        stream_interval_ms=args.stream_interval_ms,
+        prompt_token_latency_ms=args.prompt_token_latency_ms,
+    )
+    server = ThreadingHTTPServer((args.host, args.port), _make_handler(config))
+    print(f"fake Gemini server listening on http://{args.host}:{args.port}/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
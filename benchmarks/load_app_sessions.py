@@ -0,0 +1,286 @@
+# Java/Spring 관점에서의 설명:
+# 이 파일은 Gatling으로 '동시 사용자 N명' 시나리오를 돌리는 것처럼, main.py 워커 하나에 여러 학습자를 동시에 붙여 보는 부하 테스트입니다.
+# Streamlit의 AppTest로 브라우저 없이 앱을 실행하고, 사용자마다 스레드 하나가
+#   첫 화면 -> 스크립트 가져오기 -> (받아쓰기 입력 -> 채점하기 -> 다음) x N
+# 순서로 상호작용합니다. YouTube는 지연 시간/오류율을 조절할 수 있는 가짜 함수로,
+# Gemini는 가짜 Gemini 서버(fake_gemini_server)로 바꾸므로 네트워크나 API 키가 필요 없습니다.
+#
+# 사용자 수를 늘려 가며 다음 값을 보고합니다.
+#   - throughput: 초당 처리한 상호작용 수
+#   - p50/p95/p99: 상호작용 한 번(서버가 스크립트를 한 번 실행하는 시간)의 지연 시간
+#   - errors: 예외가 나거나 스크립트를 가져오지 못한 상호작용의 비율
+#   - fallbacks: Gemini 오류나 시간 초과로 로컬 채점 결과를 대신 보여준 채점 수 (채점 서비스의 stats()["fallbacks"])
+#   - MB/session: 같은 수의 세션을 동시에 살려 둘 때 세션 하나가 붙잡고 있는 메모리
+#     tracemalloc은 실행을 느리게 하므로, 지연 시간을 잰 뒤 같은 시나리오를 한 번 더 실행하면서 따로 잽니다.
+#     AppTest가 보관하는 화면 요소 트리도 포함하므로 실제 서버의 세션보다 조금 큽니다.
+#
+# 실행 방법 (프로젝트 루트에서):
+#     python -m benchmarks.load_app_sessions
+#     python -m benchmarks.load_app_sessions --users 1,10,25,50 --steps 5 --gemini-latency-ms 800 --gemini-error-rate 0.1
+
+import argparse
+import gc
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+# 부하 테스트가 실제 캐시 파일을 건드리지 않도록 임시 디렉터리를 사용합니다.
+_TMP = tempfile.mkdtemp(prefix="load_app_")
+os.environ["CORPUS_PATH"] = os.path.join(_TMP, "corpus.sqlite3")
+os.environ["GRADING_CACHE_PATH"] = os.path.join(_TMP, "grading.sqlite3")
+os.environ["TRANSCRIPT_CACHE_PATH"] = os.path.join(_TMP, "transcripts.sqlite3")
+os.environ["PROGRESS_DB_PATH"] = os.path.join(_TMP, "progress.sqlite3")
+os.environ["SENTENCE_INDEX_PATH"] = os.path.join(_TMP, "sentence_index.sqlite3")
+os.environ.setdefault("GEMINI_API_KEY", "load-test-key")
+
+from benchmarks.fake_gemini_server import FakeGeminiConfig, start_fake_server  # noqa: E402
+from benchmarks.load_grading_service import percentile  # noqa: E402
+
+
+class FakeYouTube:
+    """
+    'fetch_transcript_record'를 대신하는 가짜 YouTube입니다. 영상마다 정해진 문장으로 된 자막을 돌려줍니다.
+    """
+
+    def __init__(self, latency_ms, jitter_ms, error_rate, sentences):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.sentences = sentences
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, video_id):
+        with self._lock:
+            self.calls += 1
+        time.sleep((self.latency_ms + random.uniform(0, self.jitter_ms)) / 1000)
+        if random.random() < self.error_rate:
+            raise ConnectionError("fake YouTube error")
+        return {
+            "language_code": "en",
+            "is_generated": False,
+            "snippets": [[sentence_text(video_id, i), i * 3.0, 3.0] for i in range(self.sentences)],
+        }
+
+
+def sentence_text(video_id, index):
+    return f"In video {video_id} the speaker said sentence number {index} about the weather."
+
+
+def dictation_of(video_id, index):
+    # 단어 몇 개를 틀리게 받아쓴 입력입니다. 로컬 채점으로 끝나지 않으므로 매번 (가짜) Gemini까지 요청이 갑니다.
+    return f"In video {video_id} the speaker sad sentence numbr {index} about the wether"
+
+
+@contextmanager
+def shared_streamlit_runtime():
+    """
+    여러 AppTest를 한 프로세스에서 동시에 실행할 수 있게, 실제 Streamlit 서버처럼 런타임과 스크립트 캐시를 하나씩만 둡니다.
+
+    - AppTest는 실행할 때마다 전역 'Runtime._instance'에 자기 가짜 런타임을 넣고, 끝나면 None으로 지웁니다.
+      다른 세션이 아직 실행 중이면 'Runtime hasn't been created!' 오류가 나므로, 공유 런타임 하나를 고정해 둡니다.
+    - AppTest는 실행할 때마다 main.py를 새로 컴파일하는데, 여러 스레드에서 동시에 컴파일하면 CPython 3.11의
+      ast.parse가 'AST constructor recursion depth mismatch' 오류를 냅니다. 서버처럼 컴파일 결과 하나를 공유합니다.
+    """
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.caching.storage.dummy_cache_storage import MemoryCacheStorageManager
+    from streamlit.runtime.dataframe_source_manager import DataframeSourceManager
+    from streamlit.runtime.media_file_manager import MediaFileManager
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = MediaFileManager(MemoryMediaFileStorage("/mock/media"))
+    runtime.dataframe_source_mgr = DataframeSourceManager()
+    runtime.cache_storage_manager = MemoryCacheStorageManager()
+    script_cache = ScriptCache()
+    Runtime._instance = runtime
+    try:
+        # AppTest가 바꾸는 'Runtime._instance'는 실제 Runtime 클래스가 아닌 빈 객체에 기록되게 합니다.
+        with patch("streamlit.testing.v1.app_test.Runtime", SimpleNamespace(_instance=None)), \
+                patch("streamlit.testing.v1.app_test.ScriptCache", return_value=script_cache), \
+                patch("streamlit.testing.v1.local_script_runner.ScriptCache", return_value=script_cache):
+            yield
+    finally:
+        Runtime._instance = None
+
+
+def _button(at, label):
+    return next(button for button in at.button if button.label == label)
+
+
+def run_user(user, steps, video_prefix, record):
+    """
+    학습자 한 명의 시나리오를 실행합니다. 상호작용마다 record(이름, 걸린 시간, 오류 메시지 또는 None)를 호출합니다.
+    스크립트를 가져오지 못하면 다른 영상으로 최대 세 번까지 다시 시도하고, 그 밖의 오류가 나면 시나리오를 멈춥니다.
+    끝난 뒤의 AppTest 객체를 반환합니다. (메모리 측정용)
+    """
+    from streamlit.testing.v1 import AppTest
+
+    def interact(name, action):
+        started = time.perf_counter()
+        try:
+            action().run()
+            error = at.exception[0].message if at.exception else None
+        except (IndexError, StopIteration) as e:
+            # 눌러야 할 위젯이 화면에 없으면 (직전 실행이 실패한 경우) 오류로 기록합니다.
+            error = f"widget not found: {e!r}"
+        record(name, time.perf_counter() - started, error)
+        return error is None
+
+    at = AppTest.from_file(os.path.join(PROJECT_ROOT, "main.py"), default_timeout=120)
+    if not interact("load", lambda: at):
+        return at
+
+    video_id = None
+    for attempt in range(3):
+        candidate = f"{video_prefix}u{user:04d}a{attempt}"
+        at.text_input[0].set_value(f"https://youtu.be/{candidate}")
+        started = time.perf_counter()
+        _button(at, "스크립트 가져오기").click().run()
+        if at.exception:
+            error = at.exception[0].message
+        elif not at.text_area:
+            error = "transcript fetch failed"
+        else:
+            error = None
+        record("fetch", time.perf_counter() - started, error)
+        if error is None:
+            video_id = candidate
+            break
+    if video_id is None:
+        return at
+
+    for index in range(steps):
+        if not (
+            interact("type", lambda: at.text_area[0].input(dictation_of(video_id, index)))
+            and interact("grade", lambda: _button(at, "채점하기").click())
+            and interact("next", lambda: _button(at, "다음").click())
+        ):
+            break
+    return at
+
+
+def _fallback_count():
+    # 화면은 utils.evaluate가 아니라 채점 서비스로 채점하므로, 서비스가 로컬 채점 결과로 대신한 횟수를 셉니다.
+    from grading_service import get_grading_service
+
+    return get_grading_service().stats()["fallbacks"]
+
+
+def run_scale(users, steps, video_prefix):
+    samples = []
+    lock = threading.Lock()
+
+    def record(name, seconds, error):
+        with lock:
+            samples.append((name, seconds, error))
+
+    fallbacks_before = _fallback_count()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        # 결과(AppTest)는 버리고, 예외가 있으면 여기서 드러나게 합니다.
+        for future in [pool.submit(run_user, user, steps, video_prefix, record) for user in range(users)]:
+            future.result()
+    elapsed = time.perf_counter() - started
+    return samples, elapsed, _fallback_count() - fallbacks_before
+
+
+def measure_session_memory(users, steps, video_prefix):
+    """
+    세션 'users'개를 동시에 실행해 살려 둔 채로, 세션 하나당 늘어난 메모리(MB)를 잽니다.
+    """
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    with ThreadPoolExecutor(max_workers=users) as pool:
+        sessions = list(pool.map(lambda user: run_user(user, steps, video_prefix, lambda *_: None), range(users)))
+    gc.collect()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del sessions
+    return (after - before) / users / (1024 * 1024)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="동시 학습자 수에 따른 main.py 부하 테스트 (AppTest)")
+    parser.add_argument("--users", default="1,5,10,20", help="쉼표로 구분한 동시 사용자 수 목록")
+    parser.add_argument("--steps", type=int, default=3, help="사용자마다 (입력 -> 채점 -> 다음)을 반복할 횟수")
+    parser.add_argument("--sentences", type=int, default=200, help="가짜 영상 하나의 문장 수")
+    parser.add_argument("--youtube-latency-ms", type=float, default=300.0)
+    parser.add_argument("--youtube-jitter-ms", type=float, default=200.0)
+    parser.add_argument("--youtube-error-rate", type=float, default=0.05)
+    parser.add_argument("--gemini-latency-ms", type=float, default=500.0)
+    parser.add_argument("--gemini-jitter-ms", type=float, default=300.0)
+    parser.add_argument("--gemini-error-rate", type=float, default=0.05)
+    parser.add_argument("--skip-memory", action="store_true", help="사용자 수별 세션 메모리 측정을 생략합니다")
+    args = parser.parse_args(argv)
+
+    server, base_url = start_fake_server(
+        FakeGeminiConfig(args.gemini_latency_ms, args.gemini_jitter_ms, args.gemini_error_rate)
+    )
+    # 앱 코드가 가짜 서버를 바라보도록 환경 변수를 설정한 뒤 공유 클라이언트를 다시 만들게 합니다.
+    os.environ["GOOGLE_GEMINI_BASE_URL"] = base_url
+    import youtube_script_processor
+    from gemini_client import reset_client
+
+    reset_client()
+    youtube = FakeYouTube(
+        args.youtube_latency_ms, args.youtube_jitter_ms, args.youtube_error_rate, args.sentences
+    )
+
+    print(
+        f"{'users':>5} {'interactions':>12} {'wall s':>7} {'req/s':>6} {'p50 ms':>7} {'p95 ms':>7} "
+        f"{'p99 ms':>7} {'errors':>7} {'fallbacks':>9} {'MB/session':>10}"
+    )
+    by_interaction = {}
+    with patch.object(youtube_script_processor, "fetch_transcript_record", youtube), shared_streamlit_runtime():
+        for users in (int(value) for value in args.users.split(",")):
+            samples, elapsed, fallbacks = run_scale(users, args.steps, f"n{users:03d}")
+            latencies = sorted(seconds for _, seconds, _ in samples)
+            errors = Counter(error for _, _, error in samples if error is not None)
+            memory = (
+                "-" if args.skip_memory
+                else f"{measure_session_memory(users, args.steps, f'm{users:03d}'):.2f}"
+            )
+            print(
+                f"{users:>5} {len(samples):>12} {elapsed:>7.1f} {len(samples) / elapsed:>6.1f} "
+                f"{percentile(latencies, 0.50) * 1000:>7.0f} {percentile(latencies, 0.95) * 1000:>7.0f} "
+                f"{percentile(latencies, 0.99) * 1000:>7.0f} {sum(errors.values()) / len(samples):>7.1%} "
+                f"{fallbacks:>9} {memory:>10}",
+                flush=True,
+            )
+            for message, count in errors.most_common(3):
+                print(f"      {count} x {message[:100]}")
+            # 사용자 수가 가장 많을 때 상호작용 종류별로 어디가 느린지도 보여줍니다.
+            by_interaction = {}
+            for name, seconds, _ in samples:
+                by_interaction.setdefault(name, []).append(seconds)
+    server.shutdown()
+
+    print("\nper interaction at the largest user count (p50 / p95 ms):")
+    for name, values in by_interaction.items():
+        values.sort()
+        print(
+            f"  {name:<6} n={len(values):<5} {statistics.median(values) * 1000:>7.0f} / "
+            f"{percentile(values, 0.95) * 1000:.0f}"
+        )
+    print(f"upstream calls: YouTube {youtube.calls}, Gemini {server.config.request_count} (errors {server.config.error_count})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+# Java/Spring 관점에서의 설명:
+# 이 파일은 Gatling/JMeter로 하는 부하 테스트를 파이썬 스크립트 하나로 축소한 것입니다.
+# 가짜 Gemini 서버(fake_gemini_server)를 띄우고, 채점 서비스(GradingService)에 많은 요청을 한꺼번에 보내
+# 처리량(throughput)과 지연 시간 분포(p50/p95/p99)를 측정합니다. 네트워크나 API 키가 필요 없습니다.
+#
+# 실행 방법 (프로젝트 루트에서):
+#     python -m benchmarks.load_grading_service --requests 200 --latency-ms 300 --error-rate 0.1
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.fake_gemini_server import FakeGeminiConfig, start_fake_server  # noqa: E402
+
+
+def percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="채점 서비스 부하 테스트 (가짜 Gemini 서버 사용)")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency-ms", type=float, default=300.0)
+    parser.add_argument("--jitter-ms", type=float, default=200.0)
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=50.0, help="초당 최대 요청 수")
+    parser.add_argument("--burst", type=int, default=20)
+    parser.add_argument("--deadline", type=float, default=10.0)
+    args = parser.parse_args(argv)
+
+    server, base_url = start_fake_server(
+        FakeGeminiConfig(args.latency_ms, args.jitter_ms, args.error_rate)
+    )
+    # 앱 코드가 가짜 서버를 바라보도록 환경 변수를 설정한 뒤 모듈을 import합니다.
+    os.environ["GOOGLE_GEMINI_BASE_URL"] = base_url
+    os.environ.setdefault("GEMINI_API_KEY", "load-test-key")
+
+    import utils
+    from disk_cache import DiskCache
+    from gemini_client import reset_client
+    from grading_cache import GradingCache
+    from grading_service import GradingService
+
+    reset_client()
+    workdir = tempfile.mkdtemp(prefix="grading-load-")
+    # 모든 요청이 실제로 (가짜) 서버까지 가도록 빈 캐시를 사용합니다.
+    utils.GRADING_CACHE = GradingCache(
+        DiskCache(os.path.join(workdir, "grading.sqlite3"), ttl_seconds=None, max_bytes=None)
+    )
+    service = GradingService(
+        max_in_flight=args.max_in_flight,
+        rate_per_second=args.rate,
+        burst=args.burst,
+        deadline_seconds=args.deadline,
+        base_backoff_seconds=0.05,
+    )
+
+    latencies = []
+    with patch("builtins.print"):
+        started = time.perf_counter()
+        futures = []
+        for i in range(args.requests):
+            submitted = time.perf_counter()
+            future = service.submit(f"Learner number {i} went home early.", f"Learner number {i} want home early.")
+            future.add_done_callback(
+                lambda _f, t=submitted: latencies.append(time.perf_counter() - t)
+            )
+            futures.append(future)
+        results = [f.result() for f in futures]
+        elapsed = time.perf_counter() - started
+    server.shutdown()
+
+    latencies.sort()
+    stats = service.stats()
+    fallbacks = sum(1 for r in results if r.get("fallback_reason"))
+    print(f"requests        {args.requests}")
+    print(f"wall time       {elapsed:.2f} s")
+    print(f"throughput      {args.requests / elapsed:.1f} req/s")
+    print(
+        "latency         "
+        f"p50={percentile(latencies, 0.50) * 1000:.0f} ms  "
+        f"p95={percentile(latencies, 0.95) * 1000:.0f} ms  "
+        f"p99={percentile(latencies, 0.99) * 1000:.0f} ms"
+    )
+    print(f"upstream calls  {server.config.request_count} (errors {server.config.error_count})")
+    print(f"retries         {stats['retries']}")
+    print(f"timeouts        {stats['timeouts']}")
+    print(f"fallbacks       {fallbacks}")
+    print(f"max in flight   {stats['max_in_flight_seen']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# Java/Spring 관점에서의 설명:
+# 이 파일은 Spring Boot의 'ApplicationStartup'(BufferingApplicationStartup)이나 '-verbose:class'처럼
+# 앱이 시작될 때 어떤 모듈을 불러오는 데 시간이 얼마나 걸리는지 보여줍니다.
+# 새 Python 프로세스에서 'python -X importtime -c "import main"'을 실행하고, 그 출력을 모듈별로 정리합니다.
+#
+# 실행 방법 (프로젝트 루트에서):
+#     python -m benchmarks.profile_startup            # import 시간 상위 20개 모듈
+#     python -m benchmarks.profile_startup --top 40
+#     python -m benchmarks.profile_startup --render   # 첫 화면 렌더링 시간(AppTest)까지 측정
+#     python -m benchmarks.profile_startup --budget-ms 600   # 전체 import 시간이 예산을 넘으면 exit code 1
+
+import argparse
+import os
+import subprocess
+import sys
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 처음 화면 렌더링 시간을 재는 코드입니다. 별도 프로세스에서 실행해야 import 캐시의 영향을 받지 않습니다.
+_RENDER_SNIPPET = """
+import time
+started = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file({main_path!r}, default_timeout=60)
+at.run()
+print(f"RENDER_SECONDS={{time.perf_counter() - started:.4f}}")
+"""
+
+
+def parse_importtime(stderr):
+    """
+    '-X importtime' 출력을 (모듈 이름, 자체 시간(us), 누적 시간(us), 들여쓰기 깊이) 리스트로 바꿉니다.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        # 형식: "import time:      1577 |     321292 |   streamlit"
+        self_us, cumulative_us, name = line.split(":", 1)[1].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+
+def profile_imports(module="main"):
+    """
+    새 프로세스에서 모듈을 import하고, import 시간 정보를 반환합니다.
+    """
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return parse_importtime(completed.stderr)
+
+
+def measure_first_render():
+    completed = subprocess.run(
+        [sys.executable, "-c", _RENDER_SNIPPET.format(main_path=os.path.join(PROJECT_ROOT, "main.py"))],
+        cwd=PROJECT_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in completed.stdout.splitlines():
+        if line.startswith("RENDER_SECONDS="):
+            return float(line.split("=", 1)[1])
+    raise RuntimeError("렌더링 시간을 측정하지 못했습니다:\n" + completed.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="앱 시작 시 모듈별 import 시간 측정")
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--top", type=int, default=20)
+    parser.add_argument("--render", action="store_true", help="AppTest로 첫 화면 렌더링 시간도 측정합니다.")
+    parser.add_argument("--budget-ms", type=float, default=None, help="전체 import 시간 예산(ms)")
+    args = parser.parse_args(argv)
+
+    rows = profile_imports(args.module)
+    total_us = next(cumulative for name, _, cumulative, _ in rows if name == args.module)
+
+    # 최상위 패키지 기준으로 자체 시간을 합산합니다. (예: 'google.genai.types' -> 'google')
+    by_package = {}
+    for name, self_us, _, _ in rows:
+        package = name.split(".")[0]
+        by_package[package] = by_package.get(package, 0) + self_us
+
+    print(f"total import time of '{args.module}': {total_us / 1000:.1f} ms\n")
+    print(f"{'package':<32} {'self ms':>10}")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[: args.top]:
+        print(f"{package:<32} {self_us / 1000:>10.1f}")
+
+    # 프로젝트 모듈의 누적 시간입니다. 프로젝트 코드가 불러오는 라이브러리 비용까지 포함됩니다.
+    project_modules = {
+        os.path.splitext(f)[0] for f in os.listdir(PROJECT_ROOT) if f.endswith(".py")
+    }
+    print(f"\n{'project module':<32} {'cumulative ms':>14}")
+    for name, _, cumulative_us, _ in rows:
+        if name in project_modules:
+            print(f"{name:<32} {cumulative_us / 1000:>14.1f}")
+
+    if args.render:
+        print(f"\nfirst render (AppTest, incl. imports): {measure_first_render() * 1000:.0f} ms")
+
+    if args.budget_ms is not None and total_us / 1000 > args.budget_ms:
+        print(f"\nimport time {total_us / 1000:.1f} ms exceeds budget {args.budget_ms:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+# Java/Spring 관점에서의 설명:
+# 이 'corpus.py' 파일은 미리 처리해 둔 문장 데이터를 저장하는 Repository(DAO) 계층과 같습니다.
+# 일괄 처리 CLI(ingest.py)가 여러 영상을 미리 문장 단위로 나누어 여기에 저장해 두면,
+# 웹 앱은 YouTube 호출이나 문장 분리 없이 곧바로 문장 목록을 불러올 수 있습니다.
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+from youtube_script_processor import Sentence
+
+
+class SentenceCorpus:
+    """
+    영상별 문장 목록을 SQLite 파일 하나에 압축하여 저장합니다.
+    각 영상의 문장은 [텍스트, 시작 시간, 끝 시간] 리스트를 JSON으로 만든 뒤 zlib으로 압축한 한 덩어리(BLOB)입니다.
+    영상 하나를 불러올 때 행 하나만 읽으면 되므로 매우 빠릅니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS videos (
+                    video_id TEXT PRIMARY KEY,
+                    sentence_count INTEGER NOT NULL,
+                    sentences BLOB NOT NULL,
+                    ingested_at REAL NOT NULL
+                )
+                """
+            )
+            self._local.conn = conn
+        return conn
+
+    def put(self, video_id, sentences):
+        """
+        영상 하나의 문장 목록(Sentence 또는 [텍스트, 시작, 끝])을 저장합니다. 이미 있으면 덮어씁니다.
+        """
+        rows = [
+            [s.text, s.start, s.end] if isinstance(s, Sentence) else list(s)
+            for s in sentences
+        ]
+        blob = zlib.compress(json.dumps(rows, ensure_ascii=False).encode("utf-8"))
+        self._connect().execute(
+            "INSERT OR REPLACE INTO videos (video_id, sentence_count, sentences, ingested_at) "
+            "VALUES (?, ?, ?, ?)",
+            (video_id, len(rows), blob, time.time()),
+        )
+
+    def get(self, video_id):
+        """
+        저장된 문장 목록을 Sentence 리스트로 반환합니다. 없으면 None을 반환합니다.
+        """
+        row = self._connect().execute(
+            "SELECT sentences FROM videos WHERE video_id = ?", (video_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        rows = json.loads(zlib.decompress(row[0]).decode("utf-8"))
+        return [Sentence(text, start, end) for text, start, end in rows]
+
+    def video_ids(self):
+        return [
+            video_id
+            for (video_id,) in self._connect().execute(
+                "SELECT video_id FROM videos ORDER BY video_id"
+            )
+        ]
+
+
+# 웹 앱과 CLI가 기본으로 사용하는 코퍼스입니다. CORPUS_PATH 환경 변수로 위치를 바꿀 수 있습니다.
+CORPUS = SentenceCorpus(os.environ.get("CORPUS_PATH", ".cache/corpus.sqlite3"))
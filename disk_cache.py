@@ -0,0 +1,179 @@
+# Java/Spring 관점에서의 설명:
+# 이 'disk_cache.py' 파일은 Spring의 CacheManager 구현체(e.g., Ehcache의 디스크 저장소, Caffeine + 파일 백업)와 유사한 역할을 합니다.
+# '@st.cache_data'는 프로세스 메모리에만 저장되므로, Streamlit 워커가 재시작되거나 여러 프로세스가 떠 있으면 캐시를 공유할 수 없습니다.
+# 이 모듈은 SQLite 파일 하나를 모든 프로세스가 함께 사용하는 디스크 캐시로 만들어 그 문제를 해결합니다.
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+
+class DiskCache:
+    """
+    SQLite 기반의 프로세스 간 공유 캐시입니다.
+
+    - 값은 JSON으로 직렬화한 뒤 zlib으로 압축하여 저장합니다.
+    - TTL(유효 시간)이 지난 항목은 조회 시 만료 처리됩니다.
+    - 전체 저장 용량(압축 후 바이트)이 'max_bytes'를 넘으면 가장 오래 사용되지 않은 항목부터 제거합니다(LRU).
+    - 적중(hit)/미스(miss)/제거(eviction) 횟수는 DB에 함께 기록되어 모든 프로세스가 같은 통계를 봅니다.
+
+    Java/Spring 관점:
+    - Spring Cache의 'Cache' 인터페이스(get/put/evict)를 직접 구현한 클래스라고 생각하면 됩니다.
+    - 'threading.local()'은 Java의 'ThreadLocal'과 같으며, 스레드마다 별도의 DB 커넥션을 사용하게 합니다.
+    """
+
+    def __init__(self, path, ttl_seconds, max_bytes):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._local = threading.local()
+        self._init_lock = threading.Lock()
+        self._initialized = False
+
+    def _connect(self):
+        # 스레드마다 커넥션을 하나씩 만들어 재사용합니다. (sqlite3 커넥션은 스레드 간 공유가 안전하지 않습니다.)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            # WAL 모드는 읽기와 쓰기가 서로를 막지 않도록 해 여러 프로세스가 동시에 사용할 때 유리합니다.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        if not self._initialized:
+            with self._init_lock:
+                if not self._initialized:
+                    self._create_tables(conn)
+                    self._initialized = True
+        return conn
+
+    @staticmethod
+    def _create_tables(conn):
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS entries (
+                key TEXT PRIMARY KEY,
+                value BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                created_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+            """
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries (accessed_at)"
+        )
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)"
+        )
+
+    @staticmethod
+    def _bump(conn, name, amount=1):
+        conn.execute(
+            "INSERT INTO stats (name, value) VALUES (?, ?) "
+            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+            (name, amount),
+        )
+
+    def get(self, key, record_stats=True):
+        """
+        캐시에서 값을 꺼냅니다. 없거나 만료되었으면 None을 반환합니다.
+        'record_stats=False'로 부르면 적중/미스 횟수에 세지 않습니다. (이미 센 조회를 잠금 안에서 다시 확인할 때 사용합니다.)
+        """
+        conn = self._connect()
+        now = time.time()
+        row = conn.execute(
+            "SELECT value, created_at FROM entries WHERE key = ?", (key,)
+        ).fetchone()
+
+        if row is None:
+            if record_stats:
+                self._bump(conn, "misses")
+            return None
+
+        value, created_at = row
+        if self.ttl_seconds is not None and now - created_at > self.ttl_seconds:
+            # TTL이 지난 항목은 지우고 미스로 처리합니다.
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            self._bump(conn, "expirations")
+            if record_stats:
+                self._bump(conn, "misses")
+            return None
+
+        conn.execute("UPDATE entries SET accessed_at = ? WHERE key = ?", (now, key))
+        if record_stats:
+            self._bump(conn, "hits")
+        return json.loads(zlib.decompress(value).decode("utf-8"))
+
+    def set(self, key, value):
+        """
+        값을 캐시에 저장하고, 용량 제한을 넘으면 LRU 순서로 오래된 항목을 제거합니다.
+        """
+        blob = zlib.compress(
+            json.dumps(value, ensure_ascii=False).encode("utf-8")
+        )
+        if self.max_bytes is not None and len(blob) > self.max_bytes:
+            # 한 항목이 전체 용량보다 크면 저장하지 않습니다. (다른 항목을 모두 밀어내는 것을 막기 위함)
+            return
+
+        conn = self._connect()
+        now = time.time()
+        # 'BEGIN IMMEDIATE'는 쓰기 잠금을 먼저 잡아, 다른 프로세스와 동시에 용량 계산을 하다 꼬이는 것을 막습니다.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, blob, len(blob), now, now),
+            )
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+    def _evict(self, conn):
+        if self.max_bytes is None:
+            return
+        (total,) = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()
+        if total <= self.max_bytes:
+            return
+
+        evicted = 0
+        # 가장 오래 전에 사용된 항목부터 순회하며 용량 제한 아래로 내려갈 때까지 삭제합니다.
+        for key, size in conn.execute(
+            "SELECT key, size FROM entries ORDER BY accessed_at ASC"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        if evicted:
+            self._bump(conn, "evictions", evicted)
+
+    def delete(self, key):
+        conn = self._connect()
+        conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def stats(self):
+        """
+        캐시 통계(hits, misses, evictions, expirations, entries, bytes)를 딕셔너리로 반환합니다.
+        """
+        conn = self._connect()
+        result = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        for name, value in conn.execute("SELECT name, value FROM stats"):
+            result[name] = value
+        entries, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+        ).fetchone()
+        result["entries"] = entries
+        result["bytes"] = total
+        lookups = result["hits"] + result["misses"]
+        result["hit_rate"] = result["hits"] / lookups if lookups else 0.0
+        return result
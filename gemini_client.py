@@ -0,0 +1,110 @@
+# Java/Spring 관점에서의 설명:
+# 이 'gemini_client.py' 파일은 Spring에서 '@Bean'으로 등록된 싱글톤 객체(예: RestTemplate, WebClient)를 관리하는 설정 클래스와 유사합니다.
+# 이전에는 채점할 때마다 'genai.Client()'를 새로 만들고 프롬프트 파일을 다시 읽었지만,
+# 이제는 프로세스 전체에서 클라이언트 하나와 프롬프트 템플릿 하나를 공유합니다.
+
+import hashlib
+import os
+import threading
+
+# 채점에 사용하는 Gemini 모델 이름입니다.
+GEMINI_MODEL = "gemini-2.5-flash"
+
+# Gemini 요청 하나의 최대 대기 시간(밀리초)입니다. 시간이 초과되면 예외가 발생하고, evaluate는 로컬 채점 결과로 대체합니다.
+GEMINI_TIMEOUT_MS = int(os.environ.get("GEMINI_TIMEOUT_MS", 30_000))
+
+# 프로젝트 루트 기준의 프롬프트 디렉터리입니다. 실행 위치(CWD)와 관계없이 같은 파일을 찾도록 절대 경로로 만듭니다.
+PROMPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prompts")
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """
+    프로세스 전체에서 공유하는 Gemini 클라이언트를 반환합니다.
+
+    클라이언트는 내부에 HTTP 커넥션 풀을 가지고 있으므로, 한 번 만든 객체를 재사용하면
+    채점할 때마다 새 연결(TCP/TLS 핸드셰이크)을 맺는 비용이 사라집니다.
+
+    Java/Spring 관점:
+    - 스레드 안전한 지연 초기화 싱글톤(double-checked locking)입니다.
+    - 'threading.Lock'은 Java의 'synchronized' 블록이나 'ReentrantLock'과 같은 역할을 합니다.
+    """
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                # google-genai는 import 비용이 큰 라이브러리이므로, 클라이언트를 처음 만들 때 import합니다.
+                from google import genai
+                from google.genai import types
+
+                # API 키는 환경 변수에서 자동으로 로드됩니다. Spring의 @Value("${gemini.api.key}")와 유사한 방식입니다.
+                _client = genai.Client(
+                    http_options=types.HttpOptions(timeout=GEMINI_TIMEOUT_MS)
+                )
+    return _client
+
+
+def reset_client():
+    """
+    공유 클라이언트를 버립니다. 다음 'get_client()' 호출 때 새로 만들어집니다. (주로 테스트에서 사용)
+    """
+    global _client
+    with _client_lock:
+        _client = None
+
+
+class PromptTemplate:
+    """
+    파일에서 읽어온 프롬프트 템플릿을 메모리에 보관합니다.
+    파일의 수정 시각(mtime)이 바뀐 경우에만 다시 읽으므로, 프롬프트를 고치면 재시작 없이 바로 반영됩니다.
+
+    Java/Spring 관점:
+    - Spring의 'ReloadableResourceBundleMessageSource'처럼, 변경 여부를 확인해 필요할 때만 리소스를 다시 읽습니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._text = None
+        self._version = None
+
+    def get(self):
+        """
+        템플릿 문자열을 반환합니다. 파일이 바뀌었으면 다시 읽습니다.
+        """
+        # 'stat'은 파일 내용을 읽지 않고 메타데이터만 조회하므로 매우 저렴합니다.
+        mtime = os.stat(self.path).st_mtime_ns
+        if mtime != self._mtime:
+            with self._lock:
+                if mtime != self._mtime:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        text = f.read()
+                    self._text = text
+                    self._version = hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+                    self._mtime = mtime
+        return self._text
+
+    @property
+    def version(self):
+        """
+        템플릿 내용의 해시값입니다. 템플릿이 바뀌면 값도 바뀝니다.
+        """
+        self.get()
+        return self._version
+
+
+# 채점용 프롬프트 템플릿입니다. 모듈이 처음 import될 때 한 번만 만들어집니다.
+EVALUATION_PROMPT = PromptTemplate(os.path.join(PROMPTS_DIR, "evaluation_prompt.md"))
+
+# 여러 문장을 한 번의 요청으로 채점할 때 사용하는 프롬프트 템플릿입니다.
+BATCH_EVALUATION_PROMPT = PromptTemplate(
+    os.path.join(PROMPTS_DIR, "batch_evaluation_prompt.md")
+)
+
+# 긴 문장에서 틀린 부분만 골라 보낼 때 사용하는 프롬프트 템플릿입니다. (prompt_compaction.py)
+COMPACT_EVALUATION_PROMPT = PromptTemplate(
+    os.path.join(PROMPTS_DIR, "compact_evaluation_prompt.md")
+)
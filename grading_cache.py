@@ -0,0 +1,143 @@
+# Java/Spring 관점에서의 설명:
+# 이 'grading_cache.py' 파일은 Spring Cache의 2단계 캐시(예: 로컬 Caffeine + 원격/디스크 캐시) 구성과 유사합니다.
+# 같은 영상을 보는 여러 학습자가 같은 문장을 똑같이 받아쓰는 경우가 많기 때문에,
+# (원본, 받아쓰기, 프롬프트 버전, 모델 이름)이 같으면 Gemini를 다시 부르지 않고 이전 채점 결과를 재사용합니다.
+
+import hashlib
+import os
+import threading
+import unicodedata
+from collections import OrderedDict
+
+from disk_cache import DiskCache
+
+# 둥근 따옴표를 일반 따옴표로 통일하기 위한 변환 테이블입니다. (키보드/IME에 따라 입력되는 문자가 달라지므로)
+_QUOTE_TABLE = str.maketrans({"’": "'", "‘": "'", "“": '"', "”": '"'})
+
+
+def normalize_text(text):
+    """
+    캐시 키를 만들기 위해 문장을 정규화합니다.
+    유니코드 정규화(NFC), 따옴표 통일, 공백 정리만 수행합니다.
+    대소문자와 구두점은 채점 기준(문법/구두점)에 영향을 주므로 그대로 둡니다.
+    """
+    text = unicodedata.normalize("NFC", text).translate(_QUOTE_TABLE)
+    return " ".join(text.split())
+
+
+def grading_cache_key(original_text, user_text, template_version, model):
+    """
+    채점 결과 캐시의 키(SHA-256 해시)를 만듭니다.
+    프롬프트 템플릿의 버전이 키에 포함되므로, 템플릿을 수정하면 이전 결과는 자동으로 사용되지 않습니다.
+    """
+    # 구분자로 '\x1f'(Unit Separator)를 사용해, 필드 경계가 다른 두 입력이 같은 문자열이 되는 것을 막습니다.
+    material = "\x1f".join(
+        [
+            normalize_text(original_text),
+            normalize_text(user_text),
+            template_version,
+            model,
+        ]
+    )
+    return "grading:" + hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class GradingCache:
+    """
+    메모리 LRU(1단계)와 디스크 캐시(2단계)로 이루어진 채점 결과 캐시입니다.
+
+    - 메모리 단계는 같은 프로세스 안에서 가장 빠르게 응답합니다.
+    - 디스크 단계는 모든 워커 프로세스가 공유하며, 재시작 후에도 유지됩니다.
+    - 적중률과 함께, 적중으로 아낀 API 호출 수와 예상 대기 시간을 통계로 제공합니다.
+
+    Java/Spring 관점:
+    - 'OrderedDict'의 'move_to_end()'로 LRU를 구현하는 것은 Java의 'LinkedHashMap(accessOrder=true)'와 같은 방식입니다.
+    """
+
+    def __init__(self, disk_cache, memory_size=1024):
+        self.disk_cache = disk_cache
+        self.memory_size = memory_size
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._api_calls = 0
+        self._api_seconds = 0.0
+
+    def get(self, key):
+        """
+        캐시된 채점 결과를 반환합니다. 없으면 None을 반환합니다.
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._memory_hits += 1
+                return self._memory[key]
+
+        value = self.disk_cache.get(key)
+        with self._lock:
+            if value is None:
+                self._misses += 1
+                return None
+            self._disk_hits += 1
+            self._remember(key, value)
+        return value
+
+    def set(self, key, value):
+        """
+        채점 결과를 두 단계 모두에 저장합니다.
+        """
+        with self._lock:
+            self._remember(key, value)
+        self.disk_cache.set(key, value)
+
+    def _remember(self, key, value):
+        # 호출하는 쪽에서 lock을 잡고 있어야 합니다.
+        self._memory[key] = value
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def record_api_call(self, seconds):
+        """
+        캐시 미스로 실제 Gemini를 호출한 시간을 기록합니다. 절약한 시간을 추정하는 데 사용합니다.
+        """
+        with self._lock:
+            self._api_calls += 1
+            self._api_seconds += seconds
+
+    def stats(self):
+        """
+        적중률, 단계별 적중 횟수, 절약한 API 호출 수와 예상 절약 시간(초)을 딕셔너리로 반환합니다.
+        """
+        with self._lock:
+            hits = self._memory_hits + self._disk_hits
+            lookups = hits + self._misses
+            average_api_seconds = (
+                self._api_seconds / self._api_calls if self._api_calls else 0.0
+            )
+            return {
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "saved_api_calls": hits,
+                "estimated_saved_seconds": hits * average_api_seconds,
+                "memory_entries": len(self._memory),
+            }
+
+
+# 채점 결과 캐시 설정은 환경 변수로 바꿀 수 있습니다.
+# - GRADING_CACHE_PATH: 디스크 캐시 SQLite 파일 경로
+# - GRADING_CACHE_TTL_SECONDS: 디스크 캐시 유효 시간 (기본 30일)
+# - GRADING_CACHE_MAX_BYTES: 디스크 캐시 용량 상한 (기본 64MB)
+# - GRADING_CACHE_MEMORY_SIZE: 메모리 단계에 보관할 최대 항목 수
+GRADING_CACHE = GradingCache(
+    DiskCache(
+        path=os.environ.get("GRADING_CACHE_PATH", ".cache/grading.sqlite3"),
+        ttl_seconds=float(os.environ.get("GRADING_CACHE_TTL_SECONDS", 30 * 24 * 60 * 60)),
+        max_bytes=int(os.environ.get("GRADING_CACHE_MAX_BYTES", 64 * 1024 * 1024)),
+    ),
+    memory_size=int(os.environ.get("GRADING_CACHE_MEMORY_SIZE", 1024)),
+)
@@ -0,0 +1,285 @@
+# Java/Spring 관점에서의 설명:
+# 이 'grading_cascade.py' 파일은 채점 요청을 여러 단계(tier)의 모델에 차례로 맡기는 책임 연쇄(Chain of Responsibility)입니다.
+# 모든 받아쓰기를 같은 모델로 채점하지 않고, 쉬운 것은 싸고 빠른 단계에서 끝내고 어려운 것만 강한 모델로 보냅니다.
+#
+#   1) 로컬 채점: 대소문자/구두점만 다른 사소한 차이 (utils.prepare_grading이 처리하고 여기에 기록합니다)
+#   2) 저렴한 모델: 결과와 함께 스스로 평가한 확신도(confidence)를 받습니다.
+#   3) 강한 모델: 앞 단계의 결과가 스키마에 맞지 않거나, 확신도가 낮거나, 점수가 애매한 구간이면 다시 채점합니다.
+#
+# 단계마다 처리한 요청 수, 넘긴(escalate) 이유, 응답 시간, 비용을 기록하므로 기준값을 조정할 때 근거로 쓸 수 있습니다.
+# 단계는 'grade(원본, 받아쓰기, with_confidence)' 메소드를 가진 객체이며(전략 패턴), FakeTier로 바꾸면 네트워크 없이 시험할 수 있습니다.
+
+import asyncio
+import json
+import os
+import threading
+import time
+
+from gemini_client import GEMINI_MODEL
+from metrics import METRICS, LATENCY_BUCKETS
+
+# 모델별 100만 토큰당 가격(USD)입니다. (입력, 출력) 공개 가격표 기준이며, 가격이 바뀌면 여기를 고칩니다.
+# 표에 없는 모델은 비용을 0으로 기록합니다.
+MODEL_PRICES = {
+    "gemini-2.5-flash-lite": (0.10, 0.40),
+    "gemini-2.5-flash": (0.30, 2.50),
+    "gemini-2.5-pro": (1.25, 10.00),
+}
+
+# 단계를 넘기는 이유입니다. 지표의 'outcome' 라벨과 stats()의 키로 사용합니다.
+ACCEPTED = "accepted"
+INVALID = "invalid"
+LOW_CONFIDENCE = "low_confidence"
+BORDERLINE = "borderline"
+ERROR = "error"
+
+
+def usage_cost(model, usage):
+    """
+    응답의 usage_metadata(토큰 수)로 요청 하나의 비용(USD)을 계산합니다.
+    """
+    input_price, output_price = MODEL_PRICES.get(model, (0.0, 0.0))
+    cost = 0.0
+    for field, price in (("prompt_token_count", input_price), ("candidates_token_count", output_price)):
+        # 토큰 수가 응답에 없으면(가짜 서버, 일부 오류 응답) 그 부분의 비용은 0으로 봅니다.
+        count = getattr(usage, field, None)
+        if isinstance(count, int):
+            cost += count * price / 1_000_000
+    return cost
+
+
+class GeminiTier:
+    """
+    Gemini 모델 하나로 채점하는 단계입니다. (utils.request_model_grading을 사용합니다.)
+    """
+
+    def __init__(self, model):
+        self.name = model
+        self.model = model
+
+    def grade(self, original_text, user_text, with_confidence=False):
+        """(채점 결과, 비용) 튜플을 반환합니다. 실패하면 예외가 그대로 전달됩니다."""
+        # utils가 이 모듈을 import하므로, 순환 import를 피하려고 호출할 때 import합니다.
+        import utils
+
+        result, usage = utils.request_model_grading(
+            original_text, user_text, model=self.model, with_confidence=with_confidence
+        )
+        return result, usage_cost(self.model, usage)
+
+    async def grade_async(self, original_text, user_text, with_confidence=False):
+        import utils
+
+        result, usage = await utils.request_model_grading_async(
+            original_text, user_text, model=self.model, with_confidence=with_confidence
+        )
+        return result, usage_cost(self.model, usage)
+
+
+class FakeTier:
+    """
+    네트워크 없이 동작하는 가짜 단계입니다. 테스트와 벤치마크에서 GeminiTier 대신 사용합니다.
+
+    - respond: 채점 결과 딕셔너리, 또는 (원본, 받아쓰기)를 받아 결과를 반환하는 함수. 예외를 던지면 실패한 요청이 됩니다.
+    - latency_seconds: 응답 전에 기다릴 시간
+    - cost: 요청 하나의 비용(USD)
+    """
+
+    def __init__(self, name, respond, latency_seconds=0.0, cost=0.0):
+        self.name = name
+        self.respond = respond
+        self.latency_seconds = latency_seconds
+        self.cost = cost
+        self.calls = 0
+
+    def _result(self, original_text, user_text):
+        self.calls += 1
+        result = self.respond(original_text, user_text) if callable(self.respond) else self.respond
+        return dict(result), self.cost
+
+    def grade(self, original_text, user_text, with_confidence=False):
+        if self.latency_seconds:
+            time.sleep(self.latency_seconds)
+        return self._result(original_text, user_text)
+
+    async def grade_async(self, original_text, user_text, with_confidence=False):
+        if self.latency_seconds:
+            await asyncio.sleep(self.latency_seconds)
+        return self._result(original_text, user_text)
+
+
+class GradingCascade:
+    """
+    단계(tiers)를 저렴한 것부터 차례로 시도하는 채점기입니다.
+
+    - 마지막이 아닌 단계의 결과는 스키마(GradingResult + confidence)로 검증하고,
+      검증에 실패하거나 확신도가 'min_confidence'보다 낮거나 점수가 'borderline' 구간([하한, 상한))에 있으면 다음 단계로 넘깁니다.
+      요청이 실패(예외)해도 다음 단계로 넘깁니다.
+    - 마지막 단계의 결과는 그대로 반환하고, 실패하면 예외를 그대로 전달합니다. (evaluate가 로컬 채점 결과로 대체합니다.)
+    - 반환하는 결과에서는 'confidence' 키를 뺍니다. 화면과 캐시에는 단계와 관계없이 같은 구조의 결과가 저장됩니다.
+    """
+
+    def __init__(self, tiers, min_confidence=0.7, borderline=(50, 80)):
+        if not tiers:
+            raise ValueError("채점 단계가 하나 이상 필요합니다.")
+        self.tiers = list(tiers)
+        self.min_confidence = min_confidence
+        self.borderline = borderline
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    @property
+    def name(self):
+        """
+        채점 결과 캐시 키에 넣을 구성 이름입니다. 단계가 하나면 모델 이름 그대로이므로, 이전에 캐시한 결과를 계속 사용합니다.
+        """
+        if len(self.tiers) == 1:
+            return self.tiers[0].name
+        low, high = self.borderline
+        return ">".join(tier.name for tier in self.tiers) + f"@{self.min_confidence}/{low}-{high}"
+
+    @property
+    def streamable_model(self):
+        """
+        스트리밍으로 채점해도 되는 모델 이름입니다. 단계가 Gemini 모델 하나뿐일 때만 그 이름을 반환하고, 아니면 None을 반환합니다.
+        여러 단계로 구성하면 저렴한 모델의 결과를 확인하기 전에 화면에 보여줄 수 없으므로 스트리밍하지 않습니다.
+        """
+        if len(self.tiers) == 1 and isinstance(self.tiers[0], GeminiTier):
+            return self.tiers[0].model
+        return None
+
+    # --- 기록 ---
+
+    def _record(self, tier_name, outcome, seconds=None, cost=0.0):
+        with self._lock:
+            stats = self._stats.setdefault(
+                tier_name, {"requests": 0, "outcomes": {}, "seconds": 0.0, "cost_usd": 0.0}
+            )
+            stats["requests"] += 1
+            stats["outcomes"][outcome] = stats["outcomes"].get(outcome, 0) + 1
+            stats["seconds"] += seconds or 0.0
+            stats["cost_usd"] += cost
+        METRICS.increment("grading_cascade_requests_total", tier=tier_name, outcome=outcome)
+        if seconds is not None:
+            METRICS.observe("grading_cascade_tier_seconds", seconds, LATENCY_BUCKETS, tier=tier_name)
+        if cost:
+            METRICS.increment("grading_cascade_cost_usd_total", cost, tier=tier_name)
+
+    def record_local(self):
+        """로컬 채점으로 끝난 요청을 기록합니다. (Gemini를 부르지 않았으므로 비용과 응답 시간은 0입니다.)"""
+        self._record("local", ACCEPTED)
+
+    def record_stream(self, seconds, usage=None, error=None):
+        """스트리밍으로 채점한 요청을 유일한 단계(streamable_model)의 결과로 기록합니다."""
+        tier = self.tiers[0]
+        if error is not None:
+            self._record(tier.name, _failure_outcome(error), seconds)
+        else:
+            self._record(tier.name, ACCEPTED, seconds, usage_cost(tier.model, usage))
+
+    def stats(self):
+        """
+        단계별 {requests, accepted, hit_rate, escalated(이유별 수), mean_seconds, cost_usd}를 반환합니다.
+        hit_rate는 그 단계까지 온 요청 중 그 단계에서 끝난 비율입니다.
+        """
+        with self._lock:
+            snapshot = {name: dict(stats, outcomes=dict(stats["outcomes"])) for name, stats in self._stats.items()}
+        result = {}
+        for name, stats in snapshot.items():
+            accepted = stats["outcomes"].pop(ACCEPTED, 0)
+            result[name] = {
+                "requests": stats["requests"],
+                "accepted": accepted,
+                "hit_rate": accepted / stats["requests"] if stats["requests"] else 0.0,
+                "escalated": stats["outcomes"],
+                "mean_seconds": stats["seconds"] / stats["requests"] if stats["requests"] else 0.0,
+                "cost_usd": stats["cost_usd"],
+            }
+        return result
+
+    # --- 채점 ---
+
+    def _escalation_reason(self, result):
+        """
+        마지막이 아닌 단계의 결과를 넘겨야 하는 이유를 반환합니다. 받아들여도 되면 None을 반환합니다.
+        """
+        from pydantic import ValidationError
+
+        from grading_schema import ConfidentGradingResult
+
+        try:
+            graded = ConfidentGradingResult.model_validate(result)
+        except ValidationError:
+            return INVALID
+        if graded.confidence < self.min_confidence:
+            return LOW_CONFIDENCE
+        low, high = self.borderline
+        if low <= graded.score < high:
+            return BORDERLINE
+        return None
+
+    def _judge(self, tier, last, result, started, cost):
+        """단계 하나의 결과를 기록하고, 받아들이면 True를 반환합니다."""
+        reason = None if last else self._escalation_reason(result)
+        self._record(tier.name, reason or ACCEPTED, time.perf_counter() - started, cost)
+        return reason is None
+
+    def grade(self, original_text, user_text):
+        for position, tier in enumerate(self.tiers):
+            last = position == len(self.tiers) - 1
+            started = time.perf_counter()
+            try:
+                result, cost = tier.grade(original_text, user_text, with_confidence=not last)
+            except Exception as e:
+                self._record(tier.name, _failure_outcome(e), time.perf_counter() - started)
+                if last:
+                    raise
+                continue
+            if self._judge(tier, last, result, started, cost):
+                return _without_confidence(result)
+
+    async def grade_async(self, original_text, user_text):
+        for position, tier in enumerate(self.tiers):
+            last = position == len(self.tiers) - 1
+            started = time.perf_counter()
+            try:
+                result, cost = await tier.grade_async(original_text, user_text, with_confidence=not last)
+            except Exception as e:
+                self._record(tier.name, _failure_outcome(e), time.perf_counter() - started)
+                if last:
+                    raise
+                continue
+            if self._judge(tier, last, result, started, cost):
+                return _without_confidence(result)
+
+
+def _failure_outcome(error):
+    # 응답이 JSON이 아니면 스키마 검증에 실패한 것과 같이 봅니다. 나머지(네트워크, 할당량 등)는 요청 실패입니다.
+    return INVALID if isinstance(error, json.JSONDecodeError) else ERROR
+
+
+def _without_confidence(result):
+    if isinstance(result, dict) and "confidence" in result:
+        result = {key: value for key, value in result.items() if key != "confidence"}
+    return result
+
+
+def _parse_borderline(value):
+    low, high = (int(part) for part in value.split(","))
+    return low, high
+
+
+# 웹 앱이 사용하는 채점 단계입니다.
+# - GRADING_CASCADE_MODELS: 쉼표로 구분한 모델 이름, 저렴한 것부터 (예: 'gemini-2.5-flash-lite,gemini-2.5-flash')
+#   지정하지 않으면 GEMINI_MODEL 한 단계로, 이전과 같이 모든 요청을 한 모델로 채점합니다.
+# - GRADING_CASCADE_MIN_CONFIDENCE: 이보다 확신도가 낮으면 다음 단계로 넘깁니다.
+# - GRADING_CASCADE_BORDERLINE: '하한,상한'. 점수가 이 구간(상한 미포함)에 있으면 다음 단계로 넘깁니다.
+GRADING_CASCADE = GradingCascade(
+    [
+        GeminiTier(model.strip())
+        for model in os.environ.get("GRADING_CASCADE_MODELS", GEMINI_MODEL).split(",")
+        if model.strip()
+    ],
+    min_confidence=float(os.environ.get("GRADING_CASCADE_MIN_CONFIDENCE", 0.7)),
+    borderline=_parse_borderline(os.environ.get("GRADING_CASCADE_BORDERLINE", "50,80")),
+)
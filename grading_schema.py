@@ -0,0 +1,59 @@
+# Java/Spring 관점에서의 설명:
+# 이 'grading_schema.py' 파일은 Java의 DTO(Data Transfer Object) 클래스들을 모아둔 패키지와 같습니다.
+# pydantic의 BaseModel은 Java의 record/Lombok @Data 클래스 + Bean Validation(@NotNull 등)을 합친 것과 비슷하며,
+# Gemini에 'response_schema'로 넘기면 모델이 이 구조에 맞는 JSON만 생성하도록 제한할 수 있습니다.
+
+from pydantic import BaseModel, Field
+
+
+class ImprovementPoint(BaseModel):
+    """개선할 점 하나. main.py의 '개선할 점' 목록의 한 줄에 해당합니다."""
+
+    original: str
+    user_input: str
+    suggestion: str
+
+
+class GradingResult(BaseModel):
+    """문장 하나에 대한 채점 결과. main.py가 화면에 표시하는 딕셔너리와 같은 구조입니다."""
+
+    score: int
+    positive_feedback: str
+    points_for_improvement: list[ImprovementPoint]
+
+
+class BatchGradingItem(GradingResult):
+    """
+    여러 문장을 한 번에 채점할 때의 결과 항목입니다.
+    'index'로 요청한 문장과 응답을 다시 짝지어, 응답 순서가 바뀌어도 올바른 문장에 결과가 들어가게 합니다.
+    """
+
+    index: int
+
+
+# 틀린 부분만 골라 보낸 요청(prompt_compaction.py)의 응답 구조입니다.
+# 클래스 설명(docstring)도 스키마의 'description'으로 함께 전송되어 프롬프트 크기에 포함되므로, 자세한 설명은 주석으로 둡니다.
+# - 'excerpt'는 몇 번째 발췌 구간에 대한 지적인지를 나타내며, 전체 문장의 위치로 되돌릴 때 사용합니다.
+# - 모델이 번호를 빠뜨려도(0) 결과를 버리지 않고, 모든 발췌 구간에서 찾아 되돌립니다.
+class CompactImprovementPoint(ImprovementPoint):
+    """발췌 구간 하나에 대한 개선할 점."""
+
+    excerpt: int = 0
+
+
+class CompactGradingResult(BaseModel):
+    """발췌 구간만을 기준으로 한 채점 결과."""
+
+    score: int
+    positive_feedback: str
+    points_for_improvement: list[CompactImprovementPoint]
+
+
+# 채점 단계(grading_cascade.py)에서 저렴한 모델에 요청할 때의 응답 구조입니다.
+# 'confidence'가 낮으면 더 강한 모델로 다시 채점합니다. 설명(description)은 모델에게 전달되므로 영어로 씁니다.
+class ConfidentGradingResult(GradingResult):
+    confidence: float = Field(description="How sure you are of this grading, from 0.0 to 1.0.")
+
+
+class ConfidentCompactGradingResult(CompactGradingResult):
+    confidence: float = Field(description="How sure you are of this grading, from 0.0 to 1.0.")
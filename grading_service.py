@@ -0,0 +1,355 @@
+# Java/Spring 관점에서의 설명:
+# 이 'grading_service.py' 파일은 Resilience4j(Bulkhead, RateLimiter, TimeLimiter, Retry)를 적용한 비동기 서비스와 비슷합니다.
+# 'evaluate'는 Streamlit 스크립트 스레드를 막는 동기 호출이었고, 시간 제한/재시도/호출량 제어가 없었습니다.
+# 이 서비스는 별도 스레드에서 돌아가는 asyncio 이벤트 루프 하나를 모든 세션이 공유하며,
+# - 동시에 진행 중인 요청 수를 세마포어로 제한하고 (Bulkhead)
+# - 초당 요청 수를 토큰 버킷으로 제한하고 (RateLimiter)
+# - 요청마다 마감 시간을 두고 (TimeLimiter)
+# - 일시적인 오류는 지수 백오프로 재시도합니다 (Retry)
+
+import asyncio
+import json
+import os
+import queue
+import random
+import threading
+import time
+
+import utils
+from metrics import METRICS, LATENCY_BUCKETS, error_type
+from single_flight import SingleFlight
+
+# 재시도할 가치가 있는 HTTP 상태 코드입니다. (할당량 초과, 서버 일시 장애)
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+def is_retryable(error):
+    """
+    다시 시도하면 성공할 수 있는 오류인지 판단합니다.
+    - Gemini API의 429/5xx 응답
+    - 네트워크 연결/시간 초과 오류
+    - 모델이 깨진 JSON을 생성한 경우 (응답이 매번 달라지므로 재시도로 해결될 수 있습니다)
+    """
+    # 오류가 실제로 발생했을 때만 필요한 모듈이므로 여기서 import합니다. (앱 시작 시간 단축)
+    import httpx
+    from google.genai import errors as genai_errors
+
+    if isinstance(error, genai_errors.APIError):
+        return error.code in RETRYABLE_STATUS_CODES
+    return isinstance(
+        error,
+        (httpx.TransportError, ConnectionError, TimeoutError, json.JSONDecodeError),
+    )
+
+
+class TokenBucket:
+    """
+    토큰 버킷 방식의 비동기 호출량 제한기입니다.
+    초당 'rate'개의 토큰이 채워지고, 최대 'capacity'개까지 쌓입니다. 요청 하나가 토큰 하나를 사용합니다.
+
+    Java/Spring 관점:
+    - Guava의 'RateLimiter.acquire()'와 같은 역할이지만, 기다리는 동안 스레드를 막지 않습니다.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.capacity, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                # 토큰 하나가 채워질 때까지 기다립니다. lock을 잡은 채로 기다리므로 요청은 도착 순서대로 처리됩니다.
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class GradingService:
+    """
+    동시성 제한, 호출량 제한, 마감 시간, 재시도를 갖춘 비동기 채점 서비스입니다.
+
+    'grade()'는 이벤트 루프 안에서 사용하는 코루틴이고,
+    'grade_sync()'는 Streamlit 스크립트처럼 일반 스레드에서 결과를 기다릴 때 사용합니다.
+    'grade_stream()'은 'grade_sync()'와 같은 제어를 거치면서 중간 결과를 받는 대로 내보냅니다.
+    'request_fn'/'stream_fn'을 바꾸면 가짜 채점 함수로 테스트할 수 있습니다.
+    """
+
+    def __init__(
+        self,
+        request_fn=None,
+        stream_fn=None,
+        max_in_flight=8,
+        rate_per_second=5.0,
+        burst=10,
+        deadline_seconds=30.0,
+        max_retries=3,
+        base_backoff_seconds=0.5,
+        max_backoff_seconds=8.0,
+    ):
+        self.request_fn = request_fn or utils.request_grading_async
+        # (원본, 받아쓰기, on_partial)을 받아 중간 결과를 on_partial로 넘기고 최종 결과를 반환하는 코루틴 함수입니다.
+        self.stream_fn = stream_fn or utils.request_grading_stream_async
+        self.max_in_flight = max_in_flight
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.deadline_seconds = deadline_seconds
+        self.max_retries = max_retries
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+
+        # 같은 받아쓰기를 여러 세션이 동시에 채점하면 한 번만 채점하고 결과를 나눠 받습니다.
+        # 기다리는 쪽의 대기 시간은 '_wait_seconds()'로 호출할 때마다 정합니다.
+        self._flight = SingleFlight("grading_service")
+        self._loop = None
+        self._semaphore = None
+        self._bucket = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._stats = {
+            "requests": 0,
+            "api_calls": 0,
+            "retries": 0,
+            "timeouts": 0,
+            "fallbacks": 0,
+            "in_flight": 0,
+            "max_in_flight_seen": 0,
+        }
+
+    def _bump(self, name, amount=1):
+        with self._stats_lock:
+            self._stats[name] += amount
+            if name == "in_flight":
+                self._stats["max_in_flight_seen"] = max(
+                    self._stats["max_in_flight_seen"], self._stats["in_flight"]
+                )
+
+    def stats(self):
+        with self._stats_lock:
+            stats = dict(self._stats)
+        # 다른 세션의 같은 채점에 합쳐져서 따로 요청하지 않은 'grade_sync' 호출 수입니다.
+        stats["coalesced"] = self._flight.stats()["suppressed"]
+        return stats
+
+    def _deadline(self):
+        # 'deadline_seconds'는 채점 단계 하나의 마감 시간입니다. 저렴한 모델의 결과가 미덥지 않으면 강한 모델로
+        # 다시 채점하므로, 전체 마감 시간은 단계 수를 곱한 값입니다. (강한 모델로 넘어간 요청을 중간에 끊지 않습니다.)
+        return self.deadline_seconds * len(utils.GRADING_CASCADE.tiers)
+
+    def _wait_seconds(self):
+        # grade()는 마감 시간이 지나면 로컬 채점 결과를 돌려주므로, 기다리는 쪽도 그보다 조금만 더 기다리면 됩니다.
+        return self._deadline() + 5
+
+    # --- 이벤트 루프 관리 ---
+
+    def _ensure_started(self):
+        """
+        채점 전용 이벤트 루프를 데몬 스레드에서 한 번만 시작합니다.
+        비동기 HTTP 커넥션 풀은 이벤트 루프에 묶여 있으므로, 모든 요청이 같은 루프를 사용해야 커넥션이 재사용됩니다.
+        """
+        if self._loop is not None:
+            return self._loop
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=loop.run_forever, name="grading-service", daemon=True
+                ).start()
+                self._loop = loop
+        return self._loop
+
+    def _limits(self):
+        # 세마포어와 토큰 버킷은 실제로 사용하는 이벤트 루프 안에서 만들어야 합니다.
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._bucket = TokenBucket(self.rate_per_second, self.burst)
+        return self._semaphore, self._bucket
+
+    def submit(self, original_text, user_text):
+        """
+        채점을 서비스의 이벤트 루프에 맡기고 'concurrent.futures.Future'를 반환합니다. (Java의 CompletableFuture와 같습니다.)
+        """
+        return asyncio.run_coroutine_threadsafe(
+            self.grade(original_text, user_text), self._ensure_started()
+        )
+
+    def grade_sync(self, original_text, user_text):
+        """
+        채점 결과가 나올 때까지 기다렸다가 반환합니다. 마감 시간이 있으므로 무한정 기다리지 않습니다.
+        같은 (원본, 받아쓰기)를 다른 세션이 이미 채점 중이면 새로 요청하지 않고 그 결과를 함께 받습니다.
+        """
+        return self._flight.do(
+            (original_text, user_text),
+            lambda: self.submit(original_text, user_text).result(),
+            timeout=self._wait_seconds(),
+        )
+
+    def grade_stream(self, original_text, user_text):
+        """
+        'grade_sync'의 스트리밍 버전입니다. 조금씩 채워진 결과('partial': True)를 받는 대로 내보내는 제너레이터이며,
+        마지막으로 내보내는 값이 'grade_sync'의 반환값과 같은 최종 결과입니다.
+
+        - 요청은 'grade_sync'와 같은 이벤트 루프에서 동시성 제한, 호출량 제한, 마감 시간, 재시도를 거칩니다.
+        - 같은 (원본, 받아쓰기)를 다른 세션이 이미 채점 중이면 새로 요청하지 않고 최종 결과만 함께 받습니다.
+        - 요청부터 첫 결과를 내보내기까지의 시간을 'grading_time_to_first_feedback_seconds' 지표로 기록합니다.
+
+        Java/Spring 관점:
+        - WebFlux에서 'Flux<GradingResult>'를 Server-Sent Events로 흘려보내는 것과 같습니다.
+        """
+        started = time.perf_counter()
+        self._bump("requests")
+        ready_result, local_result, cache_key = utils.prepare_grading(original_text, user_text)
+        if ready_result is not None:
+            _observe_first_feedback(started, "cache" if cache_key else "local")
+            yield ready_result
+            return
+
+        # 중간 결과는 이벤트 루프 스레드에서 이 큐에 넣고, 이 제너레이터(Streamlit 스레드)에서 꺼냅니다.
+        partials = queue.SimpleQueue()
+        future, leader = self._flight.submit(
+            (original_text, user_text),
+            lambda: asyncio.run_coroutine_threadsafe(
+                self._grade_prepared(original_text, user_text, local_result, cache_key, partials.put),
+                self._ensure_started(),
+            ),
+        )
+        shown = False
+        if leader:
+            # 채점이 끝나면(성공, 실패와 관계없이) 큐에 None을 넣어 아래 반복을 끝냅니다.
+            future.add_done_callback(lambda _: partials.put(None))
+            for partial in iter(partials.get, None):
+                if not shown:
+                    _observe_first_feedback(started, "stream")
+                    shown = True
+                yield partial
+        wait_seconds = self._wait_seconds()
+        try:
+            result = future.result(timeout=wait_seconds)
+        except TimeoutError as e:
+            self._bump("fallbacks")
+            METRICS.increment("evaluate_errors_total", type=error_type(e))
+            result = dict(
+                local_result,
+                fallback_reason=f"시간 초과: 같은 채점의 결과를 {wait_seconds}초 안에 받지 못했습니다.",
+            )
+        if not shown:
+            _observe_first_feedback(started, "coalesced" if not leader else "final")
+        yield result
+
+    # --- 채점 ---
+
+    async def grade(self, original_text, user_text):
+        """
+        받아쓰기 하나를 채점합니다. 'evaluate'와 같은 딕셔너리를 반환합니다.
+        마감 시간을 넘기거나 재시도 후에도 실패하면 로컬 채점 결과(+ 'fallback_reason')를 반환합니다.
+        """
+        self._bump("requests")
+        # 캐시 조회는 디스크 I/O가 있으므로 이벤트 루프를 막지 않도록 스레드에서 실행합니다.
+        ready_result, local_result, cache_key = await asyncio.to_thread(
+            utils.prepare_grading, original_text, user_text
+        )
+        if ready_result is not None:
+            return ready_result
+        return await self._grade_prepared(original_text, user_text, local_result, cache_key)
+
+    async def _grade_prepared(self, original_text, user_text, local_result, cache_key, on_partial=None):
+        """
+        로컬 채점과 캐시로 끝나지 않은 채점을 마감 시간 안에 요청하고, 결과를 캐시에 저장합니다.
+        'on_partial'을 주면 스트리밍으로 요청하고 중간 결과를 넘깁니다.
+        """
+        started = time.perf_counter()
+        deadline = self._deadline()
+        try:
+            result = await asyncio.wait_for(
+                self._request_with_retry(original_text, user_text, on_partial),
+                timeout=deadline,
+            )
+        except asyncio.TimeoutError as e:
+            self._bump("timeouts")
+            self._bump("fallbacks")
+            METRICS.increment("evaluate_errors_total", type=error_type(e))
+            return dict(
+                local_result,
+                fallback_reason=f"시간 초과: {deadline}초 안에 응답을 받지 못했습니다.",
+            )
+        except json.JSONDecodeError as e:
+            # 재시도 후에도 응답이 깨진 JSON이면 'evaluate'와 같이 JSON 파싱 오류로 따로 기록합니다.
+            self._bump("fallbacks")
+            METRICS.increment("evaluate_errors_total", type=error_type(e))
+            return dict(local_result, fallback_reason=f"JSON 파싱 오류: {e}")
+        except Exception as e:
+            self._bump("fallbacks")
+            METRICS.increment("evaluate_errors_total", type=error_type(e))
+            return dict(local_result, fallback_reason=f"기타 오류: {e}")
+
+        utils.GRADING_CACHE.record_api_call(time.perf_counter() - started)
+        await asyncio.to_thread(utils.GRADING_CACHE.set, cache_key, result)
+        return result
+
+    async def _request_with_retry(self, original_text, user_text, on_partial=None):
+        semaphore, bucket = self._limits()
+        attempt = 0
+        while True:
+            await bucket.acquire()
+            async with semaphore:
+                self._bump("in_flight")
+                self._bump("api_calls")
+                try:
+                    if on_partial is not None:
+                        return await self.stream_fn(original_text, user_text, on_partial)
+                    return await self.request_fn(original_text, user_text)
+                except Exception as e:
+                    if attempt >= self.max_retries or not is_retryable(e):
+                        raise
+                finally:
+                    self._bump("in_flight", -1)
+
+            # 재시도 전 대기는 세마포어 밖에서 합니다. 기다리는 동안 다른 요청이 자리를 사용할 수 있습니다.
+            # 지수 백오프에 무작위 지터(jitter)를 더해 여러 요청이 동시에 재시도하는 것을 막습니다.
+            delay = min(self.max_backoff_seconds, self.base_backoff_seconds * 2 ** attempt)
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+            attempt += 1
+            self._bump("retries")
+
+
+def _observe_first_feedback(started, source):
+    METRICS.observe(
+        "grading_time_to_first_feedback_seconds",
+        time.perf_counter() - started,
+        LATENCY_BUCKETS,
+        source=source,
+    )
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_grading_service():
+    """
+    프로세스 전체에서 공유하는 채점 서비스를 반환합니다. 설정은 환경 변수로 바꿀 수 있습니다.
+    - GRADING_MAX_IN_FLIGHT: 동시에 진행할 최대 요청 수
+    - GRADING_RATE_PER_SECOND / GRADING_BURST: 초당 요청 수와 순간 허용량
+    - GRADING_DEADLINE_SECONDS: 채점 단계 하나(재시도 포함)의 마감 시간. 단계가 여럿이면 단계 수만큼 늘어납니다.
+    - GRADING_MAX_RETRIES: 최대 재시도 횟수
+    """
+    global _service
+    if _service is None:
+        with _service_lock:
+            if _service is None:
+                _service = GradingService(
+                    max_in_flight=int(os.environ.get("GRADING_MAX_IN_FLIGHT", 8)),
+                    rate_per_second=float(os.environ.get("GRADING_RATE_PER_SECOND", 5)),
+                    burst=int(os.environ.get("GRADING_BURST", 10)),
+                    deadline_seconds=float(os.environ.get("GRADING_DEADLINE_SECONDS", 30)),
+                    max_retries=int(os.environ.get("GRADING_MAX_RETRIES", 3)),
+                )
+    return _service
@@ -0,0 +1,192 @@
+# Java/Spring 관점에서의 설명:
+# 이 'ingest.py' 파일은 Spring Batch 잡(Job)이나 CommandLineRunner로 만든 일괄 처리 프로그램과 같습니다.
+# 여러 영상의 URL(또는 ID)을 받아, 웹 화면에서 '스크립트 가져오기'를 누르는 것과 같은 처리를 병렬로 수행하고
+# 결과를 코퍼스(corpus.py)에 저장합니다. 웹 앱은 코퍼스에 있는 영상을 즉시 불러옵니다.
+#
+# 처리 흐름: extract_video_id_from_url → 자막 가져오기(스레드 풀, I/O) → 정리 + 문장 분리(프로세스 풀, CPU) → 코퍼스 저장 → 문장 색인
+#
+# 실행 방법 (프로젝트 루트에서):
+#     python ingest.py https://youtu.be/M-y14-3Y6gE dQw4w9WgXcQ
+#     python ingest.py --input-file urls.txt --fetch-workers 8 --process-workers 4
+#     python ingest.py --fixtures tests/fixtures/transcripts --corpus /tmp/corpus.sqlite3 VIDEO_ID   # 네트워크 없이 실행
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from utils import extract_video_id_from_url
+
+# 유튜브 영상 ID는 영문/숫자/'-'/'_'로 이루어진 11글자입니다.
+_VIDEO_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{11}$")
+
+
+class YouTubeFetcher:
+    """
+    YouTube에서 자막을 가져오는 기본 fetcher입니다. 웹 앱과 같은 디스크 캐시(TRANSCRIPT_CACHE)를 함께 사용합니다.
+
+    Java/Spring 관점:
+    - fetcher는 'fetch(video_id) -> 자막 조각 리스트' 메소드 하나를 가진 인터페이스(전략 패턴)입니다.
+      같은 메소드를 가진 다른 클래스(FixtureFetcher)로 바꿔 끼울 수 있습니다.
+    """
+
+    def fetch(self, video_id):
+        from youtube_script_processor import load_transcript_record
+
+        # 입력 목록에 같은 영상이 여러 번 있어도, 동시에 실행 중인 fetch 작업자들이 YouTube에 한 번만 요청합니다.
+        return load_transcript_record(video_id)["snippets"]
+
+
+class FixtureFetcher:
+    """
+    로컬 디렉터리의 '<video_id>.json' 파일에서 자막을 읽는 fetcher입니다. 네트워크 없이 테스트할 때 사용합니다.
+    파일 형식은 디스크 캐시에 저장되는 레코드와 같습니다: {"snippets": [[텍스트, 시작, 길이], ...]}
+    """
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def fetch(self, video_id):
+        path = os.path.join(self.directory, f"{video_id}.json")
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)["snippets"]
+
+
+def parse_video_id(value):
+    """
+    URL이면 영상 ID를 추출하고, 이미 영상 ID 형식이면 그대로 반환합니다. 둘 다 아니면 None을 반환합니다.
+    """
+    value = value.strip()
+    if _VIDEO_ID_PATTERN.match(value):
+        return value
+    return extract_video_id_from_url(value)
+
+
+def segment_snippets(snippets):
+    """
+    자막 조각을 정리하고 문장으로 나눕니다. 프로세스 풀에서 실행되므로 결과는 단순한 리스트로 반환합니다.
+    (clean_script + split_into_sentences와 같은 결과에 시작/끝 시간이 더해진 것입니다.)
+    """
+    from youtube_script_processor import stream_sentences
+
+    return [[s.text, s.start, s.end] for s in stream_sentences(snippets)]
+
+
+def ingest(values, fetcher, corpus, fetch_workers=4, process_workers=None, skip_existing=False, index=None):
+    """
+    여러 영상을 병렬로 처리해 코퍼스에 저장하고, 영상별 결과 딕셔너리 리스트를 반환합니다.
+    'index'(SentenceIndex)를 주면 저장한 영상을 문장 검색 색인에도 추가합니다.
+
+    - 자막 가져오기는 네트워크 대기가 대부분이므로 스레드 풀(fetch_workers개)로 동시 요청 수를 제한합니다.
+    - 정리와 문장 분리는 CPU 작업이므로 GIL의 영향을 받지 않도록 프로세스 풀(process_workers개)에서 실행합니다.
+    - 자막을 다 받은 영상부터 바로 문장 분리를 시작하므로, 두 단계가 겹쳐서 진행됩니다.
+
+    Java/Spring 관점:
+    - 'ThreadPoolExecutor'/'ProcessPoolExecutor'는 Java의 'ExecutorService'와 같고,
+      'submit()'이 반환하는 Future는 Java의 'Future'/'CompletableFuture'와 같습니다.
+    """
+    results = []
+    video_ids = []
+    for value in values:
+        video_id = parse_video_id(value)
+        if video_id is None:
+            results.append({"input": value, "video_id": None, "status": "invalid"})
+        elif skip_existing and corpus.get(video_id) is not None:
+            results.append({"input": value, "video_id": video_id, "status": "skipped"})
+        elif video_id not in video_ids:
+            video_ids.append(video_id)
+
+    with ThreadPoolExecutor(max_workers=fetch_workers) as fetch_pool, \
+            ProcessPoolExecutor(max_workers=process_workers) as process_pool:
+        fetches = {fetch_pool.submit(fetcher.fetch, video_id): video_id for video_id in video_ids}
+        segments = {}
+        for future in as_completed(fetches):
+            video_id = fetches[future]
+            try:
+                snippets = future.result()
+            except Exception as e:
+                results.append({"input": video_id, "video_id": video_id, "status": "failed", "error": str(e)})
+                continue
+            segments[process_pool.submit(segment_snippets, snippets)] = video_id
+
+        for future in as_completed(segments):
+            video_id = segments[future]
+            try:
+                sentences = future.result()
+            except Exception as e:
+                results.append({"input": video_id, "video_id": video_id, "status": "failed", "error": str(e)})
+                continue
+            corpus.put(video_id, sentences)
+            if index is not None:
+                index.add_video(video_id, sentences)
+            results.append(
+                {"input": video_id, "video_id": video_id, "status": "ok", "sentences": len(sentences)}
+            )
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="여러 유튜브 영상을 미리 문장 단위로 처리해 코퍼스에 저장합니다.")
+    parser.add_argument("inputs", nargs="*", help="유튜브 URL 또는 영상 ID")
+    parser.add_argument("--input-file", help="한 줄에 하나씩 URL/ID가 적힌 파일 ('#'으로 시작하는 줄은 무시)")
+    parser.add_argument("--corpus", default=None, help="코퍼스 SQLite 파일 경로 (기본: CORPUS_PATH 또는 .cache/corpus.sqlite3)")
+    parser.add_argument(
+        "--index",
+        default=None,
+        help="문장 검색 색인 SQLite 파일 경로 (기본: --corpus를 지정하지 않았으면 SENTENCE_INDEX_PATH 또는 .cache/sentence_index.sqlite3)",
+    )
+    parser.add_argument("--fixtures", default=None, help="YouTube 대신 이 디렉터리의 <video_id>.json 파일을 사용합니다.")
+    parser.add_argument("--fetch-workers", type=int, default=4, help="동시에 자막을 가져올 최대 개수")
+    parser.add_argument("--process-workers", type=int, default=None, help="문장 분리 프로세스 수 (기본: CPU 개수)")
+    parser.add_argument("--skip-existing", action="store_true", help="코퍼스에 이미 있는 영상은 건너뜁니다.")
+    args = parser.parse_args(argv)
+
+    values = list(args.inputs)
+    if args.input_file:
+        with open(args.input_file, "r", encoding="utf-8") as f:
+            values.extend(line.strip() for line in f if line.strip() and not line.startswith("#"))
+    if not values:
+        parser.error("처리할 URL 또는 영상 ID를 입력하세요.")
+
+    from corpus import CORPUS, SentenceCorpus
+    from sentence_index import SENTENCE_INDEX, SentenceIndex
+
+    corpus = SentenceCorpus(args.corpus) if args.corpus else CORPUS
+    # 다른 코퍼스 파일에 저장할 때는, 색인 파일을 따로 지정한 경우에만 색인합니다. (기본 색인은 기본 코퍼스와 짝입니다.)
+    if args.index:
+        index = SentenceIndex(args.index)
+    else:
+        index = None if args.corpus else SENTENCE_INDEX
+    fetcher = FixtureFetcher(args.fixtures) if args.fixtures else YouTubeFetcher()
+
+    started = time.perf_counter()
+    results = ingest(
+        values,
+        fetcher,
+        corpus,
+        fetch_workers=args.fetch_workers,
+        process_workers=args.process_workers,
+        skip_existing=args.skip_existing,
+        index=index,
+    )
+    elapsed = time.perf_counter() - started
+
+    for result in results:
+        if result["status"] == "ok":
+            print(f"[ok]      {result['video_id']}  {result['sentences']} sentences")
+        elif result["status"] == "skipped":
+            print(f"[skipped] {result['video_id']}  already in corpus")
+        elif result["status"] == "invalid":
+            print(f"[invalid] {result['input']}")
+        else:
+            print(f"[failed]  {result['video_id']}  {result['error']}")
+    ok = sum(1 for r in results if r["status"] == "ok")
+    print(f"\n{ok}/{len(results)} videos ingested in {elapsed:.1f}s")
+    return 0 if all(r["status"] in ("ok", "skipped") for r in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
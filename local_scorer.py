@@ -0,0 +1,167 @@
+# Java/Spring 관점에서의 설명:
+# 이 'local_scorer.py' 파일은 외부 API 없이 동작하는 순수 도메인 서비스(e.g., 'LocalDictationScorer')와 같습니다.
+# 원본 문장과 받아쓰기를 단어 단위로 정렬(alignment)하여, Gemini를 부르지 않고도 즉시 채점 결과를 만듭니다.
+# - 대소문자/구두점만 다른 경우처럼 차이가 사소하면 이 결과를 그대로 사용합니다.
+# - Gemini 호출이 실패하거나 시간 초과가 나면 대체(fallback) 결과로 사용합니다.
+
+import re
+
+# 단어 앞뒤의 구두점을 제거하기 위한 패턴입니다. 단어 안쪽의 아포스트로피(don't)는 유지합니다.
+_EDGE_PUNCTUATION = re.compile(r"^[^\w']+|[^\w']+$")
+# 둥근 따옴표(’)를 일반 아포스트로피(')로 통일하기 위한 변환 테이블입니다.
+_QUOTE_TABLE = str.maketrans({"’": "'", "‘": "'", "“": '"', "”": '"'})
+
+
+def tokenize(text):
+    """
+    문장을 (화면에 보이는 원래 단어, 비교용으로 정규화한 단어) 튜플의 리스트로 나눕니다.
+    정규화는 소문자 변환과 앞뒤 구두점 제거입니다. 구두점만 있는 토큰(예: '-')은 버립니다.
+    """
+    tokens = []
+    for surface in text.translate(_QUOTE_TABLE).split():
+        normalized = _EDGE_PUNCTUATION.sub("", surface.lower()).strip("'")
+        if normalized:
+            tokens.append((surface, normalized))
+    return tokens
+
+
+def align_words(original_words, user_words):
+    """
+    편집 거리(Levenshtein distance) 알고리즘으로 두 단어 목록을 정렬합니다.
+    ('equal' | 'substitute' | 'delete' | 'insert', 원본 위치, 입력 위치) 튜플의 리스트를 반환합니다.
+    - 'delete': 원본에 있는 단어를 빠뜨림 (입력 위치는 None)
+    - 'insert': 원본에 없는 단어를 추가함 (원본 위치는 None)
+
+    Java/Spring 관점:
+    - 2차원 배열(int[][])을 채우는 전형적인 동적 계획법(DP)이며, 마지막에 역추적(backtrace)으로 경로를 복원합니다.
+    """
+    n, m = len(original_words), len(user_words)
+    # distance[i][j]: 원본 앞 i개 단어와 입력 앞 j개 단어 사이의 최소 편집 횟수
+    distance = [[0] * (m + 1) for _ in range(n + 1)]
+    for i in range(n + 1):
+        distance[i][0] = i
+    for j in range(m + 1):
+        distance[0][j] = j
+
+    for i in range(1, n + 1):
+        row, previous_row = distance[i], distance[i - 1]
+        word = original_words[i - 1]
+        for j in range(1, m + 1):
+            cost = 0 if word == user_words[j - 1] else 1
+            row[j] = min(
+                previous_row[j - 1] + cost,  # 일치 또는 대체
+                previous_row[j] + 1,  # 원본 단어 누락
+                row[j - 1] + 1,  # 불필요한 단어 추가
+            )
+
+    operations = []
+    i, j = n, m
+    while i > 0 or j > 0:
+        if i > 0 and j > 0:
+            cost = 0 if original_words[i - 1] == user_words[j - 1] else 1
+            if distance[i][j] == distance[i - 1][j - 1] + cost:
+                operations.append(("equal" if cost == 0 else "substitute", i - 1, j - 1))
+                i, j = i - 1, j - 1
+                continue
+        if i > 0 and distance[i][j] == distance[i - 1][j] + 1:
+            operations.append(("delete", i - 1, None))
+            i -= 1
+        else:
+            operations.append(("insert", None, j - 1))
+            j -= 1
+    operations.reverse()
+    return operations
+
+
+def _group_mistakes(operations, original_tokens, user_tokens):
+    """
+    연속된 틀린 부분을 하나로 묶어 main.py가 표시하는 'points_for_improvement' 형식으로 만듭니다.
+    """
+    points = []
+    span_original, span_user = [], []
+
+    def flush():
+        if not span_original and not span_user:
+            return
+        original = " ".join(span_original)
+        user_input = " ".join(span_user)
+        if not span_user:
+            suggestion = f"Missing word(s): '{original}'"
+        elif not span_original:
+            suggestion = f"Extra word(s) not in the original: '{user_input}'"
+        else:
+            suggestion = f"Write '{original}' instead of '{user_input}'."
+        points.append(
+            {"original": original, "user_input": user_input, "suggestion": suggestion}
+        )
+        span_original.clear()
+        span_user.clear()
+
+    for op, i, j in operations:
+        if op == "equal":
+            flush()
+            continue
+        if i is not None:
+            span_original.append(original_tokens[i][0])
+        if j is not None:
+            span_user.append(user_tokens[j][0])
+    flush()
+    return points
+
+
+def score_locally(original_text, user_text):
+    """
+    Gemini 없이 받아쓰기를 채점합니다. main.py가 기대하는 딕셔너리와 같은 구조를 반환합니다.
+
+    반환값에는 다음 키가 추가로 들어 있습니다.
+    - 'source': 항상 'local' (로컬 채점 결과임을 표시)
+    - 'word_errors': 단어 단위 편집 거리. 0이면 대소문자/구두점 외에는 차이가 없다는 뜻입니다.
+    """
+    original_tokens = tokenize(original_text)
+    user_tokens = tokenize(user_text)
+    operations = align_words(
+        [normalized for _, normalized in original_tokens],
+        [normalized for _, normalized in user_tokens],
+    )
+
+    word_errors = sum(1 for op, _, _ in operations if op != "equal")
+    points = _group_mistakes(operations, original_tokens, user_tokens)
+
+    if word_errors == 0:
+        # 단어는 모두 맞았습니다. 대소문자나 구두점만 다른 단어가 있으면 작은 감점과 함께 알려줍니다.
+        for op, i, j in operations:
+            original_surface = original_tokens[i][0]
+            user_surface = user_tokens[j][0]
+            if original_surface != user_surface:
+                points.append(
+                    {
+                        "original": original_surface,
+                        "user_input": user_surface,
+                        "suggestion": "Check the capitalization and punctuation.",
+                    }
+                )
+        score = 100 if not points else 95
+        positive_feedback = "Excellent! Every word matches the original."
+    else:
+        total = max(len(original_tokens), 1)
+        score = max(0, round(100 * (1 - word_errors / total)))
+        correct = sum(1 for op, _, _ in operations if op == "equal")
+        positive_feedback = (
+            f"Good effort! You got {correct} of {len(original_tokens)} words right."
+        )
+
+    return {
+        "score": score,
+        "positive_feedback": positive_feedback,
+        "points_for_improvement": points,
+        "source": "local",
+        "word_errors": word_errors,
+    }
+
+
+def is_trivial(local_result):
+    """
+    로컬 채점 결과만으로 충분한지(= Gemini에 보낼 필요가 없는지) 판단합니다.
+    단어 단위의 실수가 하나도 없으면 사소한 차이로 봅니다.
+    """
+    return local_result["word_errors"] == 0
@@ -9,15 +9,31 @@ import streamlit as st
 # 다른 파일(모듈)에 정의된 함수들을 가져오는 구문입니다.
 from utils import (
     extract_video_id_from_url,  
-    evaluate,    
+    evaluate_batch,
+    GRADING_FLIGHT,
 )
 
+from grading_service import get_grading_service
+from gemini_client import EVALUATION_PROMPT
+
 from youtube_script_processor import (
-    get_youtube_transcript,
-    clean_script,
-    split_into_sentences
+    get_transcript_snippets,
+    stream_sentences,
+    TRANSCRIPT_CACHE,
+    TRANSCRIPT_FLIGHT,
 )
 
+from grading_cache import GRADING_CACHE
+from grading_cascade import GRADING_CASCADE
+from corpus import CORPUS
+from sentence_store import SENTENCE_STORE
+from sentence_index import SENTENCE_INDEX, drill_id, is_drill, load_drill, mistake_phrases
+from progress_store import PROGRESS_STORE
+from metrics import METRICS
+
+# 집중 연습 세트 하나에 담을 최대 문장 수입니다.
+DRILL_SIZE = 20
+
 # 'if __name__ == "__main__":' 블록은 이 스크립트 파일이 직접 실행될 때만 내부 코드를 실행하도록 하는 Python의 관용구입니다.
 # Java의 'public static void main(String[] args)' 메소드와 동일한 역할을 합니다.
 # 다른 파일에서 이 파일을 'import'할 경우, 이 블록 안의 코드는 실행되지 않습니다.
@@ -31,10 +47,9 @@ if __name__ == "__main__":
     # --- 프롬프트 내용 표시 ---
     with st.expander("채점에 사용되는 프롬프트 보기"):
         try:
-            # Java에서 파일을 읽는 것과 같이, with open(...) 구문을 사용해 파일을 엽니다.
-            # "r"은 읽기 모드, encoding="utf-8"은 한글 등 다양한 문자를 지원하기 위함입니다.
-            with open("prompts/evaluation_prompt.md", "r", encoding="utf-8") as f:
-                prompt_content = f.read()
+            # 채점에 쓰는 것과 같은 프롬프트 템플릿 객체에서 가져옵니다. 메모리에 보관된 내용을 사용하고,
+            # 파일이 수정된 경우에만 다시 읽으므로 화면이 다시 그려질 때마다 파일을 열지 않습니다.
+            prompt_content = EVALUATION_PROMPT.get()
             # st.code는 마크다운의 코드 블록(```)처럼 텍스트를 고정폭 글꼴로 보여줍니다.
             st.code(prompt_content, language="markdown")
         except FileNotFoundError:
@@ -53,20 +68,69 @@ if __name__ == "__main__":
         help="예: https://www.youtube.com/watch?v=M-y14-3Y6gE",
     )
 
+    # 학습자를 구분하는 이름입니다. 이름을 입력하면 진행 상황(위치, 입력, 채점 결과)이 저장되어
+    # 새로고침하거나 서버가 다시 시작되어도 이어서 할 수 있습니다.
+    # URL의 '?user=이름' 쿼리 파라미터로도 지정할 수 있습니다. (Spring의 @RequestParam과 같습니다.)
+    user_id = st.text_input(
+        "학습자 이름 (진행 상황 저장용, 선택):",
+        value=st.query_params.get("user", ""),
+        help="같은 이름으로 다시 접속하면 이전 진행 상황을 이어서 할 수 있습니다.",
+    ).strip()
+    if user_id:
+        st.query_params["user"] = user_id
+    elif "user" in st.query_params:
+        del st.query_params["user"]
+
     # --- 2. 세션 상태(Session State) 관리 ---
     # st.session_state는 Streamlit이 제공하는 특별한 딕셔너리(Dictionary) 객체입니다.
     # Java/Spring 관점:
     # - 이는 웹 애플리케이션의 '세션(Session)'과 매우 유사합니다. (e.g., 'HttpSession' 객체)
     # - 사용자가 앱과 상호작용(버튼 클릭 등)하여 스크립트가 다시 실행되더라도, st.session_state에 저장된 값은 유지됩니다.
     # - 이를 통해 페이지 간의 상태나 사용자의 진행 상황을 기억할 수 있습니다.
-    if "sentences" not in st.session_state:
+    # - 문장 데이터 자체는 모든 세션이 공유하는 SENTENCE_STORE에 영상마다 한 벌만 있고,
+    #   세션에는 영상 ID와 현재 위치, 실제로 입력/채점한 문장만 담은 딕셔너리(문장 번호 -> 값)를 저장합니다.
+    if "video_id" not in st.session_state:
         # 세션 초기화: 사용자가 처음 접속했거나 세션이 만료되었을 때 필요한 변수들을 초기화합니다.
         # Spring에서 사용자가 처음 로그인했을 때 세션에 사용자 정보를 저장하는 것과 유사합니다.
-        st.session_state.sentences = []
+        st.session_state.video_id = None
         st.session_state.total_sentences = 0
         st.session_state.current_sentence_index = 0
-        st.session_state.user_inputs = []
-        st.session_state.scores = []
+        st.session_state.user_inputs = {}
+        st.session_state.scores = {}
+
+    def load_sentences(video_id):
+        # 공유 저장소에 없는 영상의 문장을 불러옵니다. 집중 연습 세트는 ID에 담긴 문장들을 코퍼스에서 모아 만듭니다.
+        if is_drill(video_id):
+            return load_drill(video_id, CORPUS)
+        return CORPUS.get(video_id)
+
+    def open_video(video_id, total):
+        """
+        세션에 영상을 열고, 저장된 진행 상황이 있으면 한 번의 읽기로 위치/입력/채점 결과를 복원합니다.
+        복원했으면 True를 반환합니다.
+        """
+        progress = PROGRESS_STORE.load(user_id, video_id) if user_id else None
+        st.session_state.video_id = video_id
+        st.session_state.total_sentences = total
+        st.session_state.current_sentence_index = 0
+        st.session_state.user_inputs = {}
+        st.session_state.scores = {}
+        # 새로고침 후에도 같은 영상을 다시 열 수 있도록 영상 ID를 URL에 남깁니다.
+        st.query_params["v"] = video_id
+        if progress is None:
+            return False
+        st.session_state.current_sentence_index = min(progress["current_index"], total - 1)
+        st.session_state.user_inputs = progress["user_inputs"]
+        st.session_state.scores = progress["scores"]
+        return True
+
+    # 새 세션(새로고침, 서버 재시작)인데 URL에 학습자 이름과 영상 ID가 있으면, 마지막으로 보던 영상을 이어서 엽니다.
+    if st.session_state.video_id is None and user_id and st.query_params.get("v"):
+        resumed_sentences = SENTENCE_STORE.get_or_load(st.query_params["v"], load_sentences)
+        if resumed_sentences and open_video(st.query_params["v"], len(resumed_sentences)):
+            st.info(
+                f"저장된 진행 상황을 불러왔습니다. (문장 {st.session_state.current_sentence_index + 1}부터)"
+            )
 
     # st.button: 클릭 가능한 버튼을 생성합니다. 이 함수는 버튼이 클릭되면 True를 반환합니다.
     # 'if st.button(...) :' 구문은 "만약 사용자가 이 버튼을 클릭했다면" 이라는 의미의 이벤트 리스너와 같습니다.
@@ -76,23 +140,46 @@ if __name__ == "__main__":
             # Spring의 Controller가 Service 계층의 메소드를 호출하는 것과 유사한 흐름입니다.
             video_id = extract_video_id_from_url(youtube_url)
             if video_id:
-                # st.spinner: 작업이 진행 중임을 알려주는 로딩 UI를 표시합니다.
-                with st.spinner("스크립트를 처리 중입니다..."):
-                    original_script = get_youtube_transcript(video_id)
-
-                if original_script:
-                    refined_script = clean_script(original_script)
-                    sentences = split_into_sentences(refined_script)
-
-                    # 처리된 결과를 세션 상태에 저장하여 다음 상호작용에서도 사용할 수 있도록 합니다.
-                    st.session_state.sentences = sentences
-                    st.session_state.total_sentences = len(sentences)
-                    st.session_state.current_sentence_index = 0
-                    st.session_state.user_inputs = ["" for _ in sentences]
-                    st.session_state.scores = [None for _ in sentences]
-                    st.success(
-                        f"총 {st.session_state.total_sentences}개의 문장을 찾았습니다. 받아쓰기를 시작하세요!"
-                    )
+                # 다른 세션이 이미 연 영상이면 공유 저장소에서, 일괄 처리 CLI(ingest.py)로 미리 처리해 둔 영상이면
+                # 코퍼스에서 문장을 바로 불러옵니다.
+                sentences = SENTENCE_STORE.get_or_load(video_id, load_sentences)
+                snippets = None
+                if sentences is None:
+                    # st.spinner: 작업이 진행 중임을 알려주는 로딩 UI를 표시합니다.
+                    with st.spinner("스크립트를 처리 중입니다..."):
+                        snippets = get_transcript_snippets(video_id)
+
+                if sentences is None and snippets:
+                    # 자막 조각을 하나씩 처리하면서 문장이 완성될 때마다 받아옵니다.
+                    # 전체 스크립트를 한 문자열로 합치지 않으므로 긴 영상에서도 메모리를 적게 사용하고,
+                    # 첫 문장은 전체 처리가 끝나기 전에 미리 보여줄 수 있습니다.
+                    progress = st.empty()
+                    sentences = []
+                    with METRICS.span("segment_sentences"):
+                        for sentence in stream_sentences(snippets):
+                            sentences.append(sentence)
+                            if len(sentences) == 1:
+                                progress.info(f"첫 문장: {sentence.text}")
+                            elif len(sentences) % 200 == 0:
+                                progress.info(f"문장 {len(sentences)}개 처리 중...")
+                    progress.empty()
+                    # 다음에 같은 영상을 열 때는 (다른 워커 프로세스에서도) 코퍼스에서 바로 불러옵니다.
+                    CORPUS.put(video_id, sentences)
+                    # 새 영상의 문장을 검색 색인에도 추가합니다. 다른 영상은 다시 색인하지 않습니다.
+                    SENTENCE_INDEX.add_video(video_id, sentences)
+                    sentences = SENTENCE_STORE.put(video_id, sentences)
+
+                if sentences:
+                    # 세션에는 영상 ID와 위치만 저장하고, 문장은 공유 저장소에서 읽습니다.
+                    if open_video(video_id, len(sentences)):
+                        st.success(
+                            f"총 {st.session_state.total_sentences}개의 문장을 찾았습니다. "
+                            f"저장된 진행 상황을 불러왔습니다. (문장 {st.session_state.current_sentence_index + 1}부터)"
+                        )
+                    else:
+                        st.success(
+                            f"총 {st.session_state.total_sentences}개의 문장을 찾았습니다. 받아쓰기를 시작하세요!"
+                        )
                 else:
                     st.warning(
                         "영상의 스크립트를 가져오는 데 실패했습니다. URL을 확인하거나 다른 영상을 시도해주세요."
@@ -102,89 +189,288 @@ if __name__ == "__main__":
         else:
             st.warning("유튜브 영상 URL을 입력해주세요.")
 
+    # 지금까지의 채점 결과에서 자주 틀린 단어를 골라, 그 단어가 들어간 문장들(여러 영상)로 연습 세트를 만듭니다.
+    # 문장 검색은 코퍼스 전체를 다시 읽지 않고 역색인(sentence_index.py)만 조회하므로 바로 끝납니다.
+    if st.button("자주 틀린 단어로 집중 연습", key="drill_button"):
+        past_results = (
+            PROGRESS_STORE.user_scores(user_id)
+            if user_id
+            else list(st.session_state.scores.values())
+        )
+        phrases = mistake_phrases(past_results)
+        if not phrases:
+            st.info("아직 채점 결과에 틀린 단어가 없습니다. 받아쓰기를 채점한 뒤 다시 시도해주세요.")
+        else:
+            # 색인 기능이 생기기 전에 코퍼스에 저장된 영상이 있으면 먼저 색인합니다. (새 영상만 색인합니다.)
+            SENTENCE_INDEX.sync(CORPUS)
+            # 지금 연습 중인 영상의 문장은 방금 본 것이므로 빼고, 다른 영상의 문장으로만 연습 세트를 만듭니다.
+            current_video_id = st.session_state.video_id
+            matches = SENTENCE_INDEX.search(
+                phrases,
+                limit=DRILL_SIZE,
+                match_all=False,
+                exclude_videos={current_video_id} if current_video_id else (),
+            )
+            drill_sentences = (
+                SENTENCE_STORE.get_or_load(drill_id(matches), load_sentences) if matches else None
+            )
+            if drill_sentences:
+                open_video(drill_id(matches), len(drill_sentences))
+                st.success(
+                    f"자주 틀린 단어({', '.join(phrases)})가 들어간 문장 {len(drill_sentences)}개로 "
+                    "집중 연습을 시작합니다."
+                )
+            else:
+                st.warning(f"자주 틀린 단어({', '.join(phrases)})가 들어간 문장을 찾지 못했습니다.")
+
     # --- 3. 받아쓰기 인터페이스 렌더링 ---
-    # 세션에 문장 데이터가 있을 경우에만 이 블록의 UI를 그립니다.
-    if st.session_state.sentences:
-        st.markdown("---") # 구분선(<hr>)
-
-        # 현재 문장 인덱스를 세션에서 가져옵니다.
-        idx = st.session_state.current_sentence_index
-        total = st.session_state.total_sentences
-        st.write(f"**문장 {idx + 1} / {total}**")
-
-        st.subheader("✅ 원본 스크립트")
-        st.write(st.session_state.sentences[idx])
-
-        st.subheader("✍️ 당신의 받아쓰기")
-        # st.text_area: 여러 줄의 텍스트를 입력받는 UI 컴포넌트. HTML의 <textarea>와 같습니다.
-        user_input = st.text_area(
-            "영상을 듣고 받아쓰기한 내용을 여기에 입력하세요:",
-            value=st.session_state.user_inputs[idx], # 세션에 저장된 값을 기본값으로 표시
-            key=f"user_input_{idx}",  # 각 UI 컴포넌트는 고유한 key를 가져야 합니다.
+    # '@st.fragment'를 붙인 함수 안의 위젯(받아쓰기 입력, 이전/다음, 채점 버튼)을 조작하면
+    # 스크립트 전체가 아니라 이 함수만 다시 실행됩니다. 제목, URL 입력, 프롬프트 보기, 사이드바는 다시 그리지 않습니다.
+    # Java/Spring 관점:
+    # - 페이지 전체를 새로 고치지 않고 일부 영역만 다시 그리는 부분 렌더링(Thymeleaf fragment + AJAX)과 같습니다.
+    def move_sentence(step):
+        # '이전'/'다음' 버튼의 콜백입니다. Java의 이벤트 리스너(ActionListener)와 같습니다.
+        st.session_state.current_sentence_index += step
+        if user_id:
+            # 디스크에 바로 쓰지 않고 쓰기 대기열에 넣으므로, 이동이 디스크 I/O를 기다리지 않습니다.
+            PROGRESS_STORE.save_position(
+                user_id, st.session_state.video_id, st.session_state.current_sentence_index
+            )
+
+    def save_score(idx, scoring_result):
+        # 채점 결과를 세션에 저장하고, 학습자 이름이 있으면 진행 상황 저장소의 쓰기 대기열에도 넣습니다.
+        st.session_state.scores[idx] = scoring_result
+        if user_id:
+            PROGRESS_STORE.save_score(user_id, st.session_state.video_id, idx, scoring_result)
+
+    def render_result(scoring_results):
+        # 채점 결과 하나를 그립니다. 스트리밍 중의 중간 결과('partial')는 도착한 항목까지만 그립니다.
+        # API 응답에 'error' 키가 있는지 확인하여 오류를 처리합니다.
+        if "error" in scoring_results:
+            st.error(f"채점 중 오류 발생: {scoring_results.get('error')}")
+            st.text(f"오류 상세 내용: {scoring_results.get('details')}")
+            st.subheader("Gemini AI 원본 응답:")
+            st.code(scoring_results.get('raw_response'))
+            return
+
+        # 성공적인 결과 표시
+        if scoring_results.get("fallback_reason"):
+            st.caption(
+                f"Gemini 응답을 받지 못해 로컬 채점 결과를 표시합니다. ({scoring_results.get('fallback_reason')})"
+            )
+        elif scoring_results.get("source") == "local":
+            st.caption("사소한 차이만 있어 로컬에서 즉시 채점했습니다.")
+        st.write(f"**💯 총점:** {scoring_results.get('score')}/100")
+        if "positive_feedback" in scoring_results:
+            st.write(
+                f"**👍 잘한 점:** {scoring_results.get('positive_feedback')}"
+            )
+
+        points = scoring_results.get("points_for_improvement", [])
+        if points:
+            st.write("**✏️ 개선할 점:**")
+            # 리스트를 순회하며 개선점을 하나씩 출력합니다.
+            for point in points:
+                st.markdown(f"- **원본:** `{point.get('original')}`")
+                st.markdown(f"  **입력:** `{point.get('user_input')}`")
+                st.markdown(f"  **제안:** {point.get('suggestion')}\n")
+        if scoring_results.get("partial"):
+            st.caption("Gemini AI가 나머지 채점 결과를 보내는 중입니다...")
+        elif not points:
+            st.info("훌륭합니다! 특별히 개선할 점이 보이지 않습니다.")
+
+    @st.fragment
+    def dictation_panel():
+        # 세션에 영상이 선택되어 있을 경우에만 이 영역의 UI를 그립니다.
+        # 이 영역만 다시 실행되는 데 걸린 시간은 'ui_dictation_fragment' 지표로 기록합니다.
+        with METRICS.span("ui_dictation_fragment"):
+            # 공유 저장소에서 밀려난 영상은 코퍼스에서 다시 불러옵니다.
+            sentences = (
+                SENTENCE_STORE.get_or_load(st.session_state.video_id, load_sentences)
+                if st.session_state.video_id
+                else None
+            )
+            if sentences:
+                st.markdown("---") # 구분선(<hr>)
+
+                # 현재 문장 인덱스를 세션에서 가져옵니다.
+                idx = st.session_state.current_sentence_index
+                total = st.session_state.total_sentences
+                st.write(f"**문장 {idx + 1} / {total}**")
+
+                sentence = sentences[idx]
+                st.subheader("✅ 원본 스크립트")
+                st.write(sentence.text)
+                # 영상에서 이 문장이 나오는 구간을 보여줍니다. (분:초)
+                st.caption(
+                    f"⏱️ {int(sentence.start) // 60:02d}:{int(sentence.start) % 60:02d}"
+                    f" ~ {int(sentence.end) // 60:02d}:{int(sentence.end) % 60:02d}"
+                )
+
+                st.subheader("✍️ 당신의 받아쓰기")
+                # st.text_area: 여러 줄의 텍스트를 입력받는 UI 컴포넌트. HTML의 <textarea>와 같습니다.
+                user_input = st.text_area(
+                    "영상을 듣고 받아쓰기한 내용을 여기에 입력하세요:",
+                    value=st.session_state.user_inputs.get(idx, ""), # 세션에 저장된 값을 기본값으로 표시
+                    # 각 UI 컴포넌트는 고유한 key를 가져야 합니다. 영상 ID도 넣어야 다른 영상을 열었을 때
+                    # 이전 영상의 같은 번호 문장에 입력한 내용이 위젯 상태로 남아 새 영상의 입력으로 저장되지 않습니다.
+                    key=f"user_input_{st.session_state.video_id}_{idx}",
+                )
+                # 사용자의 입력을 다시 세션에 저장하여, 다른 버튼을 눌러도 내용이 사라지지 않게 합니다.
+                # 빈 입력은 저장하지 않으므로, 세션에는 실제로 입력한 문장만 남습니다.
+                # 입력이 바뀐 경우에만 진행 상황 저장소의 쓰기 대기열에 넣습니다.
+                if user_input != st.session_state.user_inputs.get(idx, ""):
+                    if user_id:
+                        PROGRESS_STORE.save_input(user_id, st.session_state.video_id, idx, user_input)
+                    if user_input:
+                        st.session_state.user_inputs[idx] = user_input
+                    else:
+                        st.session_state.user_inputs.pop(idx, None)
+
+                # --- 네비게이션 및 채점 버튼 ---
+                # st.columns: UI를 여러 열로 나눕니다. CSS의 Flexbox나 Grid와 유사한 레이아웃 기능입니다.
+                # 스트리밍 채점을 켜면 점수가 도착하는 즉시 보여주고, 개선할 점은 도착하는 대로 채웁니다.
+                # 스트리밍 여부와 관계없이 같은 채점 서비스(동시 요청 수, 초당 요청 수, 마감 시간, 재시도, 중복 요청 합치기)를 거칩니다.
+                streaming = st.toggle("채점 결과를 받는 대로 보기 (스트리밍)", value=True, key="stream_grading")
+                stream_request = False
+                col1, col2, col3, col4 = st.columns([1, 2, 2, 1])
+
+                with col1:
+                    # 'on_click' 콜백은 다시 실행되기 전에 호출되므로, 다시 그려질 때 바로 새 문장이 보입니다.
+                    # (st.rerun()으로 한 번 더 실행할 필요가 없습니다.)
+                    st.button("이전", disabled=(idx <= 0), on_click=move_sentence, args=(-1,))
+
+                with col2:
+                    if st.button("채점하기", use_container_width=True):
+                        if user_input and streaming:
+                            # 좁은 열 대신 버튼 아래의 넓은 영역에 결과를 흘려 그리도록 표시만 해 둡니다.
+                            stream_request = True
+                        elif user_input:
+                            with st.spinner("Gemini AI가 채점 중입니다..."):
+                                # 모든 세션이 공유하는 채점 서비스에 요청하고 결과를 세션에 저장합니다.
+                                # 서비스가 동시 요청 수, 초당 요청 수, 마감 시간, 재시도를 관리하므로 무한정 멈추지 않습니다.
+                                save_score(idx, get_grading_service().grade_sync(sentence.text, user_input))
+                        else:
+                            st.warning("받아쓰기 내용을 입력해주세요!")
+
+                with col3:
+                    # 지금까지 입력한 모든 문장을 한꺼번에 채점합니다.
+                    # 문장마다 따로 요청하지 않고 여러 문장을 묶어 보내므로 훨씬 빠릅니다.
+                    if st.button("전체 채점하기", use_container_width=True):
+                        answered = sorted(st.session_state.user_inputs)
+                        if answered:
+                            with st.spinner(f"Gemini AI가 {len(answered)}개 문장을 채점 중입니다..."):
+                                batch_results = evaluate_batch(
+                                    [
+                                        (sentences.text(i), st.session_state.user_inputs[i])
+                                        for i in answered
+                                    ]
+                                )
+                            # 결과 리스트는 요청한 순서와 같으므로, 인덱스를 맞춰 세션에 저장합니다.
+                            for i, result in zip(answered, batch_results):
+                                save_score(i, result)
+                            st.success(f"{len(answered)}개 문장의 채점을 마쳤습니다.")
+                        else:
+                            st.warning("채점할 받아쓰기 내용이 없습니다!")
+
+                with col4:
+                    st.button("다음", disabled=(idx >= total - 1), on_click=move_sentence, args=(1,))
+
+                # --- 4. 채점 결과 표시 ---
+                # 스트리밍 채점은 결과가 도착하는 대로 이 자리에 조금씩 그립니다.
+                if stream_request:
+                    live_result = st.empty()
+                    for scoring_result in get_grading_service().grade_stream(sentence.text, user_input):
+                        with live_result.container():
+                            render_result(scoring_result)
+                    # 마지막 결과는 아래에서 세션에 저장된 결과로 다시 그리므로, 중간 결과 영역은 비웁니다.
+                    live_result.empty()
+                    save_score(idx, scoring_result)
+
+                # 현재 문장에 대한 채점 결과가 세션에 있을 경우에만 결과를 표시합니다.
+                if st.session_state.scores.get(idx):
+                    # st.expander: 접고 펼 수 있는 UI 컨테이너를 만듭니다.
+                    with st.expander("채점 결과 보기", expanded=True):
+                        render_result(st.session_state.scores[idx])
+
+    dictation_panel()
+
+    # --- 5. 캐시 통계 (사이드바) ---
+    # 캐시 덕분에 줄어든 API 호출 수와 대기 시간을 보여줍니다. 스크립트 맨 끝에서 그려야 이번 실행의 채점까지 반영됩니다.
+    # 받아쓰기 영역만 다시 실행될 때는 사이드바가 그대로이므로, '새로고침' 버튼으로 이 영역만 다시 그릴 수 있습니다.
+    @st.fragment
+    def stats_panel():
+        st.subheader("📊 캐시 통계")
+        st.button("🔄 새로고침", key="refresh_stats_button")
+        grading_stats = GRADING_CACHE.stats()
+        st.metric("채점 결과 캐시 적중률", f"{grading_stats['hit_rate']:.0%}")
+        st.caption(
+            f"절약한 Gemini 호출: {grading_stats['saved_api_calls']}회 · "
+            f"예상 절약 시간: {grading_stats['estimated_saved_seconds']:.1f}초"
         )
-        # 사용자의 입력을 다시 세션에 저장하여, 다른 버튼을 눌러도 내용이 사라지지 않게 합니다.
-        st.session_state.user_inputs[idx] = user_input
-
-        # --- 네비게이션 및 채점 버튼 ---
-        # st.columns: UI를 여러 열로 나눕니다. CSS의 Flexbox나 Grid와 유사한 레이아웃 기능입니다.
-        col1, col2, col3, col4 = st.columns([1, 2, 2, 1])
-
-        with col1:
-            if st.button("이전", disabled=(idx <= 0)):
-                st.session_state.current_sentence_index -= 1
-                st.rerun() # 스크립트를 즉시 다시 실행하여 UI를 새로고침합니다.
-
-        with col2:
-            if st.button("채점하기", use_container_width=True):
-                if user_input:
-                    with st.spinner("Gemini AI가 채점 중입니다..."):
-                        # 'evaluate' 서비스 함수를 호출하고 결과를 세션에 저장합니다.
-                        scoring_result = evaluate(
-                            st.session_state.sentences[idx], user_input
-                        )
-                        st.session_state.scores[idx] = scoring_result
-                else:
-                    st.warning("받아쓰기 내용을 입력해주세요!")
-
-        with col3:
-            # 이 부분은 나중에 기능을 추가하기 위해 비워져 있습니다.
-            pass
-
-        with col4:
-            if st.button("다음", disabled=(idx >= total - 1)):
-                st.session_state.current_sentence_index += 1
-                st.rerun()
-
-        # --- 4. 채점 결과 표시 ---
-        # 현재 문장에 대한 채점 결과가 세션에 있을 경우에만 결과를 표시합니다.
-        if st.session_state.scores[idx]:
-            # st.expander: 접고 펼 수 있는 UI 컨테이너를 만듭니다.
-            with st.expander("채점 결과 보기", expanded=True):
-                scoring_results = st.session_state.scores[idx]
-
-                # API 응답에 'error' 키가 있는지 확인하여 오류를 처리합니다.
-                if "error" in scoring_results:
-                    st.error(f"채점 중 오류 발생: {scoring_results.get('error')}")
-                    st.text(f"오류 상세 내용: {scoring_results.get('details')}")
-                    st.subheader("Gemini AI 원본 응답:")
-                    st.code(scoring_results.get('raw_response'))
-                else:
-                    # 성공적인 결과 표시
-                    st.write(f"**💯 총점:** {scoring_results.get('score')}/100")
-                    st.write(
-                        f"**👍 잘한 점:** {scoring_results.get('positive_feedback')}"
+        transcript_stats = TRANSCRIPT_CACHE.stats()
+        st.metric("자막 캐시 적중률", f"{transcript_stats['hit_rate']:.0%}")
+        st.caption(
+            f"저장된 자막: {transcript_stats['entries']}개 · "
+            f"{transcript_stats['bytes'] / 1024:.0f} KB"
+        )
+        st.caption(
+            "합쳐진 중복 요청: "
+            f"자막 {TRANSCRIPT_FLIGHT.stats()['suppressed']}회 · "
+            f"채점 {GRADING_FLIGHT.stats()['suppressed'] + get_grading_service().stats()['coalesced']}회"
+        )
+        # 채점 단계별로 끝낸 요청 수/받은 요청 수와 누적 비용입니다. (여러 단계로 구성한 경우 기준값 조정에 참고합니다.)
+        cascade_stats = GRADING_CASCADE.stats()
+        if cascade_stats:
+            st.caption(
+                "채점 단계: "
+                + " · ".join(
+                    f"{tier} {tier_stats['accepted']}/{tier_stats['requests']}"
+                    for tier, tier_stats in cascade_stats.items()
+                )
+                + f" · 비용 ${sum(tier_stats['cost_usd'] for tier_stats in cascade_stats.values()):.4f}"
+            )
+        store_stats = SENTENCE_STORE.stats()
+        st.caption(
+            f"공유 문장 저장소: 영상 {store_stats['videos']}개 · "
+            f"문장 {store_stats['sentences']}개 · {store_stats['bytes'] / 1024:.0f} KB"
+        )
+        index_stats = SENTENCE_INDEX.stats()
+        st.caption(f"문장 검색 색인: 영상 {index_stats['videos']}개 · 문장 {index_stats['sentences']}개")
+
+        # 디버그용 성능 지표입니다. 구간별 소요 시간(ms)과 오류 횟수, 프롬프트 크기, 토큰 사용량을 보여줍니다.
+        # Spring Boot Actuator의 /actuator/metrics, /actuator/prometheus 엔드포인트를 화면에 띄운 것과 비슷합니다.
+        with st.expander("🔧 성능 지표 (디버그)"):
+            histogram_rows, counter_rows = METRICS.summary()
+            if histogram_rows or counter_rows:
+                table = []
+                for row in histogram_rows:
+                    # '_seconds' 지표는 밀리초(ms)로, 크기 지표(문자 수)는 그대로 보여줍니다.
+                    scale = 1000 if row["metric"].split("{")[0].endswith("_seconds") else 1
+                    table.append(
+                        {"metric": row["metric"], "count": row["count"]}
+                        | {key: round(row[key] * scale, 2) for key in ("mean", "p50", "p95", "p99")}
                     )
+                st.dataframe(table, hide_index=True)
+                if counter_rows:
+                    st.dataframe(counter_rows, hide_index=True)
+                st.download_button(
+                    "Prometheus 형식으로 내려받기",
+                    METRICS.export_prometheus(),
+                    file_name="metrics.prom",
+                    mime="text/plain",
+                )
+                st.download_button(
+                    "JSON Lines로 내려받기",
+                    METRICS.export_json_lines(),
+                    file_name="metrics.jsonl",
+                    mime="application/x-ndjson",
+                )
+            else:
+                st.caption("아직 기록된 지표가 없습니다.")
 
-                    points = scoring_results.get("points_for_improvement", [])
-                    if points:
-                        st.write("**✏️ 개선할 점:**")
-                        # 리스트를 순회하며 개선점을 하나씩 출력합니다.
-                        for point in points:
-                            st.markdown(f"- **원본:** `{point.get('original')}`")
-                            st.markdown(f"  **입력:** `{point.get('user_input')}`")
-                            st.markdown(f"  **제안:** {point.get('suggestion')}\n")
-                    else:
-                        st.info("훌륭합니다! 특별히 개선할 점이 보이지 않습니다.")
+    with st.sidebar:
+        stats_panel()
 
     st.markdown("---")
     st.info("이 앱은 Gemini AI와 YouTube Transcript API를 사용하여 만들어졌습니다.")
\ No newline at end of file
@@ -0,0 +1,231 @@
+# Java/Spring 관점에서의 설명:
+# 이 'metrics.py' 파일은 Micrometer의 MeterRegistry(Timer, Counter, DistributionSummary)와 같은 역할을 합니다.
+# 자막 가져오기, 스크립트 정리, 문장 분리, 채점 같은 주요 구간의 소요 시간과 오류 횟수, 프롬프트/응답 크기, 토큰 사용량을 기록하고,
+# Prometheus 텍스트 형식이나 JSON Lines로 내보냅니다. (Spring Boot Actuator의 /actuator/prometheus 엔드포인트와 비슷합니다.)
+
+import functools
+import json
+import threading
+import time
+from bisect import bisect_left
+
+# 지연 시간 히스토그램의 구간 경계(초)입니다. Prometheus 클라이언트의 기본 구간과 비슷하게, 1ms ~ 60s를 다룹니다.
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+# 크기(문자 수, 토큰 수) 히스토그램의 구간 경계입니다.
+SIZE_BUCKETS = (16, 64, 256, 1024, 4096, 16384, 65536, 262144, 1048576)
+
+
+def error_type(error):
+    """
+    오류를 지표용 유형 이름으로 바꿉니다. JSON 파싱 오류는 따로 'json_parse'로 구분합니다.
+    """
+    if isinstance(error, json.JSONDecodeError):
+        return "json_parse"
+    return type(error).__name__
+
+
+class Histogram:
+    """
+    값의 분포를 구간(bucket)별 개수로 기록합니다. 합계와 개수도 함께 보관하여 평균을 구할 수 있습니다.
+    """
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 '+Inf' 구간
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.count += 1
+        self.sum += value
+        # 값 이상인 첫 경계의 구간에 넣습니다. 경계보다 크면 마지막 '+Inf' 구간입니다. (이진 탐색, C 코드)
+        self.counts[bisect_left(self.buckets, value)] += 1
+
+    def quantile(self, q):
+        """
+        구간 개수로부터 분위수(예: p50, p95)를 근사합니다. 구간 안에서는 선형 보간합니다.
+        """
+        if self.count == 0:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        lower = 0.0
+        for i, bound in enumerate(self.buckets):
+            if seen + self.counts[i] >= target:
+                fraction = (target - seen) / self.counts[i] if self.counts[i] else 0.0
+                return lower + (bound - lower) * fraction
+            seen += self.counts[i]
+            lower = bound
+        return self.buckets[-1]
+
+
+class _Span:
+    """
+    'MetricsRegistry.span'이 반환하는 컨텍스트 매니저입니다.
+    채점 요청마다 여러 번 쓰이므로 @contextmanager(제너레이터) 대신 클래스로 만들어 호출 비용을 줄입니다.
+    """
+
+    __slots__ = ("registry", "name", "started")
+
+    def __init__(self, registry, name):
+        self.registry = registry
+        self.name = name
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+
+    def __exit__(self, error_class, error, traceback):
+        if error is not None:
+            self.registry.increment(f"{self.name}_errors_total", type=error_type(error))
+        self.registry.observe(
+            f"{self.name}_seconds", time.perf_counter() - self.started, buckets=LATENCY_BUCKETS
+        )
+        return False
+
+
+class MetricsRegistry:
+    """
+    프로세스 전체에서 공유하는 지표 저장소입니다. 여러 스레드(Streamlit 세션, 채점 서비스)에서 동시에 사용해도 안전합니다.
+    지표는 (이름, 라벨) 조합으로 구분합니다. 예: ('evaluate_errors_total', (('type', 'json_parse'),))
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._histograms = {}
+        self._counters = {}
+
+    @staticmethod
+    def _key(name, labels):
+        # 라벨이 없거나 하나뿐인 경우가 대부분이므로, 그때는 정렬하지 않습니다.
+        if len(labels) < 2:
+            return name, tuple(labels.items())
+        return name, tuple(sorted(labels.items()))
+
+    def observe(self, name, value, buckets=SIZE_BUCKETS, **labels):
+        """히스토그램에 값을 하나 기록합니다."""
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    def increment(self, name, amount=1, **labels):
+        """카운터를 증가시킵니다."""
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def span(self, name):
+        """
+        'with' 블록의 소요 시간을 '<name>_seconds' 히스토그램에 기록합니다.
+        블록에서 예외가 발생하면 '<name>_errors_total{type=...}' 카운터를 올리고 예외를 그대로 다시 발생시킵니다.
+
+        Java/Spring 관점:
+        - Micrometer의 'Timer.record(() -> ...)'나 '@Timed' 어노테이션과 같습니다.
+        """
+        return _Span(self, name)
+
+    def timed(self, name):
+        """함수 전체를 'span'으로 감싸는 데코레이터입니다."""
+
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(name):
+                    return func(*args, **kwargs)
+
+            return wrapper
+
+        return decorator
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+            self._counters.clear()
+
+    # --- 조회 및 내보내기 ---
+
+    def summary(self):
+        """
+        화면 표시용 요약입니다. 히스토그램마다 개수, 평균, p50, p95, p99를 담은 딕셔너리 리스트를 반환합니다.
+        """
+        with self._lock:
+            histograms = sorted(self._histograms.items())
+            counters = sorted(self._counters.items())
+            rows = [
+                {
+                    "metric": _format_name(name, labels),
+                    "count": h.count,
+                    "mean": h.sum / h.count if h.count else 0.0,
+                    "p50": h.quantile(0.50),
+                    "p95": h.quantile(0.95),
+                    "p99": h.quantile(0.99),
+                }
+                for (name, labels), h in histograms
+            ]
+            counter_rows = [
+                {"metric": _format_name(name, labels), "value": value}
+                for (name, labels), value in counters
+            ]
+        return rows, counter_rows
+
+    def export_prometheus(self):
+        """
+        Prometheus 텍스트 노출 형식(exposition format)으로 내보냅니다.
+        """
+        lines = []
+        with self._lock:
+            typed = set()
+            for (name, labels), value in sorted(self._counters.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {name} counter")
+                    typed.add(name)
+                lines.append(f"{_format_name(name, labels)} {value}")
+            for (name, labels), h in sorted(self._histograms.items()):
+                if name not in typed:
+                    lines.append(f"# TYPE {name} histogram")
+                    typed.add(name)
+                cumulative = 0
+                for bound, count in zip(h.buckets, h.counts):
+                    cumulative += count
+                    lines.append(
+                        f"{_format_name(name + '_bucket', labels + (('le', _format_bound(bound)),))} {cumulative}"
+                    )
+                lines.append(
+                    f"{_format_name(name + '_bucket', labels + (('le', '+Inf'),))} {h.count}"
+                )
+                lines.append(f"{_format_name(name + '_sum', labels)} {h.sum}")
+                lines.append(f"{_format_name(name + '_count', labels)} {h.count}")
+        return "\n".join(lines) + "\n"
+
+    def export_json_lines(self):
+        """
+        지표 하나당 JSON 한 줄로 내보냅니다. 로그 수집기(대시보드)에 바로 넣을 수 있는 형식입니다.
+        """
+        timestamp = time.time()
+        rows, counter_rows = self.summary()
+        lines = [
+            json.dumps(dict(row, kind="histogram", timestamp=timestamp), ensure_ascii=False)
+            for row in rows
+        ]
+        lines += [
+            json.dumps(dict(row, kind="counter", timestamp=timestamp), ensure_ascii=False)
+            for row in counter_rows
+        ]
+        return "\n".join(lines) + ("\n" if lines else "")
+
+
+def _format_bound(bound):
+    return repr(float(bound))
+
+
+def _format_name(name, labels):
+    if not labels:
+        return name
+    inner = ",".join(f'{key}="{value}"' for key, value in labels)
+    return f"{name}{{{inner}}}"
+
+
+# 앱 전체에서 공유하는 지표 저장소입니다.
+METRICS = MetricsRegistry()
@@ -0,0 +1,63 @@
+# Java/Spring 관점에서의 설명:
+# 이 'partial_json.py' 파일은 조각조각 도착하는 JSON 텍스트에서 '지금까지 완성된 부분'만 꺼내 주는 파서입니다.
+# Jackson의 비동기 파서(NonBlockingJsonParser)처럼 텍스트를 받은 만큼만 읽으며, 이미 읽은 부분을 다시 검사하지 않습니다.
+#
+# 예) '{"score": 85, "positive_feedback": "Go'까지 도착했다면 {"score": 85}를 돌려줍니다.
+#     값이 끝났는지는 뒤에 오는 쉼표(,)나 닫는 괄호(}, ])로 판단하므로, '8'까지만 온 숫자를 8점으로 잘못 읽지 않습니다.
+
+import json
+
+_CLOSERS = {"{": "}", "[": "]"}
+
+
+class PartialJSONParser:
+    """
+    'feed(chunk)'로 텍스트 조각을 넣으면, 완성된 값까지만 담은 객체를 반환합니다.
+    지난 호출 이후 새로 완성된 값이 없으면 None을 반환하므로, 같은 결과로 화면을 다시 그리지 않아도 됩니다.
+
+    완성된 값 직후의 위치(쉼표 앞, 닫는 괄호 뒤, 여는 괄호 뒤)를 '잘라도 되는 위치'로 기억해 두고,
+    그 위치까지의 텍스트에 아직 열려 있는 괄호를 닫아 붙인 뒤 json.loads로 파싱합니다.
+    """
+
+    def __init__(self):
+        self.text = ""
+        self._scanned = 0
+        self._stack = []
+        self._in_string = False
+        self._escape = False
+        self._cut = None  # (잘라도 되는 위치, 그 위치에서 닫아야 할 괄호들)
+
+    def feed(self, chunk):
+        self.text += chunk
+        previous_cut = self._cut
+        stack = self._stack
+        for position in range(self._scanned, len(self.text)):
+            char = self.text[position]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "{[":
+                stack.append(char)
+                self._cut = (position + 1, "".join(_CLOSERS[c] for c in reversed(stack)))
+            elif char in "}]":
+                if stack:
+                    stack.pop()
+                self._cut = (position + 1, "".join(_CLOSERS[c] for c in reversed(stack)))
+            elif char == "," and stack:
+                self._cut = (position, "".join(_CLOSERS[c] for c in reversed(stack)))
+        self._scanned = len(self.text)
+
+        if self._cut is None or self._cut == previous_cut:
+            return None
+        end, closers = self._cut
+        try:
+            return json.loads(self.text[:end] + closers)
+        except json.JSONDecodeError:
+            # 응답이 JSON 형식이 아니면 부분 결과를 만들지 않습니다. (마지막에 전체 텍스트를 파싱할 때 오류가 드러납니다.)
+            return None
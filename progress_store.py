@@ -0,0 +1,271 @@
+# Java/Spring 관점에서의 설명:
+# 이 'progress_store.py' 파일은 학습 진행 상황(현재 문장 위치, 받아쓰기 입력, 채점 결과)을 저장하는 Repository 계층입니다.
+# st.session_state는 새로고침이나 서버 재시작 시 사라지므로, (사용자, 영상)별 진행 상황을 SQLite 파일에 보관합니다.
+#
+# 쓰기는 '쓰기 지연(write-behind)' 방식입니다. 화면에서 입력하거나 이동할 때마다 디스크에 바로 쓰지 않고 메모리 큐에 넣으며,
+# 백그라운드 스레드가 일정 간격으로 모아서 한 트랜잭션으로 기록합니다. 같은 칸에 대한 여러 번의 쓰기는 마지막 값 하나로 합쳐집니다.
+# (Hibernate가 변경 내용을 모아 두었다가 flush 시점에 한꺼번에 UPDATE하는 것과 비슷합니다.)
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# 대기 중인 쓰기의 종류입니다. (user_id, video_id, 종류, 문장 번호)가 같은 쓰기는 하나로 합쳐집니다.
+_POSITION = "position"
+_INPUT = "input"
+_SCORE = "score"
+
+
+class ProgressStore:
+    """
+    (사용자, 영상)별 진행 상황을 SQLite에 저장합니다.
+
+    - save_position / save_input / save_score: 메모리 큐에 넣고 바로 반환합니다. (디스크 I/O를 기다리지 않습니다.)
+    - load: 진행 상황 전체를 쿼리 한 번으로 읽고, 아직 기록되지 않은 대기 중인 쓰기도 반영해 반환합니다.
+    - flush: 대기 중인 쓰기를 즉시 기록합니다. 프로세스가 종료될 때도 자동으로 호출됩니다.
+    """
+
+    def __init__(self, path, flush_interval=0.5):
+        self.path = path
+        self.flush_interval = flush_interval
+        self._local = threading.local()
+        self._pending = {}
+        # flush가 디스크에 쓰는 중인(아직 COMMIT하지 않은) 쓰기입니다. 그동안의 load도 이 값을 볼 수 있게 보관합니다.
+        self._inflight = {}
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._writer = None
+        self._stats = {"requested": 0, "written": 0, "flushes": 0}
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS progress (
+                    user_id TEXT NOT NULL,
+                    video_id TEXT NOT NULL,
+                    current_index INTEGER NOT NULL,
+                    updated_at REAL NOT NULL,
+                    PRIMARY KEY (user_id, video_id)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS answers (
+                    user_id TEXT NOT NULL,
+                    video_id TEXT NOT NULL,
+                    sentence_index INTEGER NOT NULL,
+                    user_input TEXT,
+                    score TEXT,
+                    PRIMARY KEY (user_id, video_id, sentence_index)
+                )
+                """
+            )
+            self._local.conn = conn
+        return conn
+
+    # --- 쓰기 (write-behind) ---
+
+    def _enqueue(self, key, value):
+        with self._condition:
+            self._stats["requested"] += 1
+            self._pending[key] = value
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._run_writer, name="progress-writer", daemon=True
+                )
+                self._writer.start()
+            self._condition.notify()
+
+    def save_position(self, user_id, video_id, index):
+        self._enqueue((user_id, video_id, _POSITION, None), index)
+
+    def save_input(self, user_id, video_id, index, text):
+        self._enqueue((user_id, video_id, _INPUT, index), text)
+
+    def save_score(self, user_id, video_id, index, result):
+        # 큐에 넣기 전에 JSON으로 바꿔 둡니다. 저장할 수 없는 값이면 호출한 쪽에서 바로 TypeError가 발생하고,
+        # 쓰기 스레드가 기록하다가 실패하는 일이 없습니다.
+        self._enqueue((user_id, video_id, _SCORE, index), json.dumps(result, ensure_ascii=False))
+
+    def _run_writer(self):
+        while True:
+            with self._condition:
+                while not self._pending:
+                    self._condition.wait()
+            # 잠시 기다리는 동안 들어온 쓰기도 함께 모아서 기록합니다.
+            time.sleep(self.flush_interval)
+            try:
+                self.flush()
+            except Exception:
+                # 어떤 오류가 있어도 쓰기 스레드는 멈추지 않고, 되돌려 둔 쓰기를 다음 주기에 다시 시도합니다.
+                # (스레드가 멈추면 이후의 쓰기가 기록되지 않고 메모리에만 쌓입니다.)
+                time.sleep(self.flush_interval)
+
+    def flush(self):
+        """
+        대기 중인 쓰기를 한 트랜잭션으로 기록하고, 기록한 개수를 반환합니다.
+        """
+        with self._flush_lock:
+            with self._condition:
+                pending, self._pending = self._pending, {}
+                self._inflight = pending
+            if not pending:
+                return 0
+
+            now = time.time()
+            positions = []
+            inputs = []
+            scores = []
+            for (user_id, video_id, kind, index), value in pending.items():
+                if kind == _POSITION:
+                    positions.append((user_id, video_id, value, now))
+                elif kind == _INPUT:
+                    inputs.append((user_id, video_id, index, value))
+                else:
+                    scores.append((user_id, video_id, index, value))
+
+            conn = None
+            try:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                # 답안만 저장된 영상도 불러올 수 있도록 progress 행을 먼저 만들어 둡니다.
+                conn.executemany(
+                    "INSERT OR IGNORE INTO progress (user_id, video_id, current_index, updated_at) "
+                    "VALUES (?, ?, 0, ?)",
+                    {(user_id, video_id, now) for user_id, video_id, _, _ in pending},
+                )
+                conn.executemany(
+                    "UPDATE progress SET current_index = ?, updated_at = ? "
+                    "WHERE user_id = ? AND video_id = ?",
+                    [(index, at, user_id, video_id) for user_id, video_id, index, at in positions],
+                )
+                conn.executemany(
+                    "INSERT INTO answers (user_id, video_id, sentence_index, user_input) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (user_id, video_id, sentence_index) DO UPDATE SET user_input = excluded.user_input",
+                    inputs,
+                )
+                conn.executemany(
+                    "INSERT INTO answers (user_id, video_id, sentence_index, score) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT (user_id, video_id, sentence_index) DO UPDATE SET score = excluded.score",
+                    scores,
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                if conn is not None and conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                # 기록하지 못한 쓰기는 큐에 되돌립니다. 그 사이에 들어온 더 새로운 값은 덮어쓰지 않습니다.
+                with self._condition:
+                    for key, value in pending.items():
+                        self._pending.setdefault(key, value)
+                    self._inflight = {}
+                raise
+
+            with self._condition:
+                # COMMIT한 뒤에야 쓰는 중인 값을 지웁니다. 이제 load는 디스크에서 이 값을 읽습니다.
+                self._inflight = {}
+                self._stats["written"] += len(pending)
+                self._stats["flushes"] += 1
+            return len(pending)
+
+    # --- 읽기 ---
+
+    def load(self, user_id, video_id):
+        """
+        진행 상황을 {"current_index", "user_inputs", "scores"} 딕셔너리로 반환합니다. 저장된 것이 없으면 None을 반환합니다.
+        user_inputs와 scores는 {문장 번호: 값} 딕셔너리입니다.
+        """
+        # 디스크 읽기와 아직 기록되지 않은 쓰기의 확인을 같은 잠금 안에서 합니다.
+        # flush는 COMMIT한 뒤 이 잠금을 잡아야 쓰는 중인 값을 지울 수 있으므로, 둘 중 한쪽에는 반드시 최신 값이 있습니다.
+        # 쓰는 중인 값 위에 대기 중인 값을 덮어써야 더 새로운 값이 남습니다.
+        # 연결(처음이면 테이블 생성)은 잠금 밖에서 준비합니다.
+        conn = self._connect()
+        with self._condition:
+            rows = conn.execute(
+                "SELECT p.current_index, a.sentence_index, a.user_input, a.score "
+                "FROM progress p LEFT JOIN answers a "
+                "ON a.user_id = p.user_id AND a.video_id = p.video_id "
+                "WHERE p.user_id = ? AND p.video_id = ?",
+                (user_id, video_id),
+            ).fetchall()
+            pending = [
+                (kind, index, value)
+                for (pending_user, pending_video, kind, index), value in self._unwritten()
+                if pending_user == user_id and pending_video == video_id
+            ]
+
+        progress = {"current_index": 0, "user_inputs": {}, "scores": {}}
+        for current_index, index, user_input, score in rows:
+            progress["current_index"] = current_index
+            if user_input:
+                progress["user_inputs"][index] = user_input
+            if score is not None:
+                progress["scores"][index] = json.loads(score)
+
+        # 아직 디스크에 기록되지 않은 쓰기도 반영합니다. (새로고침 직후에도 최신 상태를 돌려줍니다.)
+        if not rows and not pending:
+            return None
+        for kind, index, value in pending:
+            if kind == _POSITION:
+                progress["current_index"] = value
+            elif kind == _INPUT:
+                if value:
+                    progress["user_inputs"][index] = value
+                else:
+                    progress["user_inputs"].pop(index, None)
+            else:
+                progress["scores"][index] = json.loads(value)
+        return progress
+
+    def user_scores(self, user_id):
+        """
+        사용자가 모든 영상에서 받은 채점 결과를 리스트로 반환합니다. (자주 틀리는 단어로 집중 연습 세트를 만들 때 사용합니다.)
+        """
+        conn = self._connect()
+        with self._condition:
+            scores = {
+                (video_id, index): json.loads(score)
+                for video_id, index, score in conn.execute(
+                    "SELECT video_id, sentence_index, score FROM answers "
+                    "WHERE user_id = ? AND score IS NOT NULL",
+                    (user_id,),
+                )
+            }
+            for (pending_user, video_id, kind, index), value in self._unwritten():
+                if pending_user == user_id and kind == _SCORE:
+                    scores[(video_id, index)] = json.loads(value)
+        return list(scores.values())
+
+    def _unwritten(self):
+        # 디스크에 아직 없는 쓰기를 오래된 것부터 나열합니다. (쓰는 중인 값, 그다음 대기 중인 값) self._condition 안에서 호출합니다.
+        return [*self._inflight.items(), *self._pending.items()]
+
+    def stats(self):
+        """
+        요청된 쓰기 수, 실제로 기록된 행 수, 합쳐져서 생략된 쓰기 수, 대기 중인 쓰기 수를 반환합니다.
+        """
+        with self._condition:
+            stats = dict(self._stats, pending=len(self._pending))
+        stats["coalesced"] = stats["requested"] - stats["written"] - stats["pending"]
+        return stats
+
+
+# 웹 앱이 사용하는 진행 상황 저장소입니다.
+# - PROGRESS_DB_PATH: SQLite 파일 경로
+# - PROGRESS_FLUSH_INTERVAL_SECONDS: 대기 중인 쓰기를 모아서 기록하는 간격
+PROGRESS_STORE = ProgressStore(
+    path=os.environ.get("PROGRESS_DB_PATH", ".cache/progress.sqlite3"),
+    flush_interval=float(os.environ.get("PROGRESS_FLUSH_INTERVAL_SECONDS", 0.5)),
+)
+# 프로세스가 정상 종료될 때 아직 기록하지 않은 진행 상황을 디스크에 씁니다. (Spring의 @PreDestroy와 같습니다.)
+atexit.register(PROGRESS_STORE.flush)
@@ -0,0 +1,166 @@
+# Java/Spring 관점에서의 설명:
+# 이 'prompt_compaction.py' 파일은 Gemini에 보내는 채점 요청을 줄이는 전처리/후처리 단계입니다.
+# (Spring의 요청/응답 인터셉터처럼, 요청을 줄여서 보내고 돌아온 응답을 원래 문장 기준으로 되돌립니다.)
+#
+# 긴 문장에서 한두 단어만 틀렸는데도 원본과 받아쓰기 전체를 보내면, 프롬프트가 커지고 응답도 느려집니다.
+# 그래서 로컬에서 두 문장을 단어 단위로 정렬(local_scorer.align_words)한 뒤,
+# 틀린 구간과 그 앞뒤 몇 단어(context)만 '발췌(excerpt)'로 보냅니다.
+# 응답의 점수는 발췌 구간 기준이므로 전체 문장 기준으로 환산하고,
+# 개선할 점의 단어들은 전체 문장에서 같은 위치의 원래 표기(대소문자, 구두점 포함)로 바꿉니다.
+
+from local_scorer import align_words, tokenize
+
+# 발췌 구간 앞뒤에 붙일 맞은 단어 수입니다.
+CONTEXT_WORDS = 3
+# 원본이 이 단어 수보다 짧으면 줄일 것이 별로 없으므로 전체를 그대로 보냅니다.
+COMPACT_MIN_WORDS = 15
+# 발췌 구간의 단어 수가 원본의 이 비율보다 크면 (틀린 곳이 많으면) 전체를 그대로 보냅니다.
+COMPACT_MAX_RATIO = 0.6
+
+
+class CompactedRequest:
+    """
+    틀린 구간만 골라낸 채점 요청입니다.
+
+    - excerpts: (원본 발췌, 받아쓰기 발췌) 튜플의 리스트. 앞뒤가 생략되었으면 '...'가 붙어 있습니다.
+    - excerpt_words: 발췌한 원본 단어 수 / total_words: 원본 전체 단어 수
+    """
+
+    def __init__(self, original_tokens, user_tokens, windows):
+        self.original_tokens = original_tokens
+        self.user_tokens = user_tokens
+        # 발췌 구간별 (원본 토큰 위치 리스트, 받아쓰기 토큰 위치 리스트)
+        self.windows = windows
+        self.total_words = len(original_tokens)
+        self.excerpt_words = sum(len(original_positions) for original_positions, _ in windows)
+
+    @property
+    def excerpts(self):
+        excerpts = []
+        for original_positions, user_positions in self.windows:
+            excerpts.append(
+                (
+                    _excerpt_text(self.original_tokens, original_positions),
+                    _excerpt_text(self.user_tokens, user_positions),
+                )
+            )
+        return excerpts
+
+    def format_prompt(self, template):
+        excerpts = "\n\n".join(
+            f"**[Excerpt {number}]**\n"
+            f"Original Script: {original}\n"
+            f"Student's Dictation: {user}"
+            for number, (original, user) in enumerate(self.excerpts, start=1)
+        )
+        return template.format(
+            excerpts=excerpts,
+            matched_words=self.total_words - self.excerpt_words,
+            total_words=self.total_words,
+        )
+
+    def expand(self, result):
+        """
+        발췌 구간 기준의 채점 결과를 전체 문장 기준으로 되돌립니다. 스트리밍 중의 부분 결과도 받을 수 있습니다.
+
+        - 점수: 생략한 단어는 모두 맞았으므로, 발췌 구간에서 잃은 점수를 전체 단어 수에 대한 비율로 줄입니다.
+          예) 30단어 중 6단어를 발췌해 60점이면 100 - 40 * 6 / 30 = 92점
+        - 개선할 점: 'excerpt' 번호를 지우고, 'original'/'user_input'을 전체 문장에서 찾은 원래 표기로 바꿉니다.
+        """
+        expanded = dict(result)
+        if isinstance(result.get("score"), int):
+            lost = 100 - result["score"]
+            expanded["score"] = round(100 - lost * self.excerpt_words / max(self.total_words, 1))
+        points = result.get("points_for_improvement")
+        if isinstance(points, list):
+            expanded["points_for_improvement"] = [self._expand_point(point) for point in points]
+        return expanded
+
+    def _expand_point(self, point):
+        point = dict(point)
+        excerpt = point.pop("excerpt", None)
+        if isinstance(excerpt, int) and 1 <= excerpt <= len(self.windows):
+            candidates = [self.windows[excerpt - 1]]
+        else:
+            # 번호가 없거나 잘못되었으면 모든 발췌 구간에서 찾습니다.
+            candidates = self.windows
+        for key, tokens, side in (
+            ("original", self.original_tokens, 0),
+            ("user_input", self.user_tokens, 1),
+        ):
+            if not isinstance(point.get(key), str):
+                continue
+            for window in candidates:
+                surface = _find_surface(point[key], tokens, window[side])
+                if surface is not None:
+                    point[key] = surface
+                    break
+        return point
+
+
+def _excerpt_text(tokens, positions):
+    if not positions:
+        return "(nothing)"
+    text = " ".join(tokens[position][0] for position in positions)
+    if positions[0] > 0:
+        text = "... " + text
+    if positions[-1] < len(tokens) - 1:
+        text += " ..."
+    return text
+
+
+def _find_surface(phrase, tokens, positions):
+    """
+    발췌 구간(positions) 안에서 phrase와 같은 단어들(정규화 기준)을 찾아, 그 위치의 원래 표기를 반환합니다.
+    """
+    wanted = [normalized for _, normalized in tokenize(phrase)]
+    if not wanted:
+        return None
+    for start in range(len(positions) - len(wanted) + 1):
+        window = positions[start:start + len(wanted)]
+        if [tokens[position][1] for position in window] == wanted:
+            return " ".join(tokens[position][0] for position in window)
+    return None
+
+
+def compact(original_text, user_text, context=CONTEXT_WORDS):
+    """
+    줄여서 보낼 만하면 CompactedRequest를, 아니면 None을 반환합니다. (짧은 문장, 틀린 곳이 많은 문장, 틀린 곳이 없는 문장)
+    """
+    # 토큰은 공백으로 나눈 단어 중 일부이므로, 공백으로 나눈 단어 수가 모자라면 토큰화하지 않고 바로 끝냅니다.
+    # (채점 요청 대부분은 짧은 문장이므로, 요청마다 드는 비용을 줄입니다.)
+    if len(original_text.split()) < COMPACT_MIN_WORDS:
+        return None
+    original_tokens = tokenize(original_text)
+    if len(original_tokens) < COMPACT_MIN_WORDS:
+        return None
+    user_tokens = tokenize(user_text)
+    operations = align_words(
+        [normalized for _, normalized in original_tokens],
+        [normalized for _, normalized in user_tokens],
+    )
+
+    # 틀린 연산에서 앞뒤로 'context'개 안에 있는 연산을 포함하고, 겹치거나 맞닿은 구간은 하나로 합칩니다.
+    ranges = []
+    for index, (op, _, _) in enumerate(operations):
+        if op == "equal":
+            continue
+        start, end = max(0, index - context), min(len(operations), index + context + 1)
+        if ranges and start <= ranges[-1][1]:
+            ranges[-1][1] = max(ranges[-1][1], end)
+        else:
+            ranges.append([start, end])
+    if not ranges:
+        return None
+
+    windows = [
+        (
+            [i for _, i, _ in operations[start:end] if i is not None],
+            [j for _, _, j in operations[start:end] if j is not None],
+        )
+        for start, end in ranges
+    ]
+    request = CompactedRequest(original_tokens, user_tokens, windows)
+    if request.excerpt_words > COMPACT_MAX_RATIO * request.total_words:
+        return None
+    return request
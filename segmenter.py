@@ -0,0 +1,221 @@
+# Java/Spring 관점에서의 설명:
+# 이 'segmenter.py' 파일은 문장 분리만 담당하는 작은 엔진(Java의 'java.text.BreakIterator.getSentenceInstance()'와 비슷)입니다.
+# 'split_into_sentences'와 'stream_sentences'가 모두 이 모듈을 사용하므로, 두 경로의 결과가 항상 같습니다.
+#
+# 규칙:
+# 1. 문장 부호(. ? !) 뒤에 공백이 오면 문장을 나눕니다.
+# 2. 'Mr.', 'Dr.', 'e.g.' 같은 약어와 'J. K. Rowling'처럼 이어진 이니셜 뒤에서는 나누지 않습니다.
+#    대문자 한 글자 뒤의 마침표는 앞이나 뒤에 다른 이니셜이 있을 때만 이니셜로 봅니다. ('Plan B.', 'vitamin C.'는 문장 끝입니다.)
+# 3. 'U.S.', 'a.m.', 'etc.' 같은 약어는 문장 끝에도 자주 오므로, 다음 단어가 대문자로 시작할 때만 나눕니다.
+# 4. 자동 생성 자막처럼 문장 부호가 없으면, 자막 사이의 긴 쉼(pause)이나 최대 단어 수를 기준으로 끊습니다.
+#
+# 모든 처리는 입력을 한 번만 훑는 선형 시간(O(n))이며, 약어 사전은 모듈을 불러올 때 한 번만 만듭니다.
+
+import re
+from itertools import compress, repeat
+
+# 뒤에서 문장을 나누지 않는 약어입니다. (소문자, 마침표 포함)
+ABBREVIATIONS = frozenset(
+    """
+    mr. mrs. ms. dr. prof. sr. jr. st. mt. ft. gen. col. capt. lt. sgt. rev. hon. gov. sen. rep. pres.
+    e.g. i.e. cf. vs. approx. dept. est. fig. no. vol. ch. pp. ave. blvd.
+    jan. feb. mar. apr. jun. jul. aug. sep. sept. oct. nov. dec.
+    """.split()
+)
+# 문장 끝에도 자주 오는 약어입니다. 다음 단어가 대문자로 시작할 때만 문장을 나눕니다.
+AMBIGUOUS_ABBREVIATIONS = frozenset(
+    """
+    u.s. u.k. u.n. u.s.a. e.u. d.c. a.m. p.m. etc. inc. ltd. co. corp. al.
+    """.split()
+)
+
+# 문장 부호가 없는 자막을 끊는 기준입니다.
+# - MAX_SENTENCE_WORDS: 한 문장의 최대 단어 수. 이보다 길면 끊습니다. (채점 비용과 받아쓰기 난이도를 제한합니다.)
+# - PAUSE_SECONDS: 자막 조각 사이의 쉼이 이 시간 이상이면 문장 경계로 봅니다.
+# - PAUSE_MIN_WORDS: 쉼으로 끊기 위한 최소 단어 수. 짧은 쉼마다 문장이 잘게 나뉘는 것을 막습니다.
+MAX_SENTENCE_WORDS = 30
+PAUSE_SECONDS = 1.0
+PAUSE_MIN_WORDS = 6
+
+_OPENERS = "\"'([“‘"
+
+
+def _forms(words):
+    """
+    약어마다 소문자/첫 글자 대문자/전체 대문자 형태를 만듭니다. ('mr.' -> 'mr.', 'Mr.', 'MR.')
+    대소문자 무시 옵션(re.IGNORECASE)보다 정확한 문자열 비교가 정규 표현식 엔진에서 훨씬 빠릅니다.
+    """
+    return frozenset(form for word in words for form in (word, word.capitalize(), word.upper()))
+
+
+_ABBREVIATION_FORMS = _forms(ABBREVIATIONS)
+_AMBIGUOUS_FORMS = _forms(AMBIGUOUS_ABBREVIATIONS)
+
+
+def _not_after(forms):
+    """
+    '공백 바로 앞이 이 단어들 중 하나가 아닐 때'를 뜻하는 부정 후방 탐색(negative lookbehind) 패턴을 만듭니다.
+    Python의 후방 탐색은 고정 길이만 허용하므로, 단어 길이별로 하나씩 만듭니다.
+    단어 앞은 공백, 여는 따옴표/괄호 또는 텍스트 시작이어야 합니다. ('x-mr.'는 약어로 보지 않습니다.)
+    """
+    by_length = {}
+    for form in sorted(forms):
+        by_length.setdefault(len(form), []).append(re.escape(form))
+    return "".join(
+        rf"(?<!(?<![^\s{re.escape(_OPENERS)}])(?:{'|'.join(group)})\s)"
+        for group in by_length.values()
+    )
+
+
+# 'split_text'가 사용하는 분리 패턴입니다. 약어 사전을 모듈을 불러올 때 한 번만 정규 표현식으로 컴파일합니다.
+# 공백이
+# 1. 문장 부호(. ? !) 바로 뒤이고
+# 2. '?'/'!' 뒤이거나, 약어 바로 뒤가 아니고, 이어진 이니셜('J. K.')의 중간이 아니며
+# 3. 애매한 약어('U.S.') 바로 뒤라면 다음 단어가 대문자로 시작할 때
+# 거기서 나눕니다. 패턴이 후방 탐색이 아니라 공백(\s)으로 시작하므로, 정규 표현식 엔진이 공백이 아닌 글자를 C 코드 안에서
+# 한꺼번에 건너뜁니다. 대부분의 공백은 첫 번째 검사에서 바로 탈락하고, '?'/'!' 뒤에서는 약어 검사를 하지 않으므로
+# 이전의 한 줄 정규 표현식('(?<=[.?!])\s+')에 가까운 속도입니다.
+_SPLIT_PATTERN = re.compile(
+    r"\s(?<=[.?!]\s)"
+    + r"(?:(?<=[?!]\s)|"
+    + _not_after(_ABBREVIATION_FORMS)
+    + rf"(?!(?<=(?<![^\s{re.escape(_OPENERS)}])[A-Z]\.\s)"
+    + rf"(?:(?=\s*[{re.escape(_OPENERS)}]*[A-Z]\.(?:\s|$))|(?<=(?<![^\s{re.escape(_OPENERS)}])[A-Z]\.\s[A-Z]\.\s)))"
+    + rf"(?:{_not_after(_AMBIGUOUS_FORMS)}|(?=\s*[A-Z])))"
+    + r"\s*"
+)
+_NOISE_PATTERN = re.compile(r"\[.*?\]")
+
+_NO_BREAK = 0
+_BREAK = 1
+_BREAK_IF_CAPITAL = 2
+_BREAK_UNLESS_INITIAL = 3
+
+
+def _is_initial(word):
+    # 'J.'처럼 대문자 한 글자 뒤에 마침표가 있는 단어입니다. (여는 따옴표/괄호는 무시합니다.)
+    key = word.lstrip(_OPENERS)
+    return len(key) == 2 and "A" <= key[0] <= "Z" and key[1] == "."
+
+
+def _boundary(word):
+    """
+    단어 뒤가 문장 경계인지 판단합니다. ('split_text'의 분리 패턴과 같은 규칙입니다.)
+    """
+    if word[-1] != ".":
+        return _BREAK if word[-1] in "?!" else _NO_BREAK
+    key = word.lstrip(_OPENERS)
+    if key in _ABBREVIATION_FORMS:
+        return _NO_BREAK
+    if _is_initial(key):
+        # 이니셜인지는 앞뒤 단어를 봐야 압니다. ('J. K. Rowling'은 이어 가고, 'Plan B. Then'은 나눕니다.)
+        return _BREAK_UNLESS_INITIAL
+    if key in _AMBIGUOUS_FORMS:
+        return _BREAK_IF_CAPITAL
+    return _BREAK
+
+
+def _chunk(sentence, max_words):
+    """
+    너무 긴 문장을 최대 단어 수 단위로 나눕니다. (문장 부호가 없는 자막 대비)
+    """
+    words = sentence.split()
+    if len(words) <= max_words:
+        return [sentence]
+    return [" ".join(words[i:i + max_words]) for i in range(0, len(words), max_words)]
+
+
+def split_text(text, max_words=MAX_SENTENCE_WORDS):
+    """
+    문자열을 문장 리스트로 나눕니다. 각 문장의 양쪽 공백은 제거하고, 빈 문장은 제외합니다.
+
+    분리 위치는 약어 사전까지 포함해 미리 컴파일한 정규 표현식(_SPLIT_PATTERN) 하나로 찾으므로,
+    텍스트 전체를 한 번만 훑는 선형 시간이며 Python 코드로 단어마다 검사하지 않습니다.
+    """
+    # 분리 지점의 공백은 패턴이 모두 가져가므로, 양 끝만 정리하면 각 문장을 다시 strip할 필요가 없습니다.
+    # (clean_script의 결과처럼 이미 정리된 긴 텍스트는 복사하지 않습니다.)
+    if text[:1].isspace() or text[-1:].isspace():
+        text = text.strip()
+    if not text:
+        return []
+    sentences = _SPLIT_PATTERN.split(text)
+
+    # 문장마다 공백 수를 세고 너무 긴 문장의 위치를 고르는 것도 'map'/'compress'로 C 코드 안에서 처리합니다.
+    # 긴 문장이 하나라도 있을 때 모든 문장을 Python 코드로 다시 훑지 않도록, 긴 문장만 나누고 나머지는 조각째로 복사합니다.
+    long_positions = list(
+        compress(range(len(sentences)), map(max_words.__le__, map(str.count, sentences, repeat(" "))))
+    )
+    if not long_positions:
+        return sentences
+    result = []
+    previous = 0
+    for position in long_positions:
+        result += sentences[previous:position]
+        result += _chunk(sentences[position], max_words)
+        previous = position + 1
+    result += sentences[previous:]
+    return result
+
+
+def segment_transcript(
+    snippets,
+    max_words=MAX_SENTENCE_WORDS,
+    pause_seconds=PAUSE_SECONDS,
+    pause_min_words=PAUSE_MIN_WORDS,
+):
+    """
+    자막 조각(텍스트, 시작 시간, 길이)을 하나씩 읽으면서 (문장, 시작 시간, 끝 시간) 튜플을 내보내는 제너레이터입니다.
+
+    - 대괄호([])로 묶인 부분은 조각 하나 안에서 제거합니다. ('[Music]' 같은 표기는 항상 한 조각 안에 있습니다.)
+    - 문장 부호로 나누는 규칙은 'split_text'와 같습니다.
+    - 조각 사이의 쉼이 'pause_seconds' 이상이고 지금까지 'pause_min_words' 단어 이상 모였으면 문장을 끊습니다.
+    - 'max_words' 단어가 모이면 문장 부호가 없어도 끊습니다.
+    """
+    words = []
+    sentence_start = None
+    sentence_end = None
+    previous_end = None
+    # 직전 단어가 'U.S.'처럼 애매한 약어였으면 다음 단어가 대문자일 때, 'B.'처럼 홀로 선 이니셜이었으면
+    # 다음 단어가 이니셜이 아닐 때 문장을 나눕니다.
+    pending = _NO_BREAK
+
+    for text, start, duration in snippets:
+        end = start + duration
+        if (
+            len(words) >= pause_min_words
+            and previous_end is not None
+            and start - previous_end >= pause_seconds
+        ):
+            yield " ".join(words), sentence_start, sentence_end
+            words = []
+            pending = _NO_BREAK
+        previous_end = end
+
+        for word in _NOISE_PATTERN.sub("", text).split():
+            if pending:
+                if ("A" <= word[0] <= "Z") if pending == _BREAK_IF_CAPITAL else not _is_initial(word):
+                    yield " ".join(words), sentence_start, sentence_end
+                    words = []
+                pending = _NO_BREAK
+            if not words:
+                sentence_start = start
+            words.append(word)
+            sentence_end = end
+            if word[-1] in ".?!":
+                kind = _boundary(word)
+                if kind == _BREAK:
+                    yield " ".join(words), sentence_start, sentence_end
+                    words = []
+                    continue
+                if kind == _BREAK_UNLESS_INITIAL and len(word) == 2 and len(words) > 1 and _is_initial(words[-2]):
+                    # 'J. K.'의 'K.'처럼 이니셜 바로 뒤의 이니셜은 이름의 일부입니다.
+                    kind = _NO_BREAK
+                pending = kind
+            if len(words) >= max_words:
+                yield " ".join(words), sentence_start, sentence_end
+                words = []
+                pending = _NO_BREAK
+
+    # 문장 부호 없이 끝난 마지막 부분도 하나의 문장으로 내보냅니다.
+    if words:
+        yield " ".join(words), sentence_start, sentence_end
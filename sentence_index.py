@@ -0,0 +1,300 @@
+# Java/Spring 관점에서의 설명:
+# 이 'sentence_index.py' 파일은 코퍼스의 모든 문장에 대한 역색인(inverted index)입니다. (Lucene 색인을 아주 작게 만든 것과 같습니다.)
+# 단어(와 연속된 두 단어)마다 그 단어가 나오는 (영상, 문장 번호) 목록을 저장해 두므로,
+# "이 단어들이 들어간 문장"을 찾을 때 자막 전체를 다시 읽지 않고 색인만 읽으면 됩니다.
+#
+# 학습자가 자주 틀리는 단어(채점 결과의 'points_for_improvement')로 다른 영상의 문장을 찾아
+# 집중 연습 세트(drill set)를 만드는 데 사용합니다.
+#
+# - 색인은 영상 단위로 갱신됩니다. 새 영상이 코퍼스에 저장될 때 그 영상의 행만 지우고 다시 씁니다.
+# - 한 행은 (단어, 영상 ID) 하나이고, 문장 번호 목록은 'array("I")'를 바이트로 만든 BLOB입니다.
+#   'the'처럼 흔한 단어도 영상 수만큼의 행만 읽으면 되므로, 문장이 수십만 개여도 조회가 수 밀리초 안에 끝납니다.
+
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from collections import Counter, defaultdict
+
+from local_scorer import tokenize
+from metrics import METRICS, LATENCY_BUCKETS
+from youtube_script_processor import Sentence
+
+# 집중 연습 세트의 영상 ID는 이 접두사 뒤에 '영상ID.문장번호'를 쉼표로 이어 붙인 것입니다. (예: 'drill:AAAAAAAAAAA.3,BBBBBBBBBBB.12')
+# 세트의 내용이 ID 자체에 들어 있으므로 따로 저장하지 않아도, 새로고침이나 서버 재시작 뒤에 코퍼스에서 다시 만들 수 있습니다.
+DRILL_PREFIX = "drill:"
+
+
+def _terms(text):
+    """
+    문장의 색인어 집합을 반환합니다. 정규화한 단어 하나하나와, 연속된 두 단어('went home')입니다.
+    정규화는 로컬 채점(local_scorer.tokenize)과 같으므로, 채점 결과의 단어를 그대로 검색어로 쓸 수 있습니다.
+    """
+    words = [normalized for _, normalized in tokenize(text)]
+    terms = set(words)
+    terms.update(f"{first} {second}" for first, second in zip(words, words[1:]))
+    return terms
+
+
+def _query_terms(phrase):
+    """
+    검색어 하나를 색인어 목록으로 바꿉니다. 한 단어면 그 단어, 여러 단어면 연속된 두 단어들입니다.
+    세 단어 이상의 구절은 두 단어씩 모두 들어 있는 문장을 찾으므로, 드물게 순서가 다른 문장도 포함될 수 있습니다.
+    """
+    words = [normalized for _, normalized in tokenize(phrase)]
+    if len(words) <= 1:
+        return words
+    return [f"{first} {second}" for first, second in zip(words, words[1:])]
+
+
+def _match_phrase(postings, terms, video_id):
+    """
+    영상 하나에서 구절의 색인어가 모두 나오는 문장 번호 집합을 반환합니다.
+    """
+    matched = None
+    for term in terms:
+        indexes = postings.get(term, {}).get(video_id)
+        if indexes is None:
+            return set()
+        if matched is None:
+            matched = set(indexes)
+        else:
+            matched.intersection_update(indexes)
+        if not matched:
+            break
+    return matched
+
+
+class SentenceIndex:
+    """
+    (단어, 영상) → 문장 번호 목록을 SQLite에 저장하는 역색인입니다.
+
+    - add_video(video_id, sentences): 영상 하나를 (다시) 색인합니다. 이전 색인은 같은 트랜잭션에서 지웁니다.
+    - sync(corpus): 코퍼스에 있지만 아직 색인하지 않은 영상만 색인합니다.
+    - search(phrases): 검색어가 들어 있는 (영상 ID, 문장 번호, 일치한 검색어 수)를 많이 일치한 순서로 반환합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            # (단어, 영상)으로 정렬된 채 저장되도록 WITHOUT ROWID 테이블을 사용합니다. 단어로 찾는 조회가 범위 읽기 한 번이 됩니다.
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS postings (
+                    term TEXT NOT NULL,
+                    video_id TEXT NOT NULL,
+                    sentences BLOB NOT NULL,
+                    PRIMARY KEY (term, video_id)
+                ) WITHOUT ROWID
+                """
+            )
+            # 영상을 다시 색인할 때 그 영상의 행만 찾아 지우기 위한 보조 색인입니다.
+            conn.execute("CREATE INDEX IF NOT EXISTS postings_video ON postings (video_id)")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS indexed_videos (
+                    video_id TEXT PRIMARY KEY,
+                    sentence_count INTEGER NOT NULL,
+                    term_count INTEGER NOT NULL,
+                    indexed_at REAL NOT NULL
+                )
+                """
+            )
+            self._local.conn = conn
+        return conn
+
+    # --- 색인 ---
+
+    def add_video(self, video_id, sentences):
+        """
+        영상 하나의 문장 목록(Sentence, [텍스트, 시작, 끝] 또는 VideoSentences)을 색인하고, 색인어 수를 반환합니다.
+        """
+        postings = defaultdict(lambda: array("I"))
+        count = 0
+        for index, sentence in enumerate(sentences):
+            text = sentence.text if isinstance(sentence, Sentence) else sentence[0]
+            for term in _terms(text):
+                postings[term].append(index)
+            count += 1
+
+        conn = self._connect()
+        with METRICS.span("sentence_index_add_video"):
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                # 같은 영상을 다시 색인하는 경우 이전 색인을 지웁니다.
+                conn.execute("DELETE FROM postings WHERE video_id = ?", (video_id,))
+                conn.executemany(
+                    "INSERT INTO postings (term, video_id, sentences) VALUES (?, ?, ?)",
+                    ((term, video_id, indexes.tobytes()) for term, indexes in postings.items()),
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO indexed_videos (video_id, sentence_count, term_count, indexed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (video_id, count, len(postings), time.time()),
+                )
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+        return len(postings)
+
+    def sync(self, corpus):
+        """
+        코퍼스에 있지만 아직 색인하지 않은 영상을 색인하고, 새로 색인한 영상 수를 반환합니다.
+        (색인 기능이 생기기 전에 저장된 영상이나, 다른 코퍼스에서 복사해 온 영상을 채워 넣습니다.)
+        """
+        indexed = set(self.video_ids())
+        added = 0
+        for video_id in corpus.video_ids():
+            if video_id in indexed:
+                continue
+            sentences = corpus.get(video_id)
+            if sentences:
+                self.add_video(video_id, sentences)
+                added += 1
+        return added
+
+    def video_ids(self):
+        return [
+            video_id
+            for (video_id,) in self._connect().execute(
+                "SELECT video_id FROM indexed_videos ORDER BY video_id"
+            )
+        ]
+
+    # --- 조회 ---
+
+    def search(self, phrases, limit=20, match_all=True, exclude_videos=()):
+        """
+        검색어(단어 또는 구절) 목록으로 문장을 찾아 (영상 ID, 문장 번호, 일치한 검색어 수) 리스트를 반환합니다.
+
+        - match_all=True: 모든 검색어가 들어 있는 문장만 반환합니다.
+        - match_all=False: 하나라도 들어 있는 문장을, 많이 일치한 순서로 반환합니다. (집중 연습 세트용)
+        - exclude_videos: 결과에서 뺄 영상 ID (예: 지금 연습 중인 영상)
+        """
+        queries = [terms for terms in (_query_terms(phrase) for phrase in phrases) if terms]
+        if not queries:
+            return []
+
+        started = time.perf_counter()
+        unique_terms = sorted({term for terms in queries for term in terms})
+        placeholders = ",".join("?" * len(unique_terms))
+        # 단어 하나당 (영상 수)개의 행만 읽습니다.
+        postings = defaultdict(dict)
+        for term, video_id, blob in self._connect().execute(
+            f"SELECT term, video_id, sentences FROM postings WHERE term IN ({placeholders})",
+            unique_terms,
+        ):
+            if video_id not in exclude_videos:
+                indexes = array("I")
+                indexes.frombytes(blob)
+                postings[term][video_id] = indexes
+
+        # 구절마다, 색인어를 가장 드문 것부터 확인하도록 정렬해 둡니다. 교집합의 크기가 처음부터 작아집니다.
+        queries = [sorted(terms, key=lambda term: len(postings.get(term, ()))) for terms in queries]
+        if match_all:
+            # 모든 검색어가 일치해야 하므로, 첫 검색어가 나오는 영상만 확인하면 됩니다.
+            videos = postings.get(queries[0][0], {}).keys()
+        else:
+            videos = {video_id for terms in queries for video_id in postings.get(terms[0], {})}
+
+        needed = len(queries) if match_all else 1
+        # 영상별로 (가장 많이 일치한 수, {문장 번호: 일치한 검색어 수})를 셉니다.
+        # 집합 연산과 Counter.update는 C로 구현되어 있으므로, 흔한 단어라도 문장마다 파이썬 코드를 실행하지 않습니다.
+        hits = {}
+        for video_id in videos:
+            if match_all:
+                matched = None
+                for terms in queries:
+                    phrase_matches = _match_phrase(postings, terms, video_id)
+                    matched = phrase_matches if matched is None else matched & phrase_matches
+                    if not matched:
+                        break
+                if matched:
+                    hits[video_id] = (len(queries), dict.fromkeys(matched, len(queries)))
+            else:
+                counts = Counter()
+                for terms in queries:
+                    counts.update(_match_phrase(postings, terms, video_id))
+                if counts:
+                    hits[video_id] = (max(counts.values()), counts)
+
+        # 많이 일치한 순서, 같으면 (영상 ID, 문장 번호) 순서입니다. 'limit'개를 채우면 나머지 문장은 보지 않습니다.
+        results = []
+        for level in range(len(queries), needed - 1, -1):
+            for video_id in sorted(hits):
+                top, counts = hits[video_id]
+                if top < level:
+                    continue
+                indexes = sorted(index for index, count in counts.items() if count == level)
+                results.extend((video_id, index, level) for index in indexes[:limit - len(results)])
+                if len(results) >= limit:
+                    break
+            if len(results) >= limit:
+                break
+        METRICS.observe(
+            "sentence_index_query_seconds", time.perf_counter() - started, LATENCY_BUCKETS
+        )
+        return results
+
+    def stats(self):
+        videos, sentences = self._connect().execute(
+            "SELECT COUNT(*), COALESCE(SUM(sentence_count), 0) FROM indexed_videos"
+        ).fetchone()
+        return {"videos": videos, "sentences": sentences}
+
+
+# --- 집중 연습 세트 ---
+
+
+def mistake_phrases(scoring_results, limit=5):
+    """
+    채점 결과 목록에서 학습자가 자주 틀린 원본 구절('points_for_improvement'의 'original')을 많이 틀린 순서로 반환합니다.
+    같은 구절은 대소문자/구두점을 무시하고 하나로 셉니다.
+    """
+    counts = Counter()
+    for result in scoring_results:
+        for point in (result or {}).get("points_for_improvement") or []:
+            phrase = " ".join(normalized for _, normalized in tokenize(point.get("original") or ""))
+            if phrase:
+                counts[phrase] += 1
+    return [phrase for phrase, _ in counts.most_common(limit)]
+
+
+def drill_id(matches):
+    """search 결과(영상 ID, 문장 번호, ...)로 집중 연습 세트의 영상 ID를 만듭니다."""
+    return DRILL_PREFIX + ",".join(f"{video_id}.{index}" for video_id, index, *_ in matches)
+
+
+def is_drill(video_id):
+    return bool(video_id) and video_id.startswith(DRILL_PREFIX)
+
+
+def load_drill(video_id, corpus):
+    """
+    집중 연습 세트의 영상 ID에 담긴 문장들을 코퍼스에서 불러와 Sentence 리스트로 반환합니다.
+    코퍼스에서 사라진 문장은 건너뛰며, 하나도 없으면 None을 반환합니다.
+    """
+    videos = {}
+    sentences = []
+    for reference in video_id[len(DRILL_PREFIX):].split(","):
+        source, _, index = reference.rpartition(".")
+        if source not in videos:
+            videos[source] = corpus.get(source) or []
+        if index.isdigit() and int(index) < len(videos[source]):
+            sentences.append(videos[source][int(index)])
+    return sentences or None
+
+
+# 웹 앱과 CLI가 기본으로 사용하는 문장 색인입니다. SENTENCE_INDEX_PATH 환경 변수로 위치를 바꿀 수 있습니다.
+SENTENCE_INDEX = SentenceIndex(os.environ.get("SENTENCE_INDEX_PATH", ".cache/sentence_index.sqlite3"))
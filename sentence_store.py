@@ -0,0 +1,143 @@
+# Java/Spring 관점에서의 설명:
+# 이 'sentence_store.py' 파일은 모든 사용자 세션이 함께 읽는 애플리케이션 범위(@ApplicationScope)의 읽기 전용 캐시와 같습니다.
+# 같은 영상을 여러 사용자가 연습해도 문장 데이터는 프로세스에 한 벌만 보관하고,
+# 각 세션(HttpSession에 해당하는 st.session_state)에는 영상 ID와 현재 위치, 사용자가 실제로 입력한 내용만 저장합니다.
+
+import os
+import sys
+import threading
+from array import array
+from collections import OrderedDict
+
+from youtube_script_processor import Sentence
+
+
+class VideoSentences:
+    """
+    영상 하나의 문장 목록을 변경할 수 없는(immutable) 형태로 압축해 보관합니다.
+
+    - 모든 문장의 텍스트를 하나의 문자열(buffer)로 이어 붙이고, 각 문장의 시작 위치를 'array'에 저장합니다.
+    - 시작/끝 시간도 'array("d")'(double 배열)에 저장하므로, 문장마다 Python 객체를 만들지 않습니다.
+    - 'sentences[i]'처럼 접근하면 그때 Sentence 객체를 만들어 반환합니다. (리스트와 같은 방식으로 사용할 수 있습니다.)
+
+    Java/Spring 관점:
+    - 'List<Sentence>' 대신 'String' 하나와 'int[]', 'double[]' 배열을 쓰는 구조(Structure of Arrays)입니다.
+      객체 헤더와 참조가 없으므로 문장 수천 개짜리 영상에서 메모리가 크게 줄어듭니다.
+    """
+
+    __slots__ = ("video_id", "_buffer", "_offsets", "_starts", "_ends")
+
+    def __init__(self, video_id, sentences):
+        texts = []
+        offsets = array("Q", [0])
+        starts = array("d")
+        ends = array("d")
+        position = 0
+        for sentence in sentences:
+            text, start, end = (
+                (sentence.text, sentence.start, sentence.end)
+                if isinstance(sentence, Sentence)
+                else sentence
+            )
+            texts.append(text)
+            position += len(text)
+            offsets.append(position)
+            starts.append(start)
+            ends.append(end)
+        self.video_id = video_id
+        self._buffer = "".join(texts)
+        self._offsets = offsets
+        self._starts = starts
+        self._ends = ends
+
+    def __len__(self):
+        return len(self._starts)
+
+    def text(self, index):
+        """문장 하나의 텍스트만 반환합니다. Sentence 객체를 만들지 않으므로 가장 가볍습니다."""
+        return self._buffer[self._offsets[index]:self._offsets[index + 1]]
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("sentence index out of range")
+        return Sentence(self.text(index), self._starts[index], self._ends[index])
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def nbytes(self):
+        """버퍼와 배열이 차지하는 대략적인 메모리 크기(바이트)입니다."""
+        return (
+            sys.getsizeof(self._buffer)
+            + sys.getsizeof(self._offsets)
+            + sys.getsizeof(self._starts)
+            + sys.getsizeof(self._ends)
+        )
+
+
+class SentenceStore:
+    """
+    영상 ID별 VideoSentences를 프로세스 전체에서 공유하는 저장소입니다.
+    최근에 사용한 영상 'max_videos'개까지 메모리에 보관하고(LRU), 밀려난 영상은 'get_or_load'가 다시 불러옵니다.
+    세션은 영상 ID만 가지고 있으므로, 밀려난 영상을 다시 불러와도 세션 상태는 그대로 유지됩니다.
+
+    Java/Spring 관점:
+    - 'ConcurrentHashMap.computeIfAbsent()'로 채우는 공유 캐시와 같습니다.
+    """
+
+    def __init__(self, max_videos=64):
+        self.max_videos = max_videos
+        self._videos = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, video_id):
+        with self._lock:
+            video = self._videos.get(video_id)
+            if video is not None:
+                self._videos.move_to_end(video_id)
+            return video
+
+    def put(self, video_id, sentences):
+        """
+        문장 목록을 저장하고 VideoSentences를 반환합니다.
+        다른 세션이 먼저 같은 영상을 저장했다면 새로 만들지 않고 이미 있는 것을 반환하므로, 영상마다 항상 한 벌만 남습니다.
+        """
+        video = VideoSentences(video_id, sentences)
+        with self._lock:
+            existing = self._videos.get(video_id)
+            if existing is not None:
+                self._videos.move_to_end(video_id)
+                return existing
+            self._videos[video_id] = video
+            while len(self._videos) > self.max_videos:
+                self._videos.popitem(last=False)
+            return video
+
+    def get_or_load(self, video_id, loader):
+        """
+        저장소에 없으면 'loader(video_id)'로 문장 목록을 불러와 저장합니다. 불러오지 못하면 None을 반환합니다.
+        """
+        video = self.get(video_id)
+        if video is not None:
+            return video
+        sentences = loader(video_id)
+        if not sentences:
+            return None
+        return self.put(video_id, sentences)
+
+    def stats(self):
+        with self._lock:
+            videos = list(self._videos.values())
+        return {
+            "videos": len(videos),
+            "sentences": sum(len(video) for video in videos),
+            "bytes": sum(video.nbytes for video in videos),
+        }
+
+
+# 모든 세션이 공유하는 문장 저장소입니다. SENTENCE_STORE_MAX_VIDEOS 환경 변수로 보관할 영상 수를 바꿀 수 있습니다.
+SENTENCE_STORE = SentenceStore(max_videos=int(os.environ.get("SENTENCE_STORE_MAX_VIDEOS", 64)))
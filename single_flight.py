@@ -0,0 +1,105 @@
+# Java/Spring 관점에서의 설명:
+# 이 'single_flight.py' 파일은 같은 키에 대한 동시 요청을 하나로 합치는 도구입니다. (Go의 singleflight, Caffeine의 AsyncLoadingCache와 같습니다.)
+# 한 반 학생 40명이 같은 영상을 동시에 열면, 캐시가 아직 비어 있으므로 40개 세션이 모두 같은 자막을 YouTube에 요청합니다.
+# SingleFlight를 거치면 키별로 처음 도착한 호출 하나만 실제로 일을 하고, 나머지는 그 결과(또는 예외)를 기다렸다가 함께 받습니다.
+#
+# 결과를 보관하지는 않습니다. 호출이 끝나면 키를 지우므로, 그 뒤의 호출은 (캐시가 없다면) 다시 실행됩니다.
+# 결과의 보관은 앞단의 캐시(TRANSCRIPT_CACHE, GRADING_CACHE)가 맡습니다.
+
+import threading
+from concurrent.futures import Future
+
+from metrics import METRICS
+
+
+class SingleFlight:
+    """
+    키별로 동시에 하나의 호출만 실행합니다.
+
+    - do(key, fn, *args): 같은 키로 진행 중인 호출이 없으면 fn(*args)를 직접 실행하고, 있으면 그 결과를 기다립니다.
+    - 실행한 호출이 예외를 던지면, 기다리던 호출에도 같은 예외가 전달됩니다. (Future.result()와 같습니다.)
+    - 기다리는 쪽은 'timeout'초까지만 기다리고, 넘으면 TimeoutError를 던집니다. 실행 중인 호출은 그대로 진행됩니다.
+    - 합쳐져서 생략된 호출 수는 'single_flight_suppressed_total{flight=...}' 지표로 기록합니다.
+    """
+
+    def __init__(self, name, timeout=None):
+        self.name = name
+        self.timeout = timeout
+        self._calls = {}
+        self._lock = threading.Lock()
+        self._stats = {"executed": 0, "suppressed": 0, "timeouts": 0}
+
+    def do(self, key, fn, *args, timeout=None, **kwargs):
+        """
+        fn(*args, **kwargs)의 결과를 반환합니다. 'timeout'을 주면 이 호출에만 기본 대기 시간 대신 사용합니다.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+                self._stats["executed"] += 1
+            else:
+                self._stats["suppressed"] += 1
+
+        if not leader:
+            METRICS.increment("single_flight_suppressed_total", flight=self.name)
+            try:
+                return future.result(timeout=self.timeout if timeout is None else timeout)
+            except TimeoutError:
+                # 실행 중인 호출이 끝나지 않았을 때만 여기로 옵니다. (fn이 던진 TimeoutError는 아래의 'raise'로 전달됩니다.)
+                if future.done():
+                    raise
+                with self._lock:
+                    self._stats["timeouts"] += 1
+                METRICS.increment("single_flight_timeouts_total", flight=self.name)
+                raise TimeoutError(
+                    f"{self.name}: 같은 요청의 결과를 {self.timeout if timeout is None else timeout}초 안에 받지 못했습니다."
+                ) from None
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+    def submit(self, key, start):
+        """
+        'do'의 Future 버전입니다. 같은 키로 진행 중인 호출이 없으면 start()로 작업을 시작하고 그 Future를 등록하며,
+        있으면 진행 중인 Future를 돌려줍니다. (Future, 직접 시작했는지 여부) 튜플을 반환합니다.
+
+        결과를 기다리는 동안 다른 일(예: 스트리밍 중간 결과 그리기)을 해야 하는 호출이 사용합니다.
+        키는 Future가 끝나는 순간 지워지며, 기다리는 쪽의 대기 시간은 호출하는 쪽이 'future.result(timeout)'으로 정합니다.
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = start()
+                self._stats["executed"] += 1
+            else:
+                self._stats["suppressed"] += 1
+
+        if leader:
+            future.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            METRICS.increment("single_flight_suppressed_total", flight=self.name)
+        return future, leader
+
+    def _forget(self, key, future):
+        with self._lock:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def stats(self):
+        """
+        실제로 실행한 호출 수, 합쳐져서 생략된 호출 수, 기다리다 시간 초과된 호출 수, 진행 중인 키 수를 반환합니다.
+        """
+        with self._lock:
+            return dict(self._stats, in_flight=len(self._calls))
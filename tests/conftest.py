@@ -0,0 +1,19 @@
+# pytest가 자동으로 읽어들이는 공용 설정 파일입니다. (JUnit5의 공통 Extension이나 테스트 베이스 클래스와 비슷합니다.)
+import pytest
+
+import utils
+from disk_cache import DiskCache
+from grading_cache import GradingCache
+
+
+@pytest.fixture(autouse=True)
+def isolated_grading_cache(tmp_path, monkeypatch):
+    """
+    테스트마다 비어 있는 채점 결과 캐시를 사용하도록 합니다.
+    실제 '.cache' 디렉터리에 저장된 결과 때문에 테스트 결과가 달라지는 것을 막습니다.
+    """
+    cache = GradingCache(
+        DiskCache(str(tmp_path / "grading.sqlite3"), ttl_seconds=None, max_bytes=None)
+    )
+    monkeypatch.setattr(utils, "GRADING_CACHE", cache)
+    return cache
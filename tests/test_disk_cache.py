@@ -0,0 +1,65 @@
+from disk_cache import DiskCache
+
+# --- DiskCache 테스트 ---
+# pytest의 'tmp_path'는 테스트마다 새로 만들어지는 임시 디렉터리입니다. (JUnit5의 @TempDir과 같습니다.)
+
+
+def test_disk_cache_roundtrip_and_stats(tmp_path):
+    """저장한 값을 그대로 돌려주고, 적중/미스 횟수를 기록하는지 테스트합니다."""
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), ttl_seconds=60, max_bytes=10_000)
+
+    assert cache.get("missing") is None
+    cache.set("video", {"snippets": [["Hello", 0.0, 1.5]]})
+    assert cache.get("video") == {"snippets": [["Hello", 0.0, 1.5]]}
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["entries"] == 1
+
+
+def test_disk_cache_expires_after_ttl(tmp_path):
+    """TTL이 지난 항목은 미스로 처리되는지 테스트합니다."""
+    cache = DiskCache(str(tmp_path / "cache.sqlite3"), ttl_seconds=0, max_bytes=10_000)
+    cache.set("video", "script")
+
+    assert cache.get("video") is None
+    assert cache.stats()["expirations"] == 1
+
+
+def test_disk_cache_evicts_least_recently_used(tmp_path):
+    """용량을 넘으면 가장 오래 사용되지 않은 항목부터 제거하는지 테스트합니다."""
+    path = str(tmp_path / "cache.sqlite3")
+    probe = DiskCache(path, ttl_seconds=None, max_bytes=None)
+    probe.set("probe", "x" * 10)
+    entry_size = probe.stats()["bytes"]
+    probe.delete("probe")
+
+    # 항목 두 개까지만 들어가는 용량으로 설정합니다.
+    cache = DiskCache(path, ttl_seconds=None, max_bytes=entry_size * 2)
+    cache.set("a", "a" * 10)
+    cache.set("b", "b" * 10)
+    cache.get("a")  # 'a'를 최근에 사용한 것으로 만듭니다.
+    cache.set("c", "c" * 10)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "a" * 10
+    assert cache.get("c") == "c" * 10
+    assert cache.stats()["evictions"] == 1
+
+
+def test_cold_transcript_fetch_counts_one_miss(tmp_path, monkeypatch):
+    """캐시에 없는 자막을 한 번 가져오면 미스 하나만, 다시 가져오면 적중 하나만 기록하는지 테스트합니다."""
+    import youtube_script_processor
+
+    cache = DiskCache(str(tmp_path / "transcripts.sqlite3"), ttl_seconds=None, max_bytes=None)
+    monkeypatch.setattr(youtube_script_processor, "TRANSCRIPT_CACHE", cache)
+    record = {"language_code": "en", "is_generated": False, "snippets": [["Hello.", 0.0, 1.0]]}
+    monkeypatch.setattr(youtube_script_processor, "fetch_transcript_record", lambda video_id: record)
+
+    assert youtube_script_processor.get_transcript_snippets("coldFetchA1") == record["snippets"]
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (0, 1)
+    assert youtube_script_processor.load_transcript_record("coldFetchA1") == record
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
+    assert youtube_script_processor.load_transcript_record("coldFetchB1") == record
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 2)
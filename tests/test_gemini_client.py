@@ -0,0 +1,59 @@
+import os
+import threading
+from unittest.mock import patch
+
+import gemini_client
+from gemini_client import PromptTemplate, get_client, reset_client
+
+# --- get_client 함수 테스트 ---
+
+
+@patch("google.genai.Client")
+def test_get_client_is_shared_across_threads(mock_client_class):
+    """여러 스레드에서 동시에 호출해도 클라이언트가 한 번만 생성되는지 테스트합니다."""
+    reset_client()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(get_client()))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert mock_client_class.call_count == 1
+    assert all(client is results[0] for client in results)
+    reset_client()
+
+
+# --- PromptTemplate 클래스 테스트 ---
+
+
+def test_prompt_template_reloads_only_when_file_changes(tmp_path):
+    """파일 수정 시각(mtime)이 바뀔 때만 다시 읽는지 테스트합니다."""
+    prompt_file = tmp_path / "prompt.md"
+    prompt_file.write_text("v1 {original_text}", encoding="utf-8")
+    template = PromptTemplate(str(prompt_file))
+
+    with patch("builtins.open", wraps=open) as spy_open:
+        assert template.get() == "v1 {original_text}"
+        assert template.get() == "v1 {original_text}"
+        assert spy_open.call_count == 1
+
+    first_version = template.version
+    prompt_file.write_text("v2 {original_text}", encoding="utf-8")
+    # 같은 시각으로 기록되는 경우를 피하기 위해 mtime을 명시적으로 바꿉니다.
+    stat = os.stat(prompt_file)
+    os.utime(prompt_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert template.get() == "v2 {original_text}"
+    assert template.version != first_version
+
+
+def test_evaluation_prompt_points_to_project_file():
+    """기본 채점 프롬프트가 프로젝트의 prompts 디렉터리를 가리키는지 테스트합니다."""
+    assert gemini_client.EVALUATION_PROMPT.path.endswith(
+        os.path.join("prompts", "evaluation_prompt.md")
+    )
+    assert "{original_text}" in gemini_client.EVALUATION_PROMPT.get()
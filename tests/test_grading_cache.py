@@ -0,0 +1,43 @@
+from disk_cache import DiskCache
+from grading_cache import GradingCache, grading_cache_key
+
+# --- grading_cache_key 함수 테스트 ---
+
+
+def test_grading_cache_key_ignores_whitespace_but_not_punctuation():
+    """공백 차이는 같은 키로, 구두점/프롬프트 버전 차이는 다른 키로 만드는지 테스트합니다."""
+    key = grading_cache_key("Hello world.", "Hello  world", "v1", "model")
+    assert key == grading_cache_key(" Hello world. ", "Hello world", "v1", "model")
+    assert key != grading_cache_key("Hello world.", "Hello world.", "v1", "model")
+    assert key != grading_cache_key("Hello world.", "Hello  world", "v2", "model")
+
+
+# --- GradingCache 클래스 테스트 ---
+
+
+def test_grading_cache_uses_disk_tier_across_instances(tmp_path):
+    """메모리에 없어도 디스크 단계에서 찾아오고, 적중률을 기록하는지 테스트합니다."""
+    path = str(tmp_path / "grading.sqlite3")
+    writer = GradingCache(DiskCache(path, ttl_seconds=None, max_bytes=None))
+    writer.set("key", {"score": 90})
+
+    # 새 인스턴스는 다른 워커 프로세스를 흉내 냅니다. (메모리 단계가 비어 있음)
+    reader = GradingCache(DiskCache(path, ttl_seconds=None, max_bytes=None))
+    assert reader.get("missing") is None
+    assert reader.get("key") == {"score": 90}
+    assert reader.get("key") == {"score": 90}
+
+    stats = reader.stats()
+    assert (stats["disk_hits"], stats["memory_hits"], stats["misses"]) == (1, 1, 1)
+    assert stats["hit_rate"] == 2 / 3
+
+
+def test_grading_cache_memory_tier_is_bounded(tmp_path):
+    """메모리 단계가 정해진 개수를 넘으면 가장 오래된 항목을 버리는지 테스트합니다."""
+    cache = GradingCache(
+        DiskCache(str(tmp_path / "grading.sqlite3"), ttl_seconds=None, max_bytes=None),
+        memory_size=2,
+    )
+    for key in ("a", "b", "c"):
+        cache.set(key, {"score": 1})
+    assert cache.stats()["memory_entries"] == 2
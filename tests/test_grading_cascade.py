@@ -0,0 +1,165 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from grading_cascade import FakeTier, GradingCascade, usage_cost
+from single_flight import SingleFlight
+from utils import evaluate
+
+
+def _result(score, confidence=None):
+    result = {"score": score, "positive_feedback": "Good", "points_for_improvement": []}
+    if confidence is not None:
+        result["confidence"] = confidence
+    return result
+
+
+def test_cascade_accepts_confident_cheap_result():
+    """저렴한 단계의 결과가 확실하면 강한 단계를 부르지 않고, 'confidence'를 뺀 결과를 반환하는지 테스트합니다."""
+    cheap = FakeTier("cheap", _result(95, confidence=0.9), cost=0.001)
+    strong = FakeTier("strong", _result(90), cost=0.01)
+    cascade = GradingCascade([cheap, strong])
+
+    assert cascade.grade("I went home.", "I want home.") == _result(95)
+    assert (cheap.calls, strong.calls) == (1, 0)
+    stats = cascade.stats()
+    assert stats["cheap"]["accepted"] == 1 and stats["cheap"]["hit_rate"] == 1.0
+    assert stats["cheap"]["cost_usd"] == pytest.approx(0.001)
+    assert "strong" not in stats
+
+
+@pytest.mark.parametrize(
+    "cheap_result, reason",
+    [
+        ({"score": 95}, "invalid"),
+        (_result(95, confidence=0.3), "low_confidence"),
+        (_result(60, confidence=0.9), "borderline"),
+    ],
+)
+def test_cascade_escalates_doubtful_results(cheap_result, reason):
+    """스키마에 맞지 않거나, 확신도가 낮거나, 점수가 애매한 결과는 강한 단계로 넘기는지 테스트합니다."""
+    strong = FakeTier("strong", _result(70))
+    cascade = GradingCascade([FakeTier("cheap", cheap_result), strong], min_confidence=0.7, borderline=(50, 80))
+
+    assert cascade.grade("I went home.", "I want home.") == _result(70)
+    assert strong.calls == 1
+    assert cascade.stats()["cheap"]["escalated"] == {reason: 1}
+
+
+def test_cascade_async_escalates_on_error_and_raises_from_last_tier():
+    """앞 단계가 실패하면 다음 단계로 넘기고, 마지막 단계의 실패는 예외로 전달하는지 테스트합니다. (비동기 경로)"""
+
+    def fail(original_text, user_text):
+        raise RuntimeError("boom")
+
+    cascade = GradingCascade([FakeTier("cheap", fail), FakeTier("strong", _result(70))])
+    assert asyncio.run(cascade.grade_async("a", "b")) == _result(70)
+    assert cascade.stats()["cheap"]["escalated"] == {"error": 1}
+
+    failing = GradingCascade([FakeTier("cheap", fail), FakeTier("strong", fail)])
+    with pytest.raises(RuntimeError):
+        asyncio.run(failing.grade_async("a", "b"))
+
+
+def test_evaluate_uses_configured_cascade_models():
+    """evaluate가 단계별 모델로 요청하고, 저렴한 모델에는 확신도를 함께 요청하는지 테스트합니다."""
+    from grading_cascade import GeminiTier
+
+    mock_client = MagicMock()
+    cheap_response = MagicMock(
+        text='{"score": 40, "positive_feedback": "Ok", "points_for_improvement": [], "confidence": 0.2}'
+    )
+    cheap_response.usage_metadata.prompt_token_count = 1000
+    cheap_response.usage_metadata.candidates_token_count = 100
+    strong_response = MagicMock(text='{"score": 45, "positive_feedback": "Ok", "points_for_improvement": []}')
+    mock_client.models.generate_content.side_effect = [cheap_response, strong_response]
+    cascade = GradingCascade([GeminiTier("gemini-2.5-flash-lite"), GeminiTier("gemini-2.5-flash")])
+
+    with patch("utils.get_client", return_value=mock_client), patch("utils.GRADING_CASCADE", cascade):
+        result = evaluate("I went home.", "I want home.")
+
+    assert result["score"] == 45
+    calls = mock_client.models.generate_content.call_args_list
+    assert [call.kwargs["model"] for call in calls] == ["gemini-2.5-flash-lite", "gemini-2.5-flash"]
+    assert "confidence" in calls[0].kwargs["config"]["response_schema"].model_fields
+    assert "confidence" not in calls[1].kwargs["config"]["response_schema"].model_fields
+    assert cascade.stats()["gemini-2.5-flash-lite"]["cost_usd"] == pytest.approx(
+        usage_cost("gemini-2.5-flash-lite", cheap_response.usage_metadata)
+    )
+
+
+def test_stream_request_uses_cascade_when_it_has_several_tiers(monkeypatch):
+    """여러 단계로 구성하면 스트리밍하지 않고 채점 단계를 거쳐, 중간 결과 없이 최종 결과만 반환하는지 테스트합니다."""
+    import utils
+
+    cheap = FakeTier("cheap", _result(95, confidence=0.9))
+    strong = FakeTier("strong", _result(90))
+    monkeypatch.setattr(utils, "GRADING_CASCADE", GradingCascade([cheap, strong]))
+    partials = []
+
+    result = asyncio.run(utils.request_grading_stream_async("I went home.", "I want home.", partials.append))
+
+    assert result == _result(95)
+    assert partials == []
+    assert cheap.calls == 1
+
+
+def test_batch_results_are_not_reused_under_a_multi_tier_cascade_key():
+    """배치 결과는 GEMINI_MODEL의 키로 저장되어 채점 단계가 재사용하지 않고, 사소한 차이는 로컬 단계로 기록되는지 테스트합니다."""
+    import json
+
+    from utils import evaluate_batch
+
+    mock_client = MagicMock()
+    mock_client.models.generate_content.return_value = MagicMock(
+        text=json.dumps([
+            {"index": 0, "score": 70, "positive_feedback": "A", "points_for_improvement": []},
+            {"index": 1, "score": 60, "positive_feedback": "B", "points_for_improvement": []},
+        ])
+    )
+    cheap = FakeTier("cheap", _result(95, confidence=0.9))
+    cascade = GradingCascade([cheap, FakeTier("strong", _result(90))])
+
+    with patch("utils.get_client", return_value=mock_client), patch("utils.GRADING_CASCADE", cascade):
+        batch = evaluate_batch([("I went home.", "I want home."), ("She is here.", "She his here."), ("Hi.", "hi")])
+        single = evaluate("I went home.", "I want home.")
+
+    assert [result["score"] for result in batch[:2]] == [70, 60]
+    assert single == _result(95)
+    assert cheap.calls == 1
+    assert cascade.stats()["local"]["accepted"] == 1
+
+
+@pytest.mark.parametrize("path", ["evaluate", "grading_service"])
+def test_concurrent_follower_waits_for_escalation_to_the_last_tier(path, monkeypatch):
+    """
+    저렴한 단계에서 강한 단계로 넘어가 Gemini 대기 시간 하나보다 오래 걸려도, 동시에 같은 채점을 기다린 쪽이
+    로컬 채점으로 대신하지 않고 먼저 시작한 쪽의 결과를 받는지 테스트합니다.
+    """
+    import threading
+
+    import utils
+    from grading_service import GradingService
+
+    # 단계 하나(0.25초)는 대기 시간(0.4초) 안에 끝나지만, 두 단계를 거치면(0.5초) 넘습니다.
+    cheap = FakeTier("cheap", _result(40, confidence=0.2), latency_seconds=0.25)
+    strong = FakeTier("strong", _result(45), latency_seconds=0.25)
+    monkeypatch.setattr(utils, "GRADING_CASCADE", GradingCascade([cheap, strong]))
+    monkeypatch.setattr(utils, "GEMINI_TIMEOUT_MS", 400)
+    # 기본 대기 시간이 Gemini 요청 하나의 시간뿐인 새 SingleFlight를 사용합니다.
+    monkeypatch.setattr(utils, "GRADING_FLIGHT", SingleFlight("gemini_grading", timeout=0.4))
+    if path == "evaluate":
+        grade = utils.evaluate
+    else:
+        grade = GradingService(deadline_seconds=0.4).grade_sync
+
+    results = {}
+    leader = threading.Thread(target=lambda: results.update(leader=grade("I went home.", "I want home.")))
+    leader.start()
+    threading.Event().wait(0.05)
+    results["follower"] = grade("I went home.", "I want home.")
+    leader.join()
+
+    assert results == {"leader": _result(45), "follower": _result(45)}
+    assert (cheap.calls, strong.calls) == (1, 1)
@@ -0,0 +1,182 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from google.genai import errors as genai_errors
+
+from grading_service import GradingService, TokenBucket, is_retryable
+
+# --- GradingService 테스트 ---
+# 실제 Gemini 대신 비동기 가짜 함수(request_fn)를 주입합니다. Spring 테스트에서 @MockBean을 주입하는 것과 같습니다.
+
+RESULT = {"score": 80, "positive_feedback": "Good", "points_for_improvement": []}
+
+
+def _unavailable():
+    return genai_errors.ServerError(503, {"error": {"code": 503, "message": "busy"}})
+
+
+def test_grade_retries_retryable_errors_then_succeeds():
+    """503 오류는 재시도하고, 성공하면 결과를 반환하는지 테스트합니다."""
+    calls = []
+
+    async def flaky(original_text, user_text):
+        calls.append(original_text)
+        if len(calls) < 3:
+            raise _unavailable()
+        return RESULT
+
+    service = GradingService(request_fn=flaky, base_backoff_seconds=0.001)
+    result = asyncio.run(service.grade("I went home.", "I want home."))
+
+    assert result == RESULT
+    assert len(calls) == 3
+    assert service.stats()["retries"] == 2
+
+
+def test_grade_does_not_retry_client_errors():
+    """400 같은 요청 오류는 재시도하지 않고 로컬 채점 결과로 대체하는지 테스트합니다."""
+    calls = []
+
+    async def bad_request(original_text, user_text):
+        calls.append(original_text)
+        raise genai_errors.ClientError(400, {"error": {"code": 400, "message": "bad"}})
+
+    service = GradingService(request_fn=bad_request, base_backoff_seconds=0.001)
+    result = asyncio.run(service.grade("I went home.", "I want home."))
+
+    assert len(calls) == 1
+    assert result["source"] == "local"
+    assert "fallback_reason" in result
+
+
+def test_grade_falls_back_when_deadline_passes():
+    """마감 시간을 넘기면 기다리지 않고 로컬 채점 결과를 반환하는지 테스트합니다."""
+
+    async def slow(original_text, user_text):
+        await asyncio.sleep(5)
+        return RESULT
+
+    service = GradingService(request_fn=slow, deadline_seconds=0.05)
+    result = asyncio.run(service.grade("I went home.", "I want home."))
+
+    assert result["source"] == "local"
+    assert service.stats()["timeouts"] == 1
+
+
+def test_grade_limits_requests_in_flight():
+    """동시에 진행 중인 요청 수가 max_in_flight를 넘지 않는지 테스트합니다."""
+
+    async def work(original_text, user_text):
+        await asyncio.sleep(0.01)
+        return RESULT
+
+    service = GradingService(request_fn=work, max_in_flight=2, rate_per_second=1000, burst=1000)
+
+    async def run_all():
+        return await asyncio.gather(
+            *[service.grade(f"Sentence {i} here.", f"Sentense {i} hear.") for i in range(10)]
+        )
+
+    results = asyncio.run(run_all())
+    assert results == [RESULT] * 10
+    assert service.stats()["max_in_flight_seen"] == 2
+
+
+def test_token_bucket_limits_rate():
+    """토큰을 모두 쓰면 다음 토큰이 채워질 때까지 기다리는지 테스트합니다."""
+
+    async def acquire_three():
+        bucket = TokenBucket(rate=20, capacity=1)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        for _ in range(3):
+            await bucket.acquire()
+        return loop.time() - started
+
+    # 첫 토큰은 바로, 나머지 두 개는 각각 약 0.05초씩 기다려야 합니다.
+    assert asyncio.run(acquire_three()) >= 0.09
+
+
+def test_is_retryable_classifies_errors():
+    """재시도 가능한 오류와 그렇지 않은 오류를 구분하는지 테스트합니다."""
+    assert is_retryable(_unavailable())
+    assert is_retryable(TimeoutError())
+    assert not is_retryable(ValueError())
+
+
+# --- grade_stream 테스트 ---
+
+
+def test_grade_stream_yields_score_first_against_fake_server(monkeypatch):
+    """
+    가짜 Gemini 서버의 스트리밍 응답(streamGenerateContent?alt=sse)을 받아,
+    점수를 먼저 내보내고 개선할 점을 채운 뒤 최종 결과로 끝나는지 테스트합니다.
+    """
+    from benchmarks.fake_gemini_server import DEFAULT_RESULT, FakeGeminiConfig, start_fake_server
+    from gemini_client import reset_client
+    from metrics import METRICS
+
+    server, base_url = start_fake_server(
+        FakeGeminiConfig(latency_ms=0, jitter_ms=0, stream_chunks=10, stream_interval_ms=0)
+    )
+    monkeypatch.setenv("GOOGLE_GEMINI_BASE_URL", base_url)
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    reset_client()
+    METRICS.reset()
+    try:
+        results = list(GradingService().grade_stream("I went home.", "I want home."))
+    finally:
+        reset_client()
+        server.shutdown()
+
+    assert len(results) > 2
+    assert results[0] == {"score": DEFAULT_RESULT["score"], "partial": True}
+    assert results[-1] == DEFAULT_RESULT
+    assert all(result.get("partial") for result in results[:-1])
+    assert server.config.request_count == 1
+    assert any(
+        row["metric"] == 'grading_time_to_first_feedback_seconds{source="stream"}'
+        for row in METRICS.summary()[0]
+    )
+
+
+def test_grade_stream_falls_back_to_local_result_on_error():
+    """스트리밍 요청이 실패하면 로컬 채점 결과 하나만 내보내는지 테스트합니다."""
+
+    async def broken(original_text, user_text, on_partial):
+        raise RuntimeError("boom")
+
+    results = list(GradingService(stream_fn=broken).grade_stream("I went home.", "I want home."))
+
+    assert len(results) == 1
+    assert results[0]["source"] == "local"
+    assert "boom" in results[0]["fallback_reason"]
+
+
+def test_grade_stream_coalesces_concurrent_identical_requests():
+    """같은 받아쓰기를 동시에 스트리밍 채점하면 한 번만 요청하고, 기다린 쪽은 최종 결과를 받는지 테스트합니다."""
+    calls = []
+    release = threading.Event()
+
+    async def streaming(original_text, user_text, on_partial):
+        calls.append(original_text)
+        on_partial({"score": 80, "partial": True})
+        await asyncio.to_thread(release.wait, 5)
+        return RESULT
+
+    service = GradingService(stream_fn=streaming)
+    leader = service.grade_stream("I went home.", "I want home.")
+    assert next(leader) == {"score": 80, "partial": True}
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        follower = pool.submit(lambda: list(service.grade_stream("I went home.", "I want home.")))
+        for _ in range(500):
+            if service.stats()["coalesced"]:
+                break
+            threading.Event().wait(0.01)
+        release.set()
+        assert list(leader) == [RESULT]
+        assert follower.result(5) == [RESULT]
+
+    assert len(calls) == 1
+    assert service.stats()["api_calls"] == 1
@@ -0,0 +1,59 @@
+import json
+
+from corpus import SentenceCorpus
+from ingest import FixtureFetcher, ingest, main, parse_video_id
+from youtube_script_processor import Sentence
+
+# --- ingest 테스트 ---
+# 네트워크 대신 FixtureFetcher로 로컬 JSON 파일에서 자막을 읽습니다.
+
+
+def _write_fixture(directory, video_id, snippets):
+    (directory / f"{video_id}.json").write_text(
+        json.dumps({"snippets": snippets}), encoding="utf-8"
+    )
+
+
+def test_parse_video_id_accepts_urls_and_ids():
+    """URL과 영상 ID를 모두 받아들이고, 나머지는 None을 반환하는지 테스트합니다."""
+    assert parse_video_id("https://youtu.be/M-y14-3Y6gE") == "M-y14-3Y6gE"
+    assert parse_video_id("M-y14-3Y6gE") == "M-y14-3Y6gE"
+    assert parse_video_id("not a video") is None
+
+
+def test_ingest_writes_sentences_to_corpus(tmp_path):
+    """여러 영상을 병렬로 처리해 문장을 코퍼스에 저장하고, 실패한 영상은 따로 보고하는지 테스트합니다."""
+    _write_fixture(tmp_path, "AAAAAAAAAAA", [["Hello world. [Music] Bye", 0.0, 2.0], ["now.", 2.0, 1.0]])
+    _write_fixture(tmp_path, "BBBBBBBBBBB", [["One sentence only.", 5.0, 1.5]])
+    corpus = SentenceCorpus(str(tmp_path / "corpus.sqlite3"))
+
+    results = ingest(
+        ["https://www.youtube.com/watch?v=AAAAAAAAAAA", "BBBBBBBBBBB", "CCCCCCCCCCC", "???"],
+        FixtureFetcher(str(tmp_path)),
+        corpus,
+        fetch_workers=2,
+        process_workers=2,
+    )
+
+    statuses = {r["input"]: r["status"] for r in results}
+    assert statuses == {"AAAAAAAAAAA": "ok", "BBBBBBBBBBB": "ok", "CCCCCCCCCCC": "failed", "???": "invalid"}
+    assert corpus.get("AAAAAAAAAAA") == [
+        Sentence("Hello world.", 0.0, 2.0),
+        Sentence("Bye now.", 0.0, 3.0),
+    ]
+    assert corpus.get("CCCCCCCCCCC") is None
+
+
+def test_main_skips_existing_videos(tmp_path, capsys):
+    """--skip-existing 옵션으로 이미 저장된 영상을 건너뛰는지 테스트합니다."""
+    _write_fixture(tmp_path, "AAAAAAAAAAA", [["Hi.", 0.0, 1.0]])
+    corpus_path = str(tmp_path / "corpus.sqlite3")
+    SentenceCorpus(corpus_path).put("AAAAAAAAAAA", [Sentence("Old.", 0.0, 1.0)])
+
+    exit_code = main(
+        ["AAAAAAAAAAA", "--fixtures", str(tmp_path), "--corpus", corpus_path, "--skip-existing"]
+    )
+
+    assert exit_code == 0
+    assert "[skipped] AAAAAAAAAAA" in capsys.readouterr().out
+    assert SentenceCorpus(corpus_path).get("AAAAAAAAAAA")[0].text == "Old."
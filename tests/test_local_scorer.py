@@ -0,0 +1,51 @@
+from local_scorer import align_words, is_trivial, score_locally, tokenize
+
+# --- tokenize 함수 테스트 ---
+
+
+def test_tokenize_normalizes_case_and_punctuation():
+    """대소문자와 앞뒤 구두점은 정규화하고, 단어 안의 아포스트로피는 유지하는지 테스트합니다."""
+    assert tokenize("Hello, World! Don’t - stop.") == [
+        ("Hello,", "hello"),
+        ("World!", "world"),
+        ("Don't", "don't"),
+        ("stop.", "stop"),
+    ]
+
+
+# --- align_words 함수 테스트 ---
+
+
+def test_align_words_reports_each_edit_type():
+    """대체, 누락, 추가를 올바르게 구분하는지 테스트합니다."""
+    operations = align_words(["a", "b", "c", "d"], ["a", "x", "c", "d", "e"])
+    assert [op for op, _, _ in operations] == [
+        "equal", "substitute", "equal", "equal", "insert"
+    ]
+    operations = align_words(["a", "b", "c"], ["a", "c"])
+    assert [op for op, _, _ in operations] == ["equal", "delete", "equal"]
+
+
+# --- score_locally 함수 테스트 ---
+
+
+def test_score_locally_exact_match_is_trivial():
+    """대소문자/구두점만 다른 경우 Gemini 없이 처리 가능한 결과를 반환하는지 테스트합니다."""
+    result = score_locally("Hello world.", "hello world")
+    assert is_trivial(result)
+    assert result["score"] == 95
+    assert result["points_for_improvement"][0]["original"] == "Hello"
+
+    assert score_locally("Hello world.", "Hello world.")["score"] == 100
+
+
+def test_score_locally_groups_mistakes_in_ui_shape():
+    """틀린 부분을 main.py가 표시하는 original/user_input/suggestion 형태로 묶는지 테스트합니다."""
+    result = score_locally("I went to the store yesterday.", "I want to the store.")
+    assert not is_trivial(result)
+    assert result["word_errors"] == 2
+    assert result["score"] == 67
+    assert result["points_for_improvement"] == [
+        {"original": "went", "user_input": "want", "suggestion": "Write 'went' instead of 'want'."},
+        {"original": "yesterday.", "user_input": "", "suggestion": "Missing word(s): 'yesterday.'"},
+    ]
@@ -0,0 +1,90 @@
+import os
+from unittest.mock import patch
+
+import pytest
+
+import corpus
+import progress_store
+import sentence_index
+import youtube_script_processor
+from disk_cache import DiskCache
+from progress_store import ProgressStore
+
+# --- main.py 화면 테스트 ---
+# Streamlit의 AppTest로 브라우저 없이 main.py를 실행합니다. (Spring의 MockMvc로 컨트롤러를 호출하는 것과 같습니다.)
+# 디스크에 쓰는 저장소는 모두 임시 디렉터리로 바꾸고, YouTube는 가짜 함수로 바꿉니다.
+
+MAIN_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "main.py")
+
+
+def _fake_transcript(video_id):
+    return {
+        "language_code": "en",
+        "is_generated": False,
+        "snippets": [[f"This is sentence {i} of {video_id}.", i * 3.0, 3.0] for i in range(3)],
+    }
+
+
+@pytest.fixture
+def app_store(tmp_path, monkeypatch):
+    store = ProgressStore(str(tmp_path / "progress.sqlite3"), flush_interval=0)
+    monkeypatch.setattr(progress_store, "PROGRESS_STORE", store)
+    monkeypatch.setattr(corpus, "CORPUS", corpus.SentenceCorpus(str(tmp_path / "corpus.sqlite3")))
+    monkeypatch.setattr(
+        sentence_index, "SENTENCE_INDEX", sentence_index.SentenceIndex(str(tmp_path / "index.sqlite3"))
+    )
+    monkeypatch.setattr(
+        youtube_script_processor,
+        "TRANSCRIPT_CACHE",
+        DiskCache(str(tmp_path / "transcripts.sqlite3"), ttl_seconds=None, max_bytes=None),
+    )
+    monkeypatch.setattr(youtube_script_processor, "fetch_transcript_record", _fake_transcript)
+    return store
+
+
+def _open(at, video_id):
+    at.text_input[0].set_value(f"https://youtu.be/{video_id}")
+    next(button for button in at.button if button.label == "스크립트 가져오기").click().run()
+    assert not at.exception
+
+
+def test_switching_videos_does_not_carry_dictation_over(app_store):
+    """영상 A에서 입력한 받아쓰기가 영상 B를 연 뒤 B의 진행 상황으로 저장되지 않는지 테스트합니다."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(MAIN_PATH, default_timeout=30).run()
+    at.text_input[1].set_value("learner").run()
+    _open(at, "appTestVidA")
+    at.text_area[0].input("This is sentence zero").run()
+    _open(at, "appTestVidB")
+
+    assert at.text_area[0].value == ""
+    app_store.flush()
+    assert app_store.load("learner", "appTestVidA")["user_inputs"] == {0: "This is sentence zero"}
+    assert app_store.load("learner", "appTestVidB") is None
+
+
+def test_load_harness_reports_fallbacks_when_gemini_fails(app_store, monkeypatch):
+    """부하 테스트가 Gemini 오류로 로컬 채점 결과를 대신 보여준 채점을 'fallbacks'로 세는지 테스트합니다."""
+    import grading_service
+    from benchmarks.fake_gemini_server import FakeGeminiConfig, start_fake_server
+    from gemini_client import reset_client
+
+    # 부하 테스트 모듈은 불러올 때 환경 변수를 바꾸므로, 테스트가 끝나면 되돌립니다.
+    with patch.dict(os.environ):
+        from benchmarks import load_app_sessions
+    monkeypatch.setattr(grading_service, "_service", grading_service.GradingService(max_retries=0))
+    server, base_url = start_fake_server(FakeGeminiConfig(latency_ms=0, jitter_ms=0, error_rate=1.0))
+    monkeypatch.setenv("GOOGLE_GEMINI_BASE_URL", base_url)
+    monkeypatch.setenv("GEMINI_API_KEY", "test-key")
+    reset_client()
+    try:
+        with load_app_sessions.shared_streamlit_runtime():
+            samples, _, fallbacks = load_app_sessions.run_scale(users=1, steps=2, video_prefix="t")
+    finally:
+        server.shutdown()
+        reset_client()
+
+    assert [error for _, _, error in samples if error] == []
+    assert server.config.error_count == 2
+    assert fallbacks == server.config.error_count
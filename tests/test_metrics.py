@@ -0,0 +1,107 @@
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+import utils
+from metrics import MetricsRegistry, METRICS
+
+# --- MetricsRegistry 클래스 테스트 ---
+
+
+def test_span_records_latency_and_error_type():
+    """span이 소요 시간을 기록하고, 예외 유형별로 오류 횟수를 세는지 테스트합니다."""
+    registry = MetricsRegistry()
+
+    with registry.span("work"):
+        pass
+    with pytest.raises(json.JSONDecodeError):
+        with registry.span("work"):
+            json.loads("not json")
+    with pytest.raises(ValueError):
+        with registry.span("work"):
+            raise ValueError("boom")
+
+    histogram_rows, counter_rows = registry.summary()
+    assert histogram_rows[0]["metric"] == "work_seconds"
+    assert histogram_rows[0]["count"] == 3
+    assert {row["metric"]: row["value"] for row in counter_rows} == {
+        'work_errors_total{type="ValueError"}': 1,
+        'work_errors_total{type="json_parse"}': 1,
+    }
+
+
+def test_quantile_is_estimated_from_buckets():
+    """구간 개수로부터 p50/p95가 올바른 구간 안에서 추정되는지 테스트합니다."""
+    registry = MetricsRegistry()
+    for _ in range(90):
+        registry.observe("size", 10)  # 구간 (0, 16]
+    for _ in range(10):
+        registry.observe("size", 1000)  # 구간 (256, 1024]
+
+    row = registry.summary()[0][0]
+    assert 0 < row["p50"] <= 16
+    assert 256 < row["p99"] <= 1024
+
+
+def test_exports_prometheus_text_and_json_lines():
+    """Prometheus 텍스트 형식과 JSON Lines 형식으로 내보내는지 테스트합니다."""
+    registry = MetricsRegistry()
+    registry.increment("gemini_tokens_total", 42, direction="prompt")
+    registry.observe("gemini_prompt_chars", 100)
+
+    text = registry.export_prometheus()
+    assert "# TYPE gemini_tokens_total counter" in text
+    assert 'gemini_tokens_total{direction="prompt"} 42' in text
+    assert 'gemini_prompt_chars_bucket{le="+Inf"} 1' in text
+    assert "gemini_prompt_chars_count 1" in text
+
+    lines = [json.loads(line) for line in registry.export_json_lines().splitlines()]
+    assert {line["kind"] for line in lines} == {"histogram", "counter"}
+
+
+# --- utils 계측 테스트 ---
+
+
+def test_evaluate_records_errors_sizes_and_tokens():
+    """evaluate가 JSON 파싱 오류, 프롬프트 크기, 토큰 사용량을 지표로 남기는지 테스트합니다."""
+    METRICS.reset()
+    mock_response = MagicMock()
+    mock_response.text = "not json"
+    mock_response.usage_metadata.prompt_token_count = 120
+    mock_response.usage_metadata.candidates_token_count = 3
+    mock_client = MagicMock()
+    mock_client.models.generate_content.return_value = mock_response
+
+    with patch("utils.get_client", return_value=mock_client):
+        result = utils.evaluate("The quick brown fox.", "The quick fox.")
+
+    assert "fallback_reason" in result
+    histogram_rows, counter_rows = METRICS.summary()
+    histograms = {row["metric"]: row for row in histogram_rows}
+    counters = {row["metric"]: row["value"] for row in counter_rows}
+    assert histograms["evaluate_seconds"]["count"] == 1
+    assert histograms["gemini_request_seconds"]["count"] == 1
+    assert histograms['gemini_prompt_chars{kind="single"}']["count"] == 1
+    assert counters['evaluate_errors_total{type="json_parse"}'] == 1
+    assert counters['gemini_tokens_total{direction="prompt",kind="single"}'] == 120
+    assert counters['gemini_tokens_total{direction="response",kind="single"}'] == 3
+
+
+def test_grading_service_records_json_parse_errors():
+    """채점 서비스(화면이 사용하는 경로)도 깨진 JSON 응답을 'json_parse' 오류로 기록하는지 테스트합니다."""
+    from grading_service import GradingService
+
+    METRICS.reset()
+    mock_response = MagicMock()
+    mock_response.text = "not json"
+    mock_client = MagicMock()
+    mock_client.aio.models.generate_content = AsyncMock(return_value=mock_response)
+
+    with patch("utils.get_client", return_value=mock_client):
+        result = GradingService(max_retries=0).grade_sync("The quick brown fox.", "The quick fox.")
+
+    assert result["source"] == "local"
+    assert "JSON 파싱 오류" in result["fallback_reason"]
+    counters = {row["metric"]: row["value"] for row in METRICS.summary()[1]}
+    assert counters['evaluate_errors_total{type="json_parse"}'] == 1
@@ -0,0 +1,31 @@
+import json
+
+from partial_json import PartialJSONParser
+
+# --- PartialJSONParser 테스트 ---
+
+
+def test_partial_json_returns_only_completed_values():
+    """값이 끝났다는 것(쉼표, 닫는 괄호)이 확인된 값만 돌려주는지 테스트합니다."""
+    parser = PartialJSONParser()
+    assert parser.feed('{"score": 8') == {}  # '8'은 '85'의 앞부분일 수 있으므로 아직 포함하지 않습니다.
+    assert parser.feed("5") is None
+    assert parser.feed(', "positive_feedback": "Go') == {"score": 85}
+    assert parser.feed('od, [really]"') is None  # 문자열 안의 쉼표와 괄호는 무시합니다.
+    assert parser.feed(', "points_for_improvement": [') == {
+        "score": 85,
+        "positive_feedback": "Good, [really]",
+        "points_for_improvement": [],
+    }
+
+
+def test_partial_json_final_result_matches_json_loads():
+    """한 글자씩 넣어도 마지막 결과가 전체 텍스트를 파싱한 결과와 같은지 테스트합니다."""
+    value = {
+        "score": 70,
+        "positive_feedback": "Nice \"try\" \\ ok",
+        "points_for_improvement": [{"original": "went", "user_input": "want", "suggestion": "past"}],
+    }
+    parser = PartialJSONParser()
+    results = [parser.feed(char) for char in json.dumps(value)]
+    assert [result for result in results if result is not None][-1] == value
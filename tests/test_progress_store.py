@@ -0,0 +1,123 @@
+import sqlite3
+import threading
+
+import pytest
+
+from progress_store import ProgressStore
+
+# --- ProgressStore 테스트 ---
+# flush_interval을 길게 두어 백그라운드 스레드가 끼어들지 않게 하고, flush()를 직접 호출합니다.
+
+
+def test_progress_store_coalesces_writes(tmp_path):
+    """같은 칸에 대한 여러 번의 쓰기가 마지막 값 하나로 합쳐져 한 번에 기록되는지 테스트합니다."""
+    store = ProgressStore(str(tmp_path / "progress.sqlite3"), flush_interval=60)
+    for text in ("H", "He", "Hel", "Hello"):
+        store.save_input("alice", "video1", 0, text)
+    for index in (1, 2, 3):
+        store.save_position("alice", "video1", index)
+
+    assert store.flush() == 2
+    stats = store.stats()
+    assert stats["requested"] == 7
+    assert stats["written"] == 2
+    assert stats["coalesced"] == 5
+    assert stats["flushes"] == 1
+
+
+def test_progress_store_load_restores_everything_after_restart(tmp_path):
+    """기록한 위치/입력/채점 결과를 새 저장소 객체(서버 재시작)에서 한 번에 불러오는지 테스트합니다."""
+    path = str(tmp_path / "progress.sqlite3")
+    store = ProgressStore(path, flush_interval=60)
+    store.save_position("alice", "video1", 2)
+    store.save_input("alice", "video1", 0, "Hello world")
+    store.save_input("alice", "video1", 2, "Good morning")
+    store.save_score("alice", "video1", 0, {"score": 90, "points_for_improvement": []})
+    store.save_input("bob", "video1", 0, "Other user")
+    store.flush()
+
+    restarted = ProgressStore(path, flush_interval=60)
+    assert restarted.load("alice", "video1") == {
+        "current_index": 2,
+        "user_inputs": {0: "Hello world", 2: "Good morning"},
+        "scores": {0: {"score": 90, "points_for_improvement": []}},
+    }
+    assert restarted.load("bob", "video1")["user_inputs"] == {0: "Other user"}
+    assert restarted.load("alice", "video2") is None
+
+
+def test_progress_store_load_includes_pending_writes(tmp_path):
+    """아직 디스크에 기록되지 않은 쓰기도 불러올 때 반영되는지 테스트합니다."""
+    store = ProgressStore(str(tmp_path / "progress.sqlite3"), flush_interval=60)
+    store.save_input("alice", "video1", 0, "Hello")
+    store.flush()
+    store.save_input("alice", "video1", 0, "")
+    store.save_input("alice", "video1", 1, "World")
+    store.save_position("alice", "video1", 1)
+
+    progress = store.load("alice", "video1")
+    assert progress["current_index"] == 1
+    assert progress["user_inputs"] == {1: "World"}
+
+
+def test_user_scores_collects_all_videos_including_pending(tmp_path):
+    """사용자의 모든 영상 채점 결과를, 아직 기록되지 않은 것까지 모아 반환하는지 테스트합니다."""
+    store = ProgressStore(str(tmp_path / "progress.sqlite3"), flush_interval=60)
+    store.save_score("alice", "video1", 0, {"score": 70})
+    store.save_score("bob", "video1", 0, {"score": 10})
+    store.flush()
+    store.save_score("alice", "video2", 3, {"score": 80})
+    store.save_score("alice", "video1", 0, {"score": 75})
+
+    assert sorted(result["score"] for result in store.user_scores("alice")) == [75, 80]
+
+
+def test_progress_store_load_sees_writes_being_flushed(tmp_path):
+    """flush가 기록하는 중(COMMIT 전)에 load해도 그 값을 돌려주는지 테스트합니다."""
+    path = str(tmp_path / "progress.sqlite3")
+    store = ProgressStore(path, flush_interval=60)
+    store.save_input("alice", "video1", 0, "old")
+    store.flush()
+    store.save_input("alice", "video1", 0, "new")
+
+    # 다른 연결이 쓰기 잠금을 잡고 있어서 flush가 BEGIN IMMEDIATE에서 기다리게 만듭니다.
+    blocker = sqlite3.connect(path, isolation_level=None)
+    blocker.execute("BEGIN IMMEDIATE")
+    flushing = threading.Thread(target=store.flush)
+    flushing.start()
+    for _ in range(500):
+        if store._inflight:
+            break
+        threading.Event().wait(0.01)
+
+    assert store.load("alice", "video1")["user_inputs"] == {0: "new"}
+    blocker.execute("ROLLBACK")
+    flushing.join(5)
+    assert store.load("alice", "video1")["user_inputs"] == {0: "new"}
+    assert store.stats()["pending"] == 0
+
+
+def test_progress_store_writer_survives_unexpected_errors(tmp_path):
+    """기록 중 sqlite3.Error가 아닌 오류가 나도 쓰기 스레드가 멈추지 않고, 되돌린 쓰기를 다시 기록하는지 테스트합니다."""
+    store = ProgressStore(str(tmp_path / "progress.sqlite3"), flush_interval=0.01)
+    connect = store._connect
+    failures = []
+
+    def flaky_connect():
+        if not failures:
+            failures.append(True)
+            raise RuntimeError("unexpected")
+        return connect()
+
+    store._connect = flaky_connect
+    store.save_input("alice", "video1", 0, "Hello")
+    for _ in range(500):
+        if store.stats()["written"]:
+            break
+        threading.Event().wait(0.01)
+
+    assert failures and store.stats()["written"] == 1
+    # 저장할 수 없는 채점 결과는 큐에 들어가기 전에 호출한 쪽에서 바로 실패합니다.
+    with pytest.raises(TypeError):
+        store.save_score("alice", "video1", 0, {"score": object()})
+    assert ProgressStore(store.path).load("alice", "video1")["user_inputs"] == {0: "Hello"}
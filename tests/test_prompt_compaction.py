@@ -0,0 +1,59 @@
+from prompt_compaction import compact
+
+LONG_ORIGINAL = (
+    "So the thing about machine learning is that, in the end, it is mostly about data "
+    "and how carefully you prepare it before you ever start training a model."
+)
+LONG_USER = (
+    "so the thing about machine learning is that in the end it is mostly about the data "
+    "and how careful you prepare it before you ever start training a model"
+)
+
+
+def test_compact_skips_short_or_mostly_wrong_sentences():
+    """짧은 문장, 틀린 곳이 없는 문장, 대부분 틀린 문장은 줄이지 않는지 테스트합니다."""
+    assert compact("I went home.", "I want home.") is None
+    assert compact(LONG_ORIGINAL, LONG_ORIGINAL.lower()) is None
+    assert compact(LONG_ORIGINAL, "I have no idea what he said about machine learning") is None
+
+
+def test_compact_keeps_only_mistakes_with_context():
+    """틀린 구간과 앞뒤 문맥만 발췌하고, 가까운 구간은 하나로 합치는지 테스트합니다."""
+    request = compact(LONG_ORIGINAL, LONG_USER)
+
+    assert request.excerpts == [
+        (
+            "... is mostly about data and how carefully you prepare it ...",
+            "... is mostly about the data and how careful you prepare it ...",
+        )
+    ]
+    assert request.excerpt_words == 10
+    assert request.total_words == 29
+    prompt = request.format_prompt("{matched_words}/{total_words}\n{excerpts}")
+    assert prompt.startswith("19/29\n**[Excerpt 1]**")
+
+
+def test_expand_maps_excerpt_result_back_to_full_sentence():
+    """발췌 구간 기준의 점수와 개선할 점을 전체 문장 기준으로 되돌리는지 테스트합니다."""
+    request = compact(LONG_ORIGINAL, LONG_USER)
+    result = request.expand(
+        {
+            "score": 72,
+            "positive_feedback": "Good",
+            "points_for_improvement": [
+                # 원래 표기와 대소문자가 달라도 전체 문장의 표기로 바꿉니다.
+                {"original": "Carefully", "user_input": "careful", "suggestion": "-ly", "excerpt": 1},
+                # 번호가 잘못되어도 모든 발췌 구간에서 찾습니다.
+                {"original": "data", "user_input": "the data", "suggestion": "no 'the'", "excerpt": 7},
+            ],
+        }
+    )
+
+    # 29단어 중 10단어에서 28점을 잃었으므로 전체 기준으로는 약 10점만 잃습니다.
+    assert result["score"] == 90
+    assert result["points_for_improvement"] == [
+        {"original": "carefully", "user_input": "careful", "suggestion": "-ly"},
+        {"original": "data", "user_input": "the data", "suggestion": "no 'the'"},
+    ]
+    # 스트리밍 중의 부분 결과(점수만 있는 결과)도 받을 수 있습니다.
+    assert request.expand({"score": 100}) == {"score": 100}
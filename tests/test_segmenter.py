@@ -0,0 +1,84 @@
+import pytest
+
+from segmenter import segment_transcript, split_text
+
+# --- split_text 함수 테스트 ---
+
+
+def test_split_text_keeps_abbreviations_together():
+    """'Mr.', 'e.g.', 이니셜 뒤에서는 문장을 나누지 않는지 테스트합니다."""
+    text = "Mr. Smith met Dr. Lee. They talked about fruit, e.g. apples. J. K. Rowling agreed!"
+    assert split_text(text) == [
+        "Mr. Smith met Dr. Lee.",
+        "They talked about fruit, e.g. apples.",
+        "J. K. Rowling agreed!",
+    ]
+
+
+def test_split_text_ambiguous_abbreviation_depends_on_next_word():
+    """'U.S.' 뒤는 다음 단어가 대문자일 때만 문장 경계로 보는지 테스트합니다."""
+    text = "I moved to the U.S. last year. Now I live in the U.S. It is big."
+    assert split_text(text) == [
+        "I moved to the U.S. last year.",
+        "Now I live in the U.S.",
+        "It is big.",
+    ]
+
+
+def test_split_text_chunks_unpunctuated_text_by_word_count():
+    """문장 부호가 없는 긴 텍스트는 최대 단어 수 단위로 나누는지 테스트합니다."""
+    text = " ".join(f"w{i}" for i in range(25))
+    chunks = split_text(text, max_words=10)
+    assert [len(chunk.split()) for chunk in chunks] == [10, 10, 5]
+    assert " ".join(chunks) == text
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Plan A. Plan B.", ["Plan A.", "Plan B."]),
+        ("I met J. Then we left.", ["I met J.", "Then we left."]),
+        ("I take vitamin C. It helps.", ["I take vitamin C.", "It helps."]),
+        ("J. R. R. Tolkien wrote it.", ["J. R. R. Tolkien wrote it."]),
+        # 홀로 선 이니셜은 문장 끝과 구별할 수 없으므로 문장 끝으로 봅니다.
+        ("John F. Kennedy spoke.", ["John F.", "Kennedy spoke."]),
+    ],
+)
+def test_split_text_treats_only_chained_capital_letters_as_initials(text, expected):
+    """대문자 한 글자 뒤의 마침표는 이니셜이 이어질 때만 문장을 잇고, 두 분리 경로가 같은 결과를 내는지 테스트합니다."""
+    assert split_text(text) == expected
+    snippets = [[word, i * 0.5, 0.5] for i, word in enumerate(text.split())]
+    assert [s for s, _, _ in segment_transcript(snippets)] == expected
+
+
+# --- segment_transcript 함수 테스트 ---
+
+
+def test_segment_transcript_splits_on_pause_without_punctuation():
+    """문장 부호가 없는 자동 생성 자막을 긴 쉼(pause)에서 끊는지 테스트합니다."""
+    snippets = [
+        ["so today we are going to", 0.0, 2.0],
+        ["talk about the weather here", 2.0, 2.0],
+        ["and then we will eat", 6.0, 2.0],  # 2초 쉼
+    ]
+    assert list(segment_transcript(snippets, pause_seconds=1.0, pause_min_words=6)) == [
+        ("so today we are going to talk about the weather here", 0.0, 4.0),
+        ("and then we will eat", 6.0, 8.0),
+    ]
+
+
+def test_segment_transcript_ignores_short_pause_in_short_sentence():
+    """모인 단어가 적으면 쉼이 있어도 끊지 않는지 테스트합니다."""
+    snippets = [["Hello", 0.0, 1.0], ["Mr. Kim.", 3.0, 1.0]]
+    assert list(segment_transcript(snippets, pause_min_words=6)) == [("Hello Mr. Kim.", 0.0, 4.0)]
+
+
+def test_segment_transcript_matches_split_text():
+    """같은 텍스트에 대해 split_text와 같은 문장을 만드는지 테스트합니다."""
+    text = (
+        "Mr. Smith lives in the U.S. He works at 9 a.m. every day. "
+        + " ".join(f"word{i}" for i in range(70))
+        + " Done? Yes!"
+    )
+    snippets = [[word, i * 0.5, 0.5] for i, word in enumerate(text.split())]
+    assert [s for s, _, _ in segment_transcript(snippets)] == split_text(text)
@@ -0,0 +1,67 @@
+from corpus import SentenceCorpus
+from sentence_index import SentenceIndex, drill_id, is_drill, load_drill, mistake_phrases
+from youtube_script_processor import Sentence
+
+
+def _sentences(*texts):
+    return [Sentence(text, float(i), float(i + 1)) for i, text in enumerate(texts)]
+
+
+def test_search_matches_words_and_phrases(tmp_path):
+    """단어와 구절로 문장을 찾고, match_all에 따라 모두/하나라도 일치하는 문장을 반환하는지 테스트합니다."""
+    index = SentenceIndex(str(tmp_path / "index.sqlite3"))
+    index.add_video("AAAAAAAAAAA", _sentences("I went home early.", "Home is where I went.", "They went out."))
+    index.add_video("BBBBBBBBBBB", _sentences("We went HOME, finally!"))
+
+    # 'went home'은 두 단어가 이어서 나오는 문장만 찾습니다. 대소문자와 구두점은 무시합니다.
+    assert index.search(["went home"]) == [("AAAAAAAAAAA", 0, 1), ("BBBBBBBBBBB", 0, 1)]
+    assert index.search(["went", "early"]) == [("AAAAAAAAAAA", 0, 2)]
+    # 하나라도 일치하면 포함하되, 많이 일치한 문장이 먼저 옵니다.
+    assert index.search(["went", "early"], match_all=False) == [
+        ("AAAAAAAAAAA", 0, 2),
+        ("AAAAAAAAAAA", 1, 1),
+        ("AAAAAAAAAAA", 2, 1),
+        ("BBBBBBBBBBB", 0, 1),
+    ]
+    assert index.search(["went"], exclude_videos={"AAAAAAAAAAA"}) == [("BBBBBBBBBBB", 0, 1)]
+    assert index.search(["nowhere"]) == []
+
+
+def test_add_video_replaces_only_that_video_and_sync_fills_missing(tmp_path):
+    """영상을 다시 색인하면 그 영상의 이전 색인만 바뀌고, sync는 색인하지 않은 영상만 추가하는지 테스트합니다."""
+    index = SentenceIndex(str(tmp_path / "index.sqlite3"))
+    index.add_video("AAAAAAAAAAA", _sentences("Old words here."))
+    index.add_video("BBBBBBBBBBB", _sentences("Old words there."))
+    index.add_video("AAAAAAAAAAA", _sentences("New text.", "Old again."))
+
+    assert index.search(["words"]) == [("BBBBBBBBBBB", 0, 1)]
+    assert index.search(["old"]) == [("AAAAAAAAAAA", 1, 1), ("BBBBBBBBBBB", 0, 1)]
+
+    corpus = SentenceCorpus(str(tmp_path / "corpus.sqlite3"))
+    corpus.put("BBBBBBBBBBB", _sentences("Changed in corpus."))
+    corpus.put("CCCCCCCCCCC", _sentences("A brand new video."))
+    assert index.sync(corpus) == 1
+    assert index.search(["brand new"]) == [("CCCCCCCCCCC", 0, 1)]
+    assert index.stats() == {"videos": 3, "sentences": 4}
+
+
+def test_drill_set_from_mistakes_round_trips_through_corpus(tmp_path):
+    """자주 틀린 구절을 골라 집중 연습 세트 ID를 만들고, 코퍼스에서 같은 문장들을 다시 불러오는지 테스트합니다."""
+    results = [
+        {"points_for_improvement": [{"original": "Went,", "user_input": "want"}]},
+        {"points_for_improvement": [{"original": "went", "user_input": "when"}, {"original": "the", "user_input": ""}]},
+        {"score": 100},
+    ]
+    assert mistake_phrases(results) == ["went", "the"]
+
+    corpus = SentenceCorpus(str(tmp_path / "corpus.sqlite3"))
+    corpus.put("AAAAAAAAAAA", _sentences("I went home.", "Nothing here."))
+    corpus.put("BBBBBBBBBBB", _sentences("The cat went out."))
+    index = SentenceIndex(str(tmp_path / "index.sqlite3"))
+    index.sync(corpus)
+
+    matches = index.search(mistake_phrases(results), match_all=False)
+    video_id = drill_id(matches)
+    assert video_id == "drill:BBBBBBBBBBB.0,AAAAAAAAAAA.0"
+    assert is_drill(video_id) and not is_drill("AAAAAAAAAAA")
+    assert [s.text for s in load_drill(video_id, corpus)] == ["The cat went out.", "I went home."]
@@ -0,0 +1,54 @@
+from sentence_store import SentenceStore, VideoSentences
+from youtube_script_processor import Sentence
+
+SENTENCES = [
+    Sentence("Hello world.", 0.0, 1.5),
+    Sentence("How are you?", 1.5, 3.0),
+    Sentence("Fine!", 3.0, 3.5),
+]
+
+# --- VideoSentences 클래스 테스트 ---
+
+
+def test_video_sentences_behaves_like_a_list():
+    """버퍼와 오프셋으로 저장해도 원래 문장 리스트와 같은 값을 돌려주는지 테스트합니다."""
+    video = VideoSentences("abc", SENTENCES)
+
+    assert len(video) == 3
+    assert video[1] == Sentence("How are you?", 1.5, 3.0)
+    assert video[-1] == Sentence("Fine!", 3.0, 3.5)
+    assert video.text(0) == "Hello world."
+    assert list(video) == SENTENCES
+    # [텍스트, 시작, 끝] 리스트로도 만들 수 있습니다. (코퍼스에 저장된 형식)
+    assert list(VideoSentences("abc", [["Hi.", 0.0, 1.0]])) == [Sentence("Hi.", 0.0, 1.0)]
+
+
+# --- SentenceStore 클래스 테스트 ---
+
+
+def test_store_keeps_one_copy_per_video():
+    """여러 세션이 같은 영상을 저장해도 처음 저장한 한 벌만 공유하는지 테스트합니다."""
+    store = SentenceStore()
+    first = store.put("abc", SENTENCES)
+    second = store.put("abc", list(SENTENCES))
+
+    assert second is first
+    assert store.get_or_load("abc", lambda video_id: None) is first
+    assert store.stats()["videos"] == 1
+
+
+def test_store_reloads_evicted_video():
+    """보관 한도를 넘어 밀려난 영상은 loader로 다시 불러오는지 테스트합니다."""
+    store = SentenceStore(max_videos=1)
+    loads = []
+
+    def loader(video_id):
+        loads.append(video_id)
+        return SENTENCES
+
+    store.get_or_load("abc", loader)
+    store.get_or_load("def", loader)  # 'abc'가 밀려납니다.
+    assert store.get("abc") is None
+    assert store.get_or_load("abc", loader)[0] == SENTENCES[0]
+    assert loads == ["abc", "def", "abc"]
+    assert store.get_or_load("missing", lambda video_id: None) is None
@@ -0,0 +1,86 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from single_flight import SingleFlight
+
+# --- SingleFlight 테스트 ---
+# 첫 호출이 threading.Event에서 멈춰 있는 동안 나머지 호출을 보내, 호출들이 확실히 겹치게 만듭니다.
+
+
+def _start_leader(flight, key, fn):
+    """첫 호출을 별도 스레드에서 시작하고, fn 안에 들어갈 때까지 기다립니다."""
+    entered = threading.Event()
+    release = threading.Event()
+
+    def blocking():
+        entered.set()
+        release.wait(5)
+        return fn()
+
+    pool = ThreadPoolExecutor(max_workers=8)
+    leader = pool.submit(flight.do, key, blocking)
+    assert entered.wait(5)
+    return pool, leader, release
+
+
+def _wait_for_followers(flight, count):
+    # 기다리는 호출이 모두 등록될 때까지 기다립니다. ('suppressed'는 등록되는 순간 늘어납니다.)
+    for _ in range(500):
+        if flight.stats()["suppressed"] >= count:
+            return
+        threading.Event().wait(0.01)
+    raise AssertionError("followers did not join")
+
+
+def test_single_flight_runs_function_once_for_concurrent_callers():
+    """같은 키의 동시 호출은 함수를 한 번만 실행하고, 모두 같은 결과를 받는지 테스트합니다."""
+    flight = SingleFlight("test")
+    calls = []
+    pool, leader, release = _start_leader(flight, "video", lambda: calls.append(1) or "transcript")
+    followers = [pool.submit(flight.do, "video", lambda: calls.append(1) or "other") for _ in range(5)]
+    _wait_for_followers(flight, 5)
+    release.set()
+
+    assert leader.result() == "transcript"
+    assert [f.result() for f in followers] == ["transcript"] * 5
+    assert len(calls) == 1
+    assert flight.stats() == {"executed": 1, "suppressed": 5, "timeouts": 0, "in_flight": 0}
+
+    # 호출이 끝나면 키를 지우므로, 다음 호출은 다시 실행됩니다.
+    assert flight.do("video", lambda: "fresh") == "fresh"
+    pool.shutdown()
+
+
+def test_single_flight_propagates_error_to_waiting_callers():
+    """첫 호출이 실패하면 기다리던 호출도 같은 예외를 받는지 테스트합니다."""
+    flight = SingleFlight("test")
+
+    def fail():
+        raise ConnectionError("upstream down")
+
+    pool, leader, release = _start_leader(flight, "video", fail)
+    follower = pool.submit(flight.do, "video", lambda: "unused")
+    _wait_for_followers(flight, 1)
+    release.set()
+
+    with pytest.raises(ConnectionError, match="upstream down"):
+        leader.result()
+    with pytest.raises(ConnectionError, match="upstream down"):
+        follower.result()
+    pool.shutdown()
+
+
+def test_single_flight_waiter_times_out_without_cancelling_leader():
+    """기다리는 호출은 시간 초과 시 TimeoutError를 받고, 첫 호출은 그대로 끝나는지 테스트합니다."""
+    flight = SingleFlight("test", timeout=5)
+    pool, leader, release = _start_leader(flight, "video", lambda: "done")
+
+    with pytest.raises(TimeoutError):
+        flight.do("video", lambda: "unused", timeout=0.05)
+    release.set()
+
+    assert leader.result() == "done"
+    assert flight.stats()["timeouts"] == 1
+    pool.shutdown()
@@ -1,5 +1,5 @@
 from utils import extract_video_id_from_url
-from youtube_script_processor import clean_script, split_into_sentences
+from youtube_script_processor import clean_script, split_into_sentences, stream_sentences, Sentence
 
 # 테스트 함수의 이름은 'test_'로 시작해야 pytest가 인식합니다.
 
@@ -93,14 +93,56 @@ def test_split_into_sentences_empty_string():
     expected = []
     assert split_into_sentences(script) == expected
 
-from utils import evaluate
+import json
+# --- stream_sentences 함수 테스트 --- 
+
+
+def test_stream_sentences_keeps_timestamps():
+    """문장마다 시작/끝 시간을 자막 조각에서 가져오는지 테스트합니다."""
+    snippets = [
+        ["Hello world.", 0.0, 1.5],
+        ["This is [Music] a", 1.5, 2.0],
+        ["test! Is it working", 3.5, 2.5],
+    ]
+    assert list(stream_sentences(snippets)) == [
+        Sentence("Hello world.", 0.0, 1.5),
+        Sentence("This is a test!", 1.5, 6.0),
+        Sentence("Is it working", 3.5, 6.0),
+    ]
+
+
+def test_stream_sentences_matches_string_pipeline():
+    """clean_script + split_into_sentences와 같은 문장을 만드는지 테스트합니다."""
+    snippets = [
+        ["[Applause] Welcome  back.", 0.0, 2.0],
+        ["Today we\nlearn", 2.0, 2.0],
+        ["Python! Ready?", 4.0, 1.0],
+        ["[Music]", 5.0, 1.0],
+        ["Let's go. Mr. Kim", 6.0, 2.0],
+    ]
+    joined = " ".join(text for text, _, _ in snippets)
+    expected = split_into_sentences(clean_script(joined))
+    assert [s.text for s in stream_sentences(snippets)] == expected
+
+
+def test_stream_sentences_is_lazy():
+    """전체 자막을 다 읽기 전에 첫 문장을 내보내는지 테스트합니다."""
+
+    def snippets():
+        yield ["First sentence.", 0.0, 1.0]
+        raise AssertionError("첫 문장 이후의 조각을 미리 읽으면 안 됩니다.")
+
+    assert next(stream_sentences(snippets())).text == "First sentence."
+
+
+from utils import evaluate, evaluate_batch
 import pytest
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch, MagicMock, ANY
+from gemini_client import PromptTemplate
 
 # --- evaluate 함수 테스트 --- 
 
-@patch('utils.genai.Client')
-def test_evaluate_loads_prompt_from_file(mock_gemini_client):
+def test_evaluate_loads_prompt_from_file(tmp_path):
     """
     evaluate 함수가 파일에서 프롬프트 템플릿을 올바르게 로드하는지 테스트합니다.
     Java/Spring 관점:
@@ -109,27 +151,152 @@ def test_evaluate_loads_prompt_from_file(mock_gemini_client):
     """
     # 모의(mock) 클라이언트와 응답 객체를 설정합니다.
     # 실제 API 응답을 흉내 내어, API 호출이 성공했다고 가정합니다.
+    mock_client = MagicMock()
     mock_response = MagicMock()
     mock_response.text = '{"score": 100, "positive_feedback": "Great job!", "points_for_improvement": []}'
-    mock_gemini_client.return_value.models.generate_content.return_value = mock_response
+    mock_client.models.generate_content.return_value = mock_response
 
-    # 테스트용 프롬프트 파일 내용을 정의합니다.
-    mock_prompt_content = "Prompt template: {original_text} vs {user_text}"
+    # 테스트용 프롬프트 파일을 임시 디렉터리에 만듭니다.
+    # Spring에서 테스트 시 실제 리소스 대신 테스트 전용 리소스를 사용하는 것과 유사한 원리입니다.
+    prompt_file = tmp_path / "evaluation_prompt.md"
+    prompt_file.write_text("Prompt template: {original_text} vs {user_text}", encoding="utf-8")
 
-    # 'builtins.open'을 모킹하여 실제 파일 I/O를 방지합니다.
-    # mock_open()은 파일 읽기 작업을 가로채 미리 정의된 내용을 반환합니다.
-    # Spring에서 테스트 시 파일 시스템 대신 인메모리 데이터베이스나 리소스를 사용하는 것과 유사한 원리입니다.
-    with patch('builtins.open', mock_open(read_data=mock_prompt_content)) as mock_file:
+    with patch("utils.get_client", return_value=mock_client), \
+            patch("utils.EVALUATION_PROMPT", PromptTemplate(str(prompt_file))):
         # 테스트할 함수를 호출합니다.
         evaluate("original", "user")
 
-        # open 함수가 올바른 경로로 호출되었는지 확인합니다.
-        mock_file.assert_called_once_with("prompts/evaluation_prompt.md", "r", encoding="utf-8")
+    # Gemini API 클라이언트의 generate_content 메소드가 호출될 때,
+    # 파일에서 읽은 내용으로 포맷팅된 프롬프트가 전달되었는지 확인합니다.
+    mock_client.models.generate_content.assert_called_once_with(
+        model="gemini-2.5-flash",
+        contents="Prompt template: original vs user",
+        config=ANY,
+    )
+
+
+# --- evaluate_batch 함수 테스트 --- 
+
+def _batch_response(items):
+    """모의 배치 응답 객체를 만듭니다."""
+    response = MagicMock()
+    response.text = json.dumps(items)
+    return response
+
+
+def test_evaluate_batch_maps_results_by_index():
+    """응답 순서가 바뀌어도 index로 결과를 원래 위치에 넣는지 테스트합니다."""
+    mock_client = MagicMock()
+    mock_client.models.generate_content.return_value = _batch_response([
+        {"index": 1, "score": 80, "positive_feedback": "B", "points_for_improvement": []},
+        {"index": 0, "score": 100, "positive_feedback": "A", "points_for_improvement": []},
+    ])
+
+    with patch("utils.get_client", return_value=mock_client):
+        results = evaluate_batch([("one", "won"), ("two", "too")])
+
+    assert [r["score"] for r in results] == [100, 80]
+    # 두 문장이 한 번의 요청으로 채점되었는지 확인합니다.
+    assert mock_client.models.generate_content.call_count == 1
 
-        # Gemini API 클라이언트의 generate_content 메소드가 호출될 때,
-        # 파일에서 읽은 내용으로 포맷팅된 프롬프트가 전달되었는지 확인합니다.
-        expected_prompt = mock_prompt_content.format(original_text="original", user_text="user")
-        mock_gemini_client.return_value.models.generate_content.assert_called_once_with(
-            model="gemini-2.5-flash",
-            contents=expected_prompt
-        )
+
+def test_evaluate_batch_retries_only_malformed_item():
+    """형식이 잘못된 항목만 개별적으로 다시 채점하는지 테스트합니다."""
+    mock_client = MagicMock()
+    mock_client.models.generate_content.return_value = _batch_response([
+        {"index": 0, "score": 100, "positive_feedback": "A", "points_for_improvement": []},
+        {"index": 1, "positive_feedback": "score가 빠진 항목"},
+        {"index": 2, "score": 70, "positive_feedback": "C", "points_for_improvement": []},
+    ])
+    retried = {"score": 90, "positive_feedback": "retried", "points_for_improvement": []}
+
+    with patch("utils.get_client", return_value=mock_client), \
+            patch("utils.evaluate", return_value=retried) as mock_evaluate:
+        results = evaluate_batch([("a", "a"), ("b", "bb"), ("c", "cc")])
+
+    mock_evaluate.assert_called_once_with("b", "bb")
+    assert [r["score"] for r in results] == [100, 90, 70]
+
+
+def test_evaluate_batch_splits_chunk_when_response_is_not_json():
+    """묶음 응답 전체가 깨지면 반으로 나누어 다시 요청하는지 테스트합니다."""
+    broken = MagicMock()
+    broken.text = "not json"
+    mock_client = MagicMock()
+    mock_client.models.generate_content.return_value = broken
+    fallback = {"score": 50, "positive_feedback": "single", "points_for_improvement": []}
+
+    with patch("utils.get_client", return_value=mock_client), \
+            patch("utils.evaluate", return_value=fallback) as mock_evaluate:
+        results = evaluate_batch([("a", "x"), ("b", "y")])
+
+    assert results == [fallback, fallback]
+    assert mock_evaluate.call_count == 2
+
+
+def test_evaluate_skips_gemini_for_trivial_difference():
+    """사소한 차이만 있으면 Gemini를 호출하지 않고 로컬 채점 결과를 반환하는지 테스트합니다."""
+    mock_client = MagicMock()
+    with patch("utils.get_client", return_value=mock_client):
+        result = evaluate("Hello, world.", "hello world")
+
+    mock_client.models.generate_content.assert_not_called()
+    assert result["source"] == "local"
+
+
+def test_evaluate_falls_back_to_local_score_on_api_error():
+    """Gemini 호출이 실패하면 로컬 채점 결과로 대체하는지 테스트합니다."""
+    mock_client = MagicMock()
+    mock_client.models.generate_content.side_effect = TimeoutError("timed out")
+    with patch("utils.get_client", return_value=mock_client):
+        result = evaluate("I went home.", "I want home.")
+
+    assert result["source"] == "local"
+    assert "timed out" in result["fallback_reason"]
+    assert result["points_for_improvement"][0]["original"] == "went"
+
+
+def test_evaluate_reuses_cached_result_for_same_pair():
+    """같은 (원본, 받아쓰기) 조합은 두 번째부터 Gemini를 호출하지 않는지 테스트합니다."""
+    mock_client = MagicMock()
+    mock_response = MagicMock()
+    mock_response.text = '{"score": 80, "positive_feedback": "Good", "points_for_improvement": []}'
+    mock_client.models.generate_content.return_value = mock_response
+
+    with patch("utils.get_client", return_value=mock_client):
+        first = evaluate("I went home.", "I want home.")
+        second = evaluate("I went home.", "I want  home.")
+
+    assert first == second
+    assert mock_client.models.generate_content.call_count == 1
+
+
+def test_evaluate_sends_only_mistakes_for_long_sentence():
+    """긴 문장은 틀린 구간만 보내고, 응답을 전체 문장 기준의 결과로 되돌리는지 테스트합니다."""
+    original = (
+        "So the thing about machine learning is that, in the end, it is mostly about data "
+        "and how carefully you prepare it before you ever start training a model, "
+        "which is why so many teams spend most of their time cleaning and labeling examples."
+    )
+    user = original.replace("carefully", "careful")
+    mock_client = MagicMock()
+    mock_response = MagicMock()
+    mock_response.text = json.dumps({
+        "score": 80,
+        "positive_feedback": "Good",
+        "points_for_improvement": [
+            {"original": "carefully", "user_input": "careful", "suggestion": "Use the adverb.", "excerpt": 1},
+        ],
+    })
+    mock_client.models.generate_content.return_value = mock_response
+
+    with patch("utils.get_client", return_value=mock_client):
+        result = evaluate(original, user)
+
+    prompt = mock_client.models.generate_content.call_args.kwargs["contents"]
+    assert "how carefully you prepare" in prompt
+    assert "machine learning" not in prompt and "labeling examples" not in prompt
+    assert result["score"] > 80
+    assert result["points_for_improvement"] == [
+        {"original": "carefully", "user_input": "careful", "suggestion": "Use the adverb."}
+    ]
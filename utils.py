@@ -3,88 +3,434 @@
 # 애플리케이션의 여러 부분에서 공통적으로 사용될 수 있는 헬퍼(helper) 함수나 비즈니스 로직을 모아둡니다.
 # 예를 들어, 'YoutubeService'나 'GeminiApiService' 클래스에 있을 법한 메소드들이 여기에 함수 형태로 존재합니다.
 
-import re
 import json
-import streamlit as st
-from youtube_transcript_api import YouTubeTranscriptApi
+import time
 from urllib.parse import urlparse, parse_qs
-from google import genai
-from pydantic import BaseModel # 모델이 JSON을 생성하도록 제한하기 위해 Recipe 클래스에서 필요해서
+
+# 무거운 라이브러리(google-genai, pydantic)는 여기서 바로 import하지 않습니다.
+# 실제로 채점을 요청하는 함수 안에서 처음 필요할 때 import하여 앱 시작 시간을 줄입니다.
+# (Python은 한 번 import한 모듈을 sys.modules에 보관하므로, 두 번째 호출부터는 비용이 거의 없습니다.)
+from gemini_client import (
+    get_client,
+    EVALUATION_PROMPT,
+    BATCH_EVALUATION_PROMPT,
+    COMPACT_EVALUATION_PROMPT,
+    GEMINI_MODEL,
+    GEMINI_TIMEOUT_MS,
+)
+from grading_cache import GRADING_CACHE, grading_cache_key
+from local_scorer import score_locally, is_trivial
+from grading_cascade import GRADING_CASCADE
+from metrics import METRICS, error_type
+from prompt_compaction import compact
+from single_flight import SingleFlight
+
+# 한 번의 요청에 담을 최대 문장 수입니다. 응답 JSON이 출력 토큰 한도를 넘지 않도록 적당한 크기로 나눕니다.
+EVALUATE_BATCH_SIZE = 50
+
+# 같은 (원본, 받아쓰기) 조합의 채점을 여러 세션이 동시에 요청하면 Gemini에는 한 번만 요청합니다.
+# 기다리는 쪽의 최대 대기 시간은 'grading_wait_seconds()'로 호출할 때마다 정합니다.
+GRADING_FLIGHT = SingleFlight("gemini_grading")
+
+
+def grading_wait_seconds():
+    """
+    채점 하나를 기다릴 최대 시간입니다. 채점 단계(grading_cascade.py)마다 Gemini를 한 번씩 부를 수 있으므로,
+    Gemini 요청 하나의 최대 대기 시간에 단계 수를 곱합니다. (저렴한 모델에서 강한 모델로 넘어가도 끝까지 기다립니다.)
+    """
+    return GEMINI_TIMEOUT_MS / 1000 * len(GRADING_CASCADE.tiers)
+
+
+def _grading_prompt_version():
+    """
+    채점 결과 캐시 키에 넣을 프롬프트 버전입니다.
+    긴 문장은 틀린 부분만 골라 보내는 프롬프트로 채점하므로, 두 템플릿 중 하나만 바뀌어도 이전 결과를 쓰지 않게 합니다.
+    """
+    return f"{EVALUATION_PROMPT.version}+{COMPACT_EVALUATION_PROMPT.version}"
+
+
+def prepare_grading(original_text, user_text):
+    """
+    Gemini를 부르기 전에 할 수 있는 일을 먼저 처리합니다.
+    (바로 반환할 결과 또는 None, 로컬 채점 결과, 캐시 키) 튜플을 반환합니다.
+
+    - 로컬 채점에서 단어 단위 실수가 없으면 로컬 결과를 바로 반환할 결과로 돌려줍니다.
+    - 채점 결과 캐시에 같은 조합이 있으면 캐시된 결과를 돌려줍니다.
+    """
+    # 로컬 채점은 수 밀리초 안에 끝나므로 항상 먼저 수행합니다.
+    local_result = score_locally(original_text, user_text)
+    if is_trivial(local_result):
+        # 채점 단계(grading_cascade.py)의 첫 단계인 로컬 채점으로 끝난 요청으로 기록합니다.
+        GRADING_CASCADE.record_local()
+        return local_result, local_result, None
+
+    # 같은 문장을 같은 내용으로 받아쓴 결과가 이미 있으면 Gemini를 다시 부르지 않습니다.
+    # 채점 단계의 구성(모델, 기준값)이 바뀌면 결과도 달라질 수 있으므로 키에 함께 넣습니다.
+    cache_key = grading_cache_key(
+        original_text, user_text, _grading_prompt_version(), GRADING_CASCADE.name
+    )
+    return GRADING_CACHE.get(cache_key), local_result, cache_key
+
+
+def _build_grading_request(original_text, user_text, model=GEMINI_MODEL, with_confidence=False):
+    """
+    'generate_content'에 넘길 인자(model, contents, config)와, 틀린 부분만 골라 보낸 경우의 CompactedRequest(아니면 None)를 반환합니다.
+    'with_confidence'가 참이면 채점 결과와 함께 모델이 스스로 평가한 확신도('confidence', 0.0~1.0)도 받습니다.
+
+    - 긴 문장에서 틀린 곳이 일부뿐이면 틀린 구간과 앞뒤 몇 단어만 보내고(prompt_compaction.py),
+      응답은 'CompactedRequest.expand'로 전체 문장 기준의 결과로 되돌려야 합니다.
+    - 줄인 만큼의 프롬프트 문자 수를 'gemini_prompt_chars_saved_total' 지표로 기록합니다.
+    """
+    from grading_schema import (
+        CompactGradingResult,
+        ConfidentCompactGradingResult,
+        ConfidentGradingResult,
+        GradingResult,
+    )
+
+    # 프롬프트 템플릿은 메모리에 보관된 것을 사용하고, 파일이 수정된 경우에만 다시 읽습니다.
+    prompt_template = EVALUATION_PROMPT.get()
+
+    # 읽어온 템플릿에 실제 값을 채워넣어 최종 프롬프트를 완성합니다.
+    # Java의 String.format()이나 메시지 템플릿을 사용하는 것과 같습니다.
+    prompt = prompt_template.format(
+        original_text=original_text, user_text=user_text
+    )
+    # main.py가 읽는 채점 결과(score, positive_feedback, points_for_improvement)와 같은 구조로 응답하게 합니다.
+    schema = ConfidentGradingResult if with_confidence else GradingResult
+
+    compaction = compact(original_text, user_text)
+    if compaction is not None:
+        compact_prompt = compaction.format_prompt(COMPACT_EVALUATION_PROMPT.get())
+        if len(compact_prompt) < len(prompt):
+            METRICS.increment("grading_prompt_compactions_total")
+            METRICS.increment("gemini_prompt_chars_saved_total", len(prompt) - len(compact_prompt))
+            prompt = compact_prompt
+            # 개선할 점마다 발췌 구간 번호('excerpt')를 함께 받아, 전체 문장의 위치로 되돌릴 때 사용합니다.
+            schema = ConfidentCompactGradingResult if with_confidence else CompactGradingResult
+        else:
+            compaction = None
+
+    request = {
+        "model": model,
+        "contents": prompt,
+        "config": {
+            "response_mime_type": "application/json",
+            "response_schema": schema,
+        },
+    }
+    return request, compaction
+
+
+def _record_usage(prompt, response, kind="single"):
+    """
+    프롬프트/응답 크기(문자 수)와 토큰 사용량을 지표로 기록합니다.
+    토큰 수는 응답의 'usage_metadata'에 있을 때만 기록합니다. (Micrometer의 DistributionSummary와 같습니다.)
+    """
+    METRICS.observe("gemini_prompt_chars", len(prompt), kind=kind)
+    METRICS.observe("gemini_response_chars", len(response.text or ""), kind=kind)
+    usage = getattr(response, "usage_metadata", None)
+    for field, direction in (("prompt_token_count", "prompt"), ("candidates_token_count", "response")):
+        count = getattr(usage, field, None)
+        if isinstance(count, int):
+            METRICS.increment("gemini_tokens_total", count, kind=kind, direction=direction)
+
+
+def _parse_grading_response(response):
+    # # API 응답(response)에서 텍스트 부분만 추출하고, 불필요한 마크다운 형식을 제거합니다.
+    # 250825:1638: 어차피 API에 JSON 주라 했으니까 불필요한 부분임.
+    # json_response_text = response.text.strip()
+    # if json_response_text.startswith("```json"):
+    #     json_response_text = (
+    #         json_response_text.strip("```json").strip("```").strip()
+    #     )
+
+    # print("json_response_text : " + json_response_text)
+
+    # JSON 문자열을 Python 딕셔너리로 파싱합니다. Java의 'objectMapper.readValue(jsonString, Map.class)'와 유사합니다.
+    return json.loads(response.text)  # 위의 코드가 있다면 response.text는 json_response_text임.
+
+
+def request_model_grading(original_text, user_text, model=GEMINI_MODEL, with_confidence=False):
+    """
+    Gemini 모델 하나에 채점을 요청하고 (파싱된 결과, 응답의 usage_metadata) 튜플을 반환합니다.
+    채점 단계(grading_cascade.GeminiTier)가 단계마다 다른 모델로 호출하며, 토큰 사용량으로 비용을 계산합니다.
+    """
+    # Spring에서 싱글톤 빈을 주입받듯, 프로세스 전체에서 공유하는 클라이언트를 가져옵니다.
+    # 클라이언트를 재사용하므로 HTTP 커넥션 풀도 함께 재사용됩니다.
+    client = get_client()
+    request, compaction = _build_grading_request(original_text, user_text, model, with_confidence)
+    # 외부 API를 호출하는 부분입니다. Java의 'restTemplate.postForObject()'나 Feign Client의 메소드 호출과 같습니다.
+    with METRICS.span("gemini_request"):
+        response = client.models.generate_content(**request)
+    _record_usage(request["contents"], response)
+    scoring_result = _parse_grading_response(response)
+    if compaction:
+        scoring_result = compaction.expand(scoring_result)
+    return scoring_result, getattr(response, "usage_metadata", None)
+
+
+async def request_model_grading_async(original_text, user_text, model=GEMINI_MODEL, with_confidence=False):
+    """
+    'request_model_grading'의 비동기 버전입니다. 클라이언트의 비동기 API('client.aio')를 사용합니다.
+
+    Java/Spring 관점:
+    - 'async def' 함수는 WebClient가 반환하는 'Mono'처럼, 기다리는 동안 스레드를 막지 않는 호출입니다.
+    """
+    request, compaction = _build_grading_request(original_text, user_text, model, with_confidence)
+    with METRICS.span("gemini_request"):
+        response = await get_client().aio.models.generate_content(**request)
+    _record_usage(request["contents"], response)
+    scoring_result = _parse_grading_response(response)
+    if compaction:
+        scoring_result = compaction.expand(scoring_result)
+    return scoring_result, getattr(response, "usage_metadata", None)
+
+
+def request_grading(original_text, user_text):
+    """
+    채점 단계(grading_cascade.py)를 따라 Gemini에 채점을 요청하고 결과를 반환합니다.
+    저렴한 모델의 결과가 미덥지 않으면 더 강한 모델로 다시 채점합니다. (기본 구성은 GEMINI_MODEL 한 단계입니다.)
+    'evaluate'와 달리 실패하면 예외를 그대로 발생시키므로, 재시도 여부를 호출하는 쪽에서 결정할 수 있습니다.
+    """
+    return GRADING_CASCADE.grade(original_text, user_text)
+
+
+async def request_grading_async(original_text, user_text):
+    """
+    'request_grading'의 비동기 버전입니다.
+    """
+    return await GRADING_CASCADE.grade_async(original_text, user_text)
+
+
+def _request_and_cache(original_text, user_text, cache_key):
+    started = time.perf_counter()
+    scoring_result = request_grading(original_text, user_text)
+    GRADING_CACHE.record_api_call(time.perf_counter() - started)
+    GRADING_CACHE.set(cache_key, scoring_result)
+    return scoring_result
 
 
 def evaluate(original_text, user_text):
     """
     사용자가 얼마나 원본 텍스트를 잘 받아쓰기했는지 Gemini API를 사용하여 평가합니다.
-    성공 시 평가 결과를 담은 JSON 객체를, 실패 시 오류 정보를 담은 JSON 객체를 반환합니다.
+    성공 시 평가 결과를 담은 JSON 객체를 반환합니다.
+
+    - 먼저 로컬 채점(local_scorer)을 수행하고, 단어 단위 실수가 없으면 Gemini를 부르지 않고 바로 반환합니다.
+    - Gemini 호출이 실패하거나(시간 초과 포함) 응답 JSON을 파싱할 수 없으면 로컬 채점 결과를 대신 반환하며,
+      이때 'fallback_reason' 키에 원인을 담습니다.
 
     Java/Spring 관점:
     - 이 함수는 외부 API(Gemini)를 호출하는 서비스 메소드(e.g., 'evaluateDictation')와 같습니다.
     - 'try...except' 블록은 Java의 'try...catch'와 동일하며, 예외 처리를 담당합니다.
     - 'json.loads()'는 JSON 문자열을 Python 객체(딕셔너리)로 변환하는 기능으로, Java의 Jackson이나 Gson 라이브러리가 JSON을 DTO 객체로 변환하는 것과 유사합니다.
     """
+    with METRICS.span("evaluate"):
+        ready_result, local_result, cache_key = prepare_grading(original_text, user_text)
+        if ready_result is not None:
+            return ready_result
+
+        try:
+            # 같은 조합을 동시에 채점 중인 세션이 있으면 새로 요청하지 않고 그 결과를 함께 받습니다.
+            return GRADING_FLIGHT.do(
+                cache_key, _request_and_cache, original_text, user_text, cache_key,
+                timeout=grading_wait_seconds(),
+            )
+
+        except json.JSONDecodeError as e:
+            # Java의 'catch (JsonProcessingException e)'와 유사합니다. JSON 파싱 실패 시 로컬 채점 결과로 대체합니다.
+            METRICS.increment("evaluate_errors_total", type=error_type(e))
+            return dict(local_result, fallback_reason=f"JSON 파싱 오류: {e}")
+        except Exception as e:
+            # Java의 'catch (Exception e)'와 같이, 예상치 못한 모든 예외(네트워크 오류, 시간 초과 등)를 처리하는 부분입니다.
+            METRICS.increment("evaluate_errors_total", type=error_type(e))
+            return dict(local_result, fallback_reason=f"기타 오류: {e}")
+
+
+def _complete_fields(partial):
+    """
+    부분 파싱 결과에서 화면에 보여줄 수 있을 만큼 완성된 필드만 남깁니다.
+    개선할 점은 세 항목(original, user_input, suggestion)이 모두 도착한 것만 포함합니다.
+    """
+    if not isinstance(partial, dict):
+        return {}
+    fields = {}
+    if isinstance(partial.get("score"), int):
+        fields["score"] = partial["score"]
+    if isinstance(partial.get("positive_feedback"), str):
+        fields["positive_feedback"] = partial["positive_feedback"]
+    points = partial.get("points_for_improvement")
+    if isinstance(points, list):
+        fields["points_for_improvement"] = [
+            point
+            for point in points
+            if isinstance(point, dict) and {"original", "user_input", "suggestion"} <= point.keys()
+        ]
+    return fields
+
+
+async def request_grading_stream_async(original_text, user_text, on_partial):
+    """
+    채점 결과를 스트리밍으로 요청합니다. 조금씩 채워진 결과를 받는 대로 'on_partial'에 넘기고, 검증한 최종 결과를 반환합니다.
+    'request_grading_async'처럼 실패하면 예외를 그대로 발생시키며, 재시도와 로컬 채점 대체는 grading_service가 맡습니다.
+
+    - 점수가 도착하면 곧바로 {"score": ..., "partial": True}를 넘기고, 잘한 점과 개선할 점은 도착하는 대로 채워서 다시 넘깁니다.
+    - 채점 단계가 여러 개이면 저렴한 모델의 결과를 확인하기 전에 보여줄 수 없으므로,
+      스트리밍하지 않고 'request_grading_async'(채점 단계)로 채점합니다.
+
+    Java/Spring 관점:
+    - WebFlux에서 'Flux<GradingResult>'를 구독하며 onNext마다 화면을 갱신하는 것과 같습니다.
+    """
+    from partial_json import PartialJSONParser
+
+    model = GRADING_CASCADE.streamable_model
+    if model is None:
+        return await request_grading_async(original_text, user_text)
+
+    request, compaction = _build_grading_request(original_text, user_text, model)
+    parser = PartialJSONParser()
+    shown = {}
+    usage = None
+    started = time.perf_counter()
     try:
-        # Java의 'new GeminiApiClient()'와 같이 클라이언트 객체를 생성합니다.
-        # API 키는 환경 변수에서 자동으로 로드됩니다. Spring의 @Value("${gemini.api.key}")와 유사한 방식입니다.
-        client = genai.Client()
-
-        # https://ai.google.dev/gemini-api/docs/structured-output?hl=ko에서 가져옴
-        # 모델이 JSON 파일로만 응답하도록 responseSchema를 구성함.
-        class Recipe(BaseModel):
-            recipe_name: str
-            ingredients: list[str]
-
-        # Java에서 설정 파일을 읽어오듯, .md 파일에서 프롬프트 템플릿을 읽어옵니다.
-        # 이는 Spring의 ResourceLoader를 사용하여 클래스패스나 파일 시스템에서 리소스를 읽는 것과 유사합니다.
-        with open("prompts/evaluation_prompt.md", "r", encoding="utf-8") as f:
-            prompt_template = f.read()
-
-        # 읽어온 템플릿에 실제 값을 채워넣어 최종 프롬프트를 완성합니다.
-        # Java의 String.format()이나 메시지 템플릿을 사용하는 것과 같습니다.
-        prompt = prompt_template.format(
-            original_text=original_text, user_text=user_text
-        )
-        # 외부 API를 호출하는 부분입니다. Java의 'restTemplate.postForObject()'나 Feign Client의 메소드 호출과 같습니다.
-        response = client.models.generate_content(
-            model="gemini-2.5-flash", 
+        with METRICS.span("gemini_stream_request"):
+            async for chunk in await get_client().aio.models.generate_content_stream(**request):
+                # 토큰 사용량은 마지막 조각에 담겨 옵니다.
+                usage = getattr(chunk, "usage_metadata", None) or usage
+                partial = parser.feed(chunk.text or "")
+                if partial is None:
+                    continue
+                fields = _complete_fields(partial)
+                if compaction:
+                    fields = compaction.expand(fields)
+                if "score" not in fields or fields == shown:
+                    # 점수가 오기 전에는 아무것도 보여주지 않습니다. (점수 없는 채점 결과는 의미가 없습니다.)
+                    continue
+                shown = fields
+                on_partial(dict(fields, partial=True))
+        METRICS.observe("gemini_prompt_chars", len(request["contents"]), kind="stream")
+        METRICS.observe("gemini_response_chars", len(parser.text), kind="stream")
+
+        # 조각을 모두 받은 뒤 전체 텍스트를 스키마로 검증합니다. 부분 결과와 달리 여기서는 형식 오류를 그대로 드러냅니다.
+        scoring_result = request["config"]["response_schema"].model_validate(json.loads(parser.text)).model_dump()
+    except Exception as e:
+        GRADING_CASCADE.record_stream(time.perf_counter() - started, error=e)
+        raise
+    GRADING_CASCADE.record_stream(time.perf_counter() - started, usage)
+    if compaction:
+        scoring_result = compaction.expand(scoring_result)
+    return scoring_result
+
+
+def evaluate_batch(pairs, batch_size=EVALUATE_BATCH_SIZE):
+    """
+    여러 문장을 최소한의 요청으로 한꺼번에 채점합니다.
+    'pairs'는 (원본 문장, 받아쓰기) 튜플의 리스트이며, 같은 순서의 채점 결과 리스트를 반환합니다.
+
+    - 'batch_size'개씩 묶어 한 번의 Gemini 요청으로 보내고, 응답의 'index'로 결과를 원래 위치에 넣습니다.
+    - 응답 중 형식이 잘못된 항목이나 빠진 항목은 'evaluate'로 그 문장만 따로 다시 채점합니다.
+    - 묶음 전체의 응답이 깨진 경우에는 묶음을 반으로 나누어 다시 요청하므로, 한 문장 때문에 전체가 실패하지 않습니다.
+    - 로컬 채점으로 충분한 문장(사소한 차이)이나 채점 결과 캐시에 있는 문장은 요청에 포함하지 않습니다.
+
+    Java/Spring 관점:
+    - JDBC의 'addBatch()/executeBatch()'처럼 여러 작업을 모아 왕복(round trip) 횟수를 줄이는 방식입니다.
+    """
+    results = [None] * len(pairs)
+    indexed_pairs = []
+    for index, (original_text, user_text) in enumerate(pairs):
+        # 사소한 차이만 있는 문장은 로컬 채점 결과로 바로 채우고, 나머지만 Gemini에 보냅니다.
+        local_result = score_locally(original_text, user_text)
+        if is_trivial(local_result):
+            # 'prepare_grading'과 같이 채점 단계의 로컬 채점으로 끝난 요청으로 기록합니다.
+            GRADING_CASCADE.record_local()
+            results[index] = local_result
+            continue
+        # 이미 채점한 적이 있는 (원본, 받아쓰기) 조합은 캐시에서 바로 가져옵니다.
+        cached_result = GRADING_CACHE.get(_batch_cache_key(original_text, user_text))
+        if cached_result is not None:
+            results[index] = cached_result
+        else:
+            indexed_pairs.append((index, (original_text, user_text)))
+    for start in range(0, len(indexed_pairs), batch_size):
+        _evaluate_chunk(indexed_pairs[start:start + batch_size], results)
+    return results
+
+
+def _batch_cache_key(original_text, user_text):
+    """
+    배치 채점 결과의 캐시 키입니다. 배치 요청은 채점 단계를 거치지 않고 항상 GEMINI_MODEL로 채점하므로,
+    채점 단계의 구성 이름이 아니라 그 모델 이름을 넣습니다. (여러 단계로 구성하면 단일 채점의 결과와 따로 보관됩니다.)
+    """
+    return grading_cache_key(original_text, user_text, _grading_prompt_version(), GEMINI_MODEL)
+
+
+def _evaluate_chunk(chunk, results):
+    """
+    (전역 인덱스, (원본, 받아쓰기)) 묶음을 한 번의 요청으로 채점해 'results'에 채워 넣습니다.
+    """
+    if len(chunk) == 1:
+        index, (original_text, user_text) = chunk[0]
+        results[index] = evaluate(original_text, user_text)
+        return
+
+    pairs_by_index = dict(chunk)
+    try:
+        items = _request_batch_grading(chunk)
+    except Exception:
+        # 응답 전체가 JSON이 아니거나 요청이 실패하면 묶음을 반으로 나누어 다시 시도합니다.
+        middle = len(chunk) // 2
+        _evaluate_chunk(chunk[:middle], results)
+        _evaluate_chunk(chunk[middle:], results)
+        return
+
+    from grading_schema import BatchGradingItem
+
+    expected = {index for index, _ in chunk}
+    for item in items:
+        # 항목 하나하나를 스키마로 검증합니다. 잘못된 항목은 건너뛰고 아래에서 개별 재채점합니다.
+        try:
+            graded = BatchGradingItem.model_validate(item)
+        except Exception:
+            continue
+        if graded.index in expected and results[graded.index] is None:
+            results[graded.index] = graded.model_dump(exclude={"index"})
+            original_text, user_text = pairs_by_index[graded.index]
+            # 실제로 채점한 모델(GEMINI_MODEL)의 키로 저장합니다. 채점 단계가 한 단계(기본값)이면 단일 채점과 같은 키이므로,
+            # 이후의 '채점하기' 클릭도 이 결과를 재사용합니다.
+            GRADING_CACHE.set(_batch_cache_key(original_text, user_text), results[graded.index])
+
+    for index, (original_text, user_text) in chunk:
+        if results[index] is None:
+            results[index] = evaluate(original_text, user_text)
+
+
+def _request_batch_grading(chunk):
+    """
+    묶음 하나를 Gemini에 보내고, 파싱된 JSON 리스트를 반환합니다. 실패하면 예외가 그대로 전달됩니다.
+    """
+    from grading_schema import BatchGradingItem
+
+    items_text = "\n\n".join(
+        f"**[Item {index}]**\n"
+        f"Original Script: {original_text}\n"
+        f"Student's Dictation: {user_text}"
+        for index, (original_text, user_text) in chunk
+    )
+    prompt = BATCH_EVALUATION_PROMPT.get().format(items=items_text)
+    with METRICS.span("gemini_batch_request"):
+        response = get_client().models.generate_content(
+            model=GEMINI_MODEL,
             contents=prompt,
             config={
                 "response_mime_type": "application/json",
-                "response_schema": list[Recipe],
+                "response_schema": list[BatchGradingItem],
             },
         )
-
-        # test부분. 나중에 완료되면 삭제할 것
-        print("response.text: " + response.text)
-
-        # # API 응답(response)에서 텍스트 부분만 추출하고, 불필요한 마크다운 형식을 제거합니다.
-        # 250825:1638: 어차피 API에 JSON 주라 했으니까 불필요한 부분임.
-        # json_response_text = response.text.strip()
-        # if json_response_text.startswith("```json"):
-        #     json_response_text = (
-        #         json_response_text.strip("```json").strip("```").strip()
-        #     )
-
-        # print("json_response_text : " + json_response_text)
-        
-        # JSON 문자열을 Python 딕셔너리로 파싱합니다. Java의 'objectMapper.readValue(jsonString, Map.class)'와 유사합니다.
-        scoring_result = json.loads(response.text)  # 위의 코드가 있다면 response.text는 json_response_text임.
-        return scoring_result
-
-    except json.JSONDecodeError as e:
-        # Java의 'catch (JsonProcessingException e)'와 유사합니다. JSON 파싱 실패 시 예외를 처리합니다.
-        return {
-            "error": "JSON 파싱 오류",
-            "details": str(e),
-            "raw_response": response.text
-            if "response" in locals() else "응답 객체를 받지 못했습니다.",
-        }
-    except Exception as e:
-        # Java의 'catch (Exception e)'와 같이, 예상치 못한 모든 예외를 처리하는 부분입니다.
-        return {
-            "error": "기타 오류",
-            "details": str(e),
-            "raw_response": "해당 오류 유형에서는 원본 응답을 사용할 수 없습니다.",
-        }
+    _record_usage(prompt, response, kind="batch")
+    items = json.loads(response.text)
+    if not isinstance(items, list):
+        raise ValueError("배치 채점 응답이 리스트 형식이 아닙니다.")
+    return items
 
 
 def extract_video_id_from_url(url):
@@ -1,64 +1,167 @@
+import os
 import re
 import streamlit as st
-from youtube_transcript_api import YouTubeTranscriptApi
-from urllib.parse import urlparse, parse_qs
+
+from disk_cache import DiskCache
+from metrics import METRICS
+from segmenter import segment_transcript, split_text
+from single_flight import SingleFlight
+
+# 디스크 캐시 설정은 환경 변수로 바꿀 수 있습니다. Spring의 application.properties에 캐시 설정을 두는 것과 같습니다.
+# - TRANSCRIPT_CACHE_PATH: SQLite 파일 경로 (여러 워커 프로세스가 같은 파일을 공유합니다)
+# - TRANSCRIPT_CACHE_TTL_SECONDS: 캐시 유효 시간 (기본 7일)
+# - TRANSCRIPT_CACHE_MAX_BYTES: 압축 후 전체 저장 용량 상한 (기본 256MB)
+TRANSCRIPT_CACHE = DiskCache(
+    path=os.environ.get("TRANSCRIPT_CACHE_PATH", ".cache/transcripts.sqlite3"),
+    ttl_seconds=float(os.environ.get("TRANSCRIPT_CACHE_TTL_SECONDS", 7 * 24 * 60 * 60)),
+    max_bytes=int(os.environ.get("TRANSCRIPT_CACHE_MAX_BYTES", 256 * 1024 * 1024)),
+)
+# 같은 영상의 자막을 여러 세션이 동시에 요청하면 YouTube에는 한 번만 요청합니다.
+# - TRANSCRIPT_FETCH_WAIT_SECONDS: 먼저 시작된 요청의 결과를 기다리는 최대 시간
+TRANSCRIPT_FLIGHT = SingleFlight(
+    "youtube_fetch", timeout=float(os.environ.get("TRANSCRIPT_FETCH_WAIT_SECONDS", 60))
+)
+
+
+def transcript_cache_key(video_id, track="en"):
+    """
+    디스크 캐시의 키를 만듭니다. 영상 ID와 자막 선택 기준(track)을 함께 사용합니다.
+    """
+    return f"transcript:{video_id}:{track}"
+
+
+@METRICS.timed("youtube_fetch")
+def fetch_transcript_record(video_id):
+    """
+    YouTube에서 영어 자막을 직접 가져와 캐시에 저장할 수 있는 형태(딕셔너리)로 반환합니다.
+    1. 수동(공식) 영어 자막을 최우선으로 찾습니다.
+    2. 없을 경우, 자동 생성 영어 자막을 찾습니다.
+
+    Streamlit UI 코드에 의존하지 않는 순수한 함수이므로, 테스트나 다른 진입점에서도 재사용할 수 있습니다.
+    자막이 없으면 예외를 발생시킵니다.
+    """
+    # youtube-transcript-api는 실제로 YouTube에서 자막을 가져올 때만 필요하므로 여기서 import합니다.
+    # (디스크 캐시에 있는 영상은 이 라이브러리를 전혀 불러오지 않습니다.)
+    from youtube_transcript_api import YouTubeTranscriptApi
+
+    api = YouTubeTranscriptApi()
+    transcript_list = api.list(video_id)
+
+    manual_english_transcript = None
+    generated_english_transcript = None
+
+    # 사용 가능한 자막 목록을 순회하며 가장 적합한 자막을 찾습니다.
+    for transcript in transcript_list:
+        if (
+            transcript.language_code.startswith("en")
+            and not transcript.is_generated
+        ):
+            manual_english_transcript = transcript
+            break  # 가장 좋은 것을 찾았으므로 반복을 중단합니다.
+        elif transcript.language_code.startswith("en"):
+            generated_english_transcript = transcript
+
+    if manual_english_transcript:
+        final_transcript = manual_english_transcript
+    elif generated_english_transcript:
+        final_transcript = generated_english_transcript
+    else:
+        # Java에서 'throw new Exception(...)'과 같이 예외를 발생시킵니다.
+        raise Exception("이 영상에는 영어 자막이 존재하지 않습니다.")
+
+    # 선택된 자막의 전체 텍스트 데이터를 가져옵니다.
+    full_transcript_data = final_transcript.fetch()
+    return {
+        "language_code": final_transcript.language_code,
+        "is_generated": final_transcript.is_generated,
+        # 자막 조각(snippet)의 시작 시간과 길이도 함께 보관합니다.
+        "snippets": [
+            [item.text, item.start, item.duration] for item in full_transcript_data
+        ],
+    }
+
+
+def _fetch_and_cache(video_id, cache_key):
+    # 기다리는 사이에 다른 호출이 이미 가져와 저장했을 수 있으므로 캐시를 한 번 더 확인합니다.
+    # 호출한 쪽이 이미 미스로 센 조회이므로, 적중률 통계에는 다시 세지 않습니다.
+    record = TRANSCRIPT_CACHE.get(cache_key, record_stats=False)
+    if record is None:
+        record = fetch_transcript_record(video_id)
+        TRANSCRIPT_CACHE.set(cache_key, record)
+    return record
+
+
+def _load_missing_transcript(video_id, cache_key):
+    # 디스크 캐시에 없던 자막을 가져옵니다. 같은 영상을 동시에 요청한 호출들 중 첫 번째만 YouTube에 요청합니다.
+    return TRANSCRIPT_FLIGHT.do(cache_key, _fetch_and_cache, video_id, cache_key)
+
+
+def load_transcript_record(video_id):
+    """
+    디스크 캐시에 있으면 그것을, 없으면 YouTube에서 가져와 캐시에 저장한 자막을 반환합니다.
+    같은 영상을 동시에 요청한 호출들 중 첫 번째만 YouTube에 요청하고, 나머지는 그 결과(또는 예외)를 함께 받습니다.
+    """
+    cache_key = transcript_cache_key(video_id)
+    record = TRANSCRIPT_CACHE.get(cache_key)
+    if record is None:
+        record = _load_missing_transcript(video_id, cache_key)
+    return record
+
 
 # '@st.cache_data'는 Streamlit의 데코레이터(Decorator)입니다.
 # Java/Spring 관점:
 # - 이 데코레이터는 Spring의 '@Cacheable' 어노테이션과 매우 유사한 역할을 합니다.
 # - 함수가 동일한 입력 인자(video_id)로 다시 호출될 때, 실제 함수를 실행하지 않고 이전에 계산된 결과를 즉시 반환합니다.
 # - 이를 통해 불필요한 API 호출을 줄여 성능을 향상시킵니다.
+# - 다만 프로세스 메모리에만 저장되므로, 그 아래에 모든 워커가 공유하는 디스크 캐시(TRANSCRIPT_CACHE)를 한 단계 더 둡니다.
+# '@METRICS.timed'는 '@st.cache_data' 아래에 있으므로, 메모리 캐시에 없어서 실제로 실행된 호출만 측정합니다.
 @st.cache_data
-def get_youtube_transcript(video_id):
+@METRICS.timed("get_transcript_snippets")
+def get_transcript_snippets(video_id):
     """
-    유튜브 영상 ID로 스크립트를 가져오는 함수.
-    1. 수동(공식) 영어 자막을 최우선으로 찾습니다.
-    2. 없을 경우, 자동 생성 영어 자막을 찾습니다.
+    유튜브 영상 ID로 자막 조각(snippet) 목록을 가져오는 함수.
+    각 조각은 [텍스트, 시작 시간(초), 길이(초)] 형태이며, 실패하면 None을 반환합니다.
+    디스크 캐시에 있으면 그것을 사용하고, 없으면 YouTube에서 가져와 캐시에 저장합니다.
     """
     try:
-        api = YouTubeTranscriptApi()
-        transcript_list = api.list(video_id)
-
-        manual_english_transcript = None
-        generated_english_transcript = None
-
-        st.info("자막 목록을 검색합니다... (잠시만 기다려주세요)")
-        # 사용 가능한 자막 목록을 순회하며 가장 적합한 자막을 찾습니다.
-        for transcript in transcript_list:
-            if (
-                transcript.language_code.startswith("en")
-                and not transcript.is_generated
-            ):
-                manual_english_transcript = transcript
+        cache_key = transcript_cache_key(video_id)
+        record = TRANSCRIPT_CACHE.get(cache_key)
+
+        if record is None:
+            st.info("자막 목록을 검색합니다... (잠시만 기다려주세요)")
+            record = _load_missing_transcript(video_id, cache_key)
+            if record["is_generated"]:
+                st.info("최종 선택: 자동 생성 자막")
+            else:
                 st.success("✅ 수동(공식) 영어 자막을 찾았습니다!")
-                break  # 가장 좋은 것을 찾았으므로 반복을 중단합니다.
-            elif transcript.language_code.startswith("en"):
-                generated_english_transcript = transcript
-
-        final_transcript = None
-        if manual_english_transcript:
-            st.info("최종 선택: 수동 자막")
-            final_transcript = manual_english_transcript
-        elif generated_english_transcript:
-            st.info("최종 선택: 자동 생성 자막")
-            final_transcript = generated_english_transcript
+                st.info("최종 선택: 수동 자막")
         else:
-            # Java에서 'throw new Exception(...)'과 같이 예외를 발생시킵니다.
-            raise Exception("이 영상에는 영어 자막이 존재하지 않습니다.")
+            st.info("캐시에 저장된 자막을 사용합니다.")
 
-        # 선택된 자막의 전체 텍스트 데이터를 가져옵니다.
-        full_transcript_data = final_transcript.fetch()
-        # 자막 데이터를 하나의 긴 문자열로 합칩니다.
-        # Python의 리스트 컴프리헨션(List Comprehension)으로, Java의 Stream API와 유사합니다.
-        # e.g., 'fullTranscriptData.stream().map(item -> item.getText()).collect(Collectors.joining(" "))'
-        full_transcript = " ".join([item.text for item in full_transcript_data])
-        return full_transcript
+        return record["snippets"]
 
     except Exception as e:
         st.error(f"스크립트를 가져오는 데 실패했습니다: {e}")
         return None
 
 
+@METRICS.timed("get_youtube_transcript")
+def get_youtube_transcript(video_id):
+    """
+    유튜브 영상 ID로 스크립트 전체를 하나의 문자열로 가져오는 함수. 실패하면 None을 반환합니다.
+    긴 영상은 문자열이 매우 커지므로, 문장 단위 처리에는 'get_transcript_snippets'와 'stream_sentences'를 사용하세요.
+    """
+    snippets = get_transcript_snippets(video_id)
+    if snippets is None:
+        return None
+    # 자막 데이터를 하나의 긴 문자열로 합칩니다.
+    # Python의 리스트 컴프리헨션(List Comprehension)으로, Java의 Stream API와 유사합니다.
+    # e.g., 'fullTranscriptData.stream().map(item -> item.getText()).collect(Collectors.joining(" "))'
+    return " ".join([text for text, _, _ in snippets])
+
+
+# 'clean_script'와 'split_into_sentences'는 짧은 입력으로 자주 부를 수 있는 순수 CPU 함수라 호출마다 지표를 기록하지 않습니다.
+# 웹 앱의 문장 처리 시간은 main.py가 영상 하나 단위로 'segment_sentences' 구간으로 기록합니다.
 def clean_script(script):
     """
     정규 표현식을 사용하여 대괄호([])로 묶인 모든 문자열을 제거하고 공백을 정돈합니다.
@@ -80,14 +183,57 @@ def split_into_sentences(script):
     """
     스크립트를 문장 단위로 나눕니다.
 
+    - 문장 부호(.?!) 뒤에 공백이 오는 지점을 기준으로 나누되, 'Mr.'나 'U.S.' 같은 약어 뒤에서는 나누지 않습니다.
+    - 문장 부호가 없어 너무 긴 문장은 최대 단어 수(segmenter.MAX_SENTENCE_WORDS) 단위로 나눕니다.
+    - 분리 규칙은 segmenter.py에 있으며, 'stream_sentences'와 같은 규칙을 사용합니다.
+
     Java/Spring 관점:
-    - 're.split()' 함수는 Java의 'String.split()' 메소드와 유사하지만, 정규 표현식을 사용하여 더 복잡한 구분자로 분리할 수 있습니다.
-    """
-    # 정규 표현식 설명:
-    # '(?<=[.?!])'는 '후방 탐색(lookbehind)' 구문으로, . ? ! 문자가 바로 뒤에 오는 위치를 찾되, 그 문자 자체는 결과에 포함시키지 않습니다.
-    # '\s+'는 하나 이상의 공백 문자를 의미합니다.
-    # 즉, 문장 부호(.?!) 뒤에 공백이 오는 지점을 기준으로 문자열을 나눕니다.
-    sentences = re.split(r"(?<=[.?!])\s+", script)
-    # 리스트 컴프리헨션을 사용하여 분리된 각 문장의 양쪽 공백을 제거하고, 빈 문자열은 리스트에서 제외합니다.
-    # Java Stream: 'Arrays.stream(sentences).map(String::trim).filter(s -> !s.isEmpty()).collect(Collectors.toList())'
-    return [s.strip() for s in sentences if s.strip()]
\ No newline at end of file
+    - Java의 'BreakIterator.getSentenceInstance()'로 문장 경계를 찾는 것과 비슷합니다.
+    """
+    return split_text(script)
+
+
+# --- 스트리밍 문장 처리 ---
+# 아래 코드는 'clean_script' + 'split_into_sentences'와 같은 결과를 만들지만,
+# 전체 스크립트를 하나의 문자열로 합치지 않고 자막 조각을 하나씩 처리하면서 문장이 완성될 때마다 바로 내보냅니다.
+
+
+class Sentence:
+    """
+    문장 하나를 나타내는 가벼운 레코드입니다. 문장의 텍스트와 영상 속 시작/끝 시간(초)을 가집니다.
+
+    Java/Spring 관점:
+    - '__slots__'는 객체마다 속성 딕셔너리(__dict__)를 만들지 않도록 하여 메모리를 줄입니다.
+      필드가 고정된 Java 클래스(또는 record)처럼 동작하며, 문장이 수천 개인 긴 영상에서 효과가 큽니다.
+    """
+
+    __slots__ = ("text", "start", "end")
+
+    def __init__(self, text, start, end):
+        self.text = text
+        self.start = start
+        self.end = end
+
+    def __repr__(self):
+        return f"Sentence({self.text!r}, start={self.start}, end={self.end})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Sentence):
+            return NotImplemented
+        return (self.text, self.start, self.end) == (other.text, other.start, other.end)
+
+
+def stream_sentences(snippets):
+    """
+    자막 조각(텍스트, 시작 시간, 길이)을 하나씩 읽으면서 문장이 완성될 때마다 Sentence를 내보내는 제너레이터입니다.
+
+    - 대괄호([])로 묶인 부분 제거, 공백 정리, 문장 분리를 조각 단위로 점진적으로 수행합니다. (segmenter.segment_transcript)
+    - 문장의 시작 시간은 첫 단어가 있는 조각의 시작, 끝 시간은 마지막 단어가 있는 조각의 끝입니다.
+    - 문장 부호가 없는 자동 생성 자막은 자막 사이의 쉼(pause)과 최대 단어 수를 기준으로 끊습니다.
+
+    Java/Spring 관점:
+    - 'yield'를 사용하는 제너레이터는 Java의 'Iterator'나 지연 평가되는 'Stream'과 같습니다.
+      호출하는 쪽이 다음 값을 요청할 때까지 실행이 멈춰 있으므로, 전체 결과를 메모리에 한꺼번에 만들지 않습니다.
+    """
+    for text, start, end in segment_transcript(snippets):
+        yield Sentence(text, start, end)